@@ -0,0 +1,67 @@
+# ---------------------------------------------------------------------------- +
+#region bench_atomic_write.py
+"""
+Benchmark atomic_write() throughput at each durability level.
+
+Writes many small files with a plain open(), with atomic_write() at
+durability 'none', 'file' and 'full', and with an AtomicWriteGroup group
+commit, with and without syncfs().
+
+    python benchmarks/bench_atomic_write.py [files] [size]
+"""
+#endregion bench_atomic_write.py
+# ---------------------------------------------------------------------------- +
+#region Imports
+# python standard library modules and packages
+import sys, tempfile, time
+from pathlib import Path
+
+# local modules and packages
+import p3_utils as p3u
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region writers
+def plain_write(paths: list[Path], data: bytes) -> None:
+    """Not atomic, a crash can leave a torn file."""
+    for p in paths:
+        with open(p, "wb") as f:
+            f.write(data)
+
+def atomic_writer(durability: str):
+    def write(paths: list[Path], data: bytes) -> None:
+        for p in paths:
+            with p3u.atomic_write(p, "wb", durability=durability,
+                                  verify=False) as f:
+                f.write(data)
+    return write
+
+def group_writer(use_syncfs: bool):
+    def write(paths: list[Path], data: bytes) -> None:
+        with p3u.AtomicWriteGroup("full", use_syncfs=use_syncfs) as group:
+            for p in paths:
+                with p3u.atomic_write(p, "wb", group=group, verify=False) as f:
+                    f.write(data)
+    return write
+#endregion writers
+# ---------------------------------------------------------------------------- +
+#region main()
+def main(files: int = 500, size: int = 4096) -> None:
+    data = b"x" * size
+    print(f"{files} files x {size} bytes")
+    for name, write in (("plain open()", plain_write),
+                        ("atomic 'none'", atomic_writer("none")),
+                        ("atomic 'file'", atomic_writer("file")),
+                        ("atomic 'full'", atomic_writer("full")),
+                        ("group 'full'", group_writer(False)),
+                        ("group syncfs", group_writer(True))):
+        with tempfile.TemporaryDirectory(dir=".") as tmp:
+            paths = [Path(tmp) / f"f{i}.json" for i in range(files)]
+            start = time.perf_counter()
+            write(paths, data)
+            elapsed = time.perf_counter() - start
+        print(f"{name:>14}: {elapsed:8.4f} s, {files / elapsed:10.0f} files/s, "
+              f"{files * size / elapsed / 2**20:8.1f} MiB/s")
+#endregion main()
+# ---------------------------------------------------------------------------- +
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,60 @@
+# ---------------------------------------------------------------------------- +
+#region bench_copy_backup.py
+"""
+Benchmark copy_backup() versioning in a folder with many existing versions.
+
+Compares the index-driven copy_backup() with the former approach of probing
+'<stem>_v1', '<stem>_v2', ... with Path.exists() until a free name is found.
+
+    python benchmarks/bench_copy_backup.py [versions] [files]
+"""
+#endregion bench_copy_backup.py
+# ---------------------------------------------------------------------------- +
+#region Imports
+# python standard library modules and packages
+import shutil, sys, tempfile, time
+from pathlib import Path
+
+# local modules and packages
+import p3_utils as p3u
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region probe_copy_backup()
+def probe_copy_backup(src_path: Path, dst_folder: Path) -> list[Path]:
+    """The former copy_backup() versioning, one exists() call per version."""
+    copied_paths = []
+    matched_files = list(src_path.parent.glob(src_path.name))
+    for file in matched_files:
+        version = 1
+        while True:
+            dst_path = dst_folder / f"{file.stem}_v{version}{file.suffix}"
+            if not dst_path.exists():
+                break
+            version += 1
+        shutil.copy2(file, dst_path)
+        copied_paths.append(dst_path)
+    return copied_paths
+#endregion probe_copy_backup()
+# ---------------------------------------------------------------------------- +
+#region main()
+def main(versions: int = 10_000, files: int = 10) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        src_folder, dst_folder = root / "src", root / "backup"
+        src_folder.mkdir()
+        dst_folder.mkdir()
+        for i in range(files):
+            (src_folder / f"data{i}.csv").write_text("a,b\n1,2\n")
+            for v in range(1, versions + 1):
+                (dst_folder / f"data{i}_v{v}.csv").touch()
+        print(f"{files} files x {versions} existing versions")
+        for name, func in (("exists() probing", probe_copy_backup),
+                           ("scandir index", p3u.copy_backup)):
+            start = time.perf_counter()
+            copied = func(src_folder / "*.csv", dst_folder)
+            elapsed = time.perf_counter() - start
+            print(f"{name:>18}: {elapsed:8.4f} s for {len(copied)} copies")
+#endregion main()
+# ---------------------------------------------------------------------------- +
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,74 @@
+# ---------------------------------------------------------------------------- +
+#region bench_csv_columns.py
+"""
+Benchmark reading 2 of 12 columns of a large csv file.
+
+Compares csv.reader parsing every full row with read_csv_columns(), in one
+process and in parallel processes, returning lists or NumPy arrays.
+
+    python benchmarks/bench_csv_columns.py [megabytes]
+"""
+#endregion bench_csv_columns.py
+# ---------------------------------------------------------------------------- +
+#region Imports
+# python standard library modules and packages
+import csv, os, sys, tempfile, time
+from pathlib import Path
+
+# local modules and packages
+import p3_utils as p3u
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region make_csv_file()
+def make_csv_file(path: Path, megabytes: int) -> int:
+    """Write about megabytes MB of csv rows, some quoted, return the row count."""
+    rows = 0
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([f"col{i}" for i in range(12)])
+        while f.tell() < megabytes * 2**20:
+            for i in range(rows, rows + 10_000):
+                writer.writerow([i, f"name {i}", i * 0.25, "a,b" if i % 50 == 0
+                                 else "plain", 2024, "x" * 12, i % 7, "note",
+                                 -i, 3.14159, "tail", i])
+            rows += 10_000
+    return rows
+#endregion make_csv_file()
+# ---------------------------------------------------------------------------- +
+#region methods
+def csv_reader_full_rows(path: Path) -> dict:
+    ids, amounts = [], []
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        next(reader)
+        for row in reader:
+            ids.append(row[0])
+            amounts.append(float(row[2]))
+    return {"col0": ids, "col2": amounts}
+
+def columns(workers: int, as_numpy: bool = False):
+    def read(path: Path) -> dict:
+        return p3u.read_csv_columns(path, ["col0", "col2"], dtypes={"col2": float},
+                                    workers=workers, as_numpy=as_numpy)
+    return read
+#endregion methods
+# ---------------------------------------------------------------------------- +
+#region main()
+def main(megabytes: int = 500) -> None:
+    cpus = os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "data.csv"
+        rows = make_csv_file(path, megabytes)
+        print(f"{path.stat().st_size / 2**20:.0f} MiB, {rows} rows, {cpus} cpus")
+        for name, read in (("csv.reader full rows", csv_reader_full_rows),
+                           ("read_csv_columns 1", columns(1)),
+                           (f"read_csv_columns {cpus}", columns(cpus)),
+                           (f"numpy {cpus}", columns(cpus, as_numpy=True))):
+            start = time.perf_counter()
+            result = read(path)
+            elapsed = time.perf_counter() - start
+            print(f"{name:>22}: {elapsed:8.3f} s, {len(result['col0'])} rows")
+#endregion main()
+# ---------------------------------------------------------------------------- +
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
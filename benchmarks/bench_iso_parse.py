@@ -0,0 +1,59 @@
+# ---------------------------------------------------------------------------- +
+#region bench_iso_parse.py
+"""
+Benchmark the per-call cost of the ISO timestamp helpers.
+
+Compares the former calculate_duration(), which validated each timestamp
+with fromisoformat() and then parsed it again, with the current one, which
+parses once through _parse_iso(), with and without the parse cache. The
+timestamps repeat, as in a log, drawn from a pool of distinct values.
+
+    python benchmarks/bench_iso_parse.py [calls] [distinct]
+"""
+#endregion bench_iso_parse.py
+# ---------------------------------------------------------------------------- +
+#region Imports
+# python standard library modules and packages
+import datetime, random, sys, time
+
+# local modules and packages
+import p3_utils as p3u
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region methods
+def former_calculate_duration(start: str, stop: str) -> float:
+    """The former way, each timestamp parsed twice."""
+    for value in (start, stop):
+        if not isinstance(value, str):
+            raise TypeError("start, stop must both be type:str")
+        if len(value) < len("2023-10-01T12:00:00"):
+            raise ValueError(f"Requires valid ISO format timestamp, not '{value}'")
+        datetime.datetime.fromisoformat(value)
+    start_dt = datetime.datetime.fromisoformat(start)
+    stop_dt = datetime.datetime.fromisoformat(stop)
+    return (stop_dt - start_dt).total_seconds() / 3600.0
+#endregion methods
+# ---------------------------------------------------------------------------- +
+#region main()
+def main(calls: int = 200_000, distinct: int = 500) -> None:
+    base = datetime.datetime(2025, 1, 20, 13, 0, 0)
+    pool = [(base + datetime.timedelta(seconds=7 * i)).isoformat()
+            for i in range(distinct)]
+    rnd = random.Random(1)
+    pairs = [(rnd.choice(pool), rnd.choice(pool)) for _ in range(calls)]
+    print(f"{calls} calls, {distinct} distinct timestamps")
+    for name, cache, fn in (("former", 0, former_calculate_duration),
+                            ("parse once", 0, p3u.calculate_duration),
+                            ("parse once, cached", p3u.ISO_PARSE_CACHE_SIZE,
+                             p3u.calculate_duration)):
+        p3u.set_iso_parse_cache(cache)
+        start = time.perf_counter()
+        for a, b in pairs:
+            fn(a, b)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>20}: {elapsed / calls * 1e9:8.0f} ns/call")
+    p3u.set_iso_parse_cache(0)
+#endregion main()
+# ---------------------------------------------------------------------------- +
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,60 @@
+# ---------------------------------------------------------------------------- +
+#region bench_join_within.py
+"""
+Benchmark matching the events of two sources within a tolerance.
+
+Compares iso_date_approx() over every pair of events, on a small sample as
+it is O(n * m), with the merge-join of join_within() over sorted streams
+and join_within_batch() over unsorted columns.
+
+    python benchmarks/bench_join_within.py [events] [sample]
+"""
+#endregion bench_join_within.py
+# ---------------------------------------------------------------------------- +
+#region Imports
+# python standard library modules and packages
+import datetime, random, sys, time
+
+# local modules and packages
+import p3_utils as p3u
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region methods
+def pairwise(left: list, right: list) -> int:
+    """The former way, iso_date_approx() for each pair."""
+    return sum(1 for a in left for b in right if p3u.iso_date_approx(a, b, 1))
+
+def streamed(left: list, right: list) -> int:
+    return sum(1 for _ in p3u.join_within(iter(left), iter(right), 1))
+
+def batch(left: list, right: list) -> int:
+    rnd = random.Random(2)
+    left, right = rnd.sample(left, len(left)), rnd.sample(right, len(right))
+    return len(p3u.join_within_batch(left, right, 1, as_numpy=True)[0])
+#endregion methods
+# ---------------------------------------------------------------------------- +
+#region main()
+def events(count: int, seed: int) -> list[str]:
+    """Sorted timestamps about 5 seconds apart."""
+    rnd, t = random.Random(seed), datetime.datetime(2025, 1, 20, 13, 0, 0)
+    values = []
+    for _ in range(count):
+        t += datetime.timedelta(microseconds=rnd.randint(0, 10**7))
+        values.append(t.isoformat())
+    return values
+
+def main(count: int = 200_000, sample: int = 1_000) -> None:
+    left, right = events(count, 1), events(count, 2)
+    print(f"{count} events per source, pairwise on {sample}")
+    for name, fn, n in (("iso_date_approx pairs", pairwise, sample),
+                        ("join_within", streamed, count),
+                        ("join_within_batch", batch, count)):
+        start = time.perf_counter()
+        matches = fn(left[:n], right[:n])
+        elapsed = time.perf_counter() - start
+        print(f"{name:>22}: {elapsed:8.3f} s, {n} events, {matches} matches, "
+              f"{elapsed / n * 1e6:8.2f} us/event")
+#endregion main()
+# ---------------------------------------------------------------------------- +
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,83 @@
+# ---------------------------------------------------------------------------- +
+#region bench_jsonc.py
+"""
+Benchmark JSONC parsing of a large file.
+
+Compares the former approach, a regex stripping comments from the whole
+text before json.loads(), with load_jsonc() and with streaming the records
+through load_records(). Each method runs in its own process, so the peak
+memory (max RSS) of each is reported.
+
+    python benchmarks/bench_jsonc.py [megabytes]
+"""
+#endregion bench_jsonc.py
+# ---------------------------------------------------------------------------- +
+#region Imports
+# python standard library modules and packages
+import json, re, resource, subprocess, sys, tempfile, time
+from pathlib import Path
+
+# local modules and packages
+import p3_utils as p3u
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region methods
+_COMMENTS = re.compile(r'("(?:\\.|[^"\\])*")|//[^\n]*|/\*.*?\*/', re.S)
+_TRAILING = re.compile(r'("(?:\\.|[^"\\])*")|,(\s*[\]}])')
+
+def regex_loads(path: Path) -> int:
+    """The former way, the whole text in memory, twice."""
+    text = path.read_text()
+    text = _COMMENTS.sub(lambda m: m.group(1) or "", text)
+    text = _TRAILING.sub(lambda m: m.group(1) or m.group(2), text)
+    return len(json.loads(text))
+
+def load_jsonc(path: Path) -> int:
+    return len(p3u.load_jsonc(path))
+
+def load_records(path: Path) -> int:
+    return sum(len(batch) for batch in p3u.load_records(path))
+
+METHODS = {"regex + json.loads": regex_loads, "load_jsonc": load_jsonc,
+           "load_records": load_records}
+#endregion methods
+# ---------------------------------------------------------------------------- +
+#region make_jsonc_file()
+def make_jsonc_file(path: Path, megabytes: int) -> int:
+    """Write about megabytes MB of JSONC records, return the record count."""
+    count = 0
+    with open(path, "w") as f:
+        f.write("// generated records\n[\n")
+        while f.tell() < megabytes * 2**20:
+            record = {"id": count, "name": f"item-{count}", "path": "a//b/*c*/",
+                      "values": [count * 0.5, -count, 1e-3], "ok": count % 2 == 0}
+            f.write(f"  {json.dumps(record)}, /* record {count} */\n")
+            count += 1
+        f.write("]\n")
+    return count
+#endregion make_jsonc_file()
+# ---------------------------------------------------------------------------- +
+#region main()
+def run_one(name: str, path: Path) -> None:
+    start = time.perf_counter()
+    count = METHODS[name](path)
+    elapsed = time.perf_counter() - start
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+    print(f"{name:>20}: {elapsed:8.3f} s, {count} records, max RSS {rss:8.1f} MiB")
+
+def main(megabytes: int = 100) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "data.jsonc"
+        count = make_jsonc_file(path, megabytes)
+        size = path.stat().st_size / 2**20
+        print(f"{size:.1f} MiB, {count} records")
+        for name in METHODS:
+            subprocess.run([sys.executable, __file__, "--run", name, str(path)],
+                           check=True)
+#endregion main()
+# ---------------------------------------------------------------------------- +
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--run"]:
+        run_one(sys.argv[2], Path(sys.argv[3]))
+    else:
+        main(*(int(a) for a in sys.argv[1:2]))
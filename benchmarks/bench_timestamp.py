@@ -0,0 +1,50 @@
+# ---------------------------------------------------------------------------- +
+#region bench_timestamp.py
+"""
+Benchmark a chain of timestamp arithmetic, as str and as Timestamp.
+
+Steps a timestamp forward by 15 minutes many times, with increase_time()
+on ISO strs, and with Timestamp + TimeSpan formatted once at the end.
+
+    python benchmarks/bench_timestamp.py [steps]
+"""
+#endregion bench_timestamp.py
+# ---------------------------------------------------------------------------- +
+#region Imports
+# python standard library modules and packages
+import sys, time
+
+# local modules and packages
+import p3_utils as p3u
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region methods
+def str_chain(start: str, steps: int) -> str:
+    t = start
+    for _ in range(steps):
+        t = p3u.increase_time(t, minutes=15)
+    return t
+
+def timestamp_chain(start: str, steps: int) -> str:
+    t, step = p3u.Timestamp(start), p3u.TimeSpan(minutes=15)
+    for _ in range(steps):
+        t = t + step
+    return str(t)
+#endregion methods
+# ---------------------------------------------------------------------------- +
+#region main()
+def main(steps: int = 200_000) -> None:
+    start = "2025-01-20T13:00:00"
+    print(f"{steps} steps")
+    results = set()
+    for name, chain in (("increase_time()", str_chain),
+                        ("Timestamp + TimeSpan", timestamp_chain)):
+        begin = time.perf_counter()
+        results.add(chain(start, steps))
+        elapsed = time.perf_counter() - begin
+        print(f"{name:>22}: {elapsed / steps * 1e9:8.0f} ns/step")
+    assert len(results) == 1, results
+#endregion main()
+# ---------------------------------------------------------------------------- +
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -5,6 +5,11 @@ Modules:
 - p3_print_output_utils: Functions for logging and output formatting.
 - p3_common_utils: General-purpose utility functions.
 - p3_excel_utils: Functions for working with Excel files.
+- p3_fault_points: Named fault-injection points for testing error handling.
+- p3_stat_cache: Short-lived stat() cache shared by the file helpers.
+- p3_folder_index: Persistent folder name index for repeated find_folder() lookups.
+- p3_loaders: Streaming record loaders for the file types verify_file_path_for_load() accepts.
+- p3_content_cache: Cache of parsed file contents for repeated loads.
 - p3_helper_utils: Helper functions for various tasks, including date handling, parameter validation, and environment info.
 - p3_utils: Main module that imports and exposes all utility functions and classes.
 
@@ -20,12 +25,64 @@ from .p3_app_timing import (
     APP_START_TIME
 )
 from .p3_file_helpers import (
+    BackupResult,
+    backup_files,
     copy_backup,
+    restore_backup,
     find_folder,
+    FIND_FOLDER_EXCLUDES,
     is_file_locked,
+    are_files_locked,
+    wait_until_unlocked,
+    async_wait_until_unlocked,
+    FolderEvent,
+    FolderWatcher,
+    ATOMIC_WRITE_DURABILITY,
+    AtomicWriteGroup,
+    atomic_write,
+    read_csv_columns,
     is_filename_only, 
     is_valid_path
 ) 
+from .p3_loaders import (
+    LOAD_BATCH_SIZE,
+    load_records,
+    iter_json_values,
+    strip_jsonc_comments,
+    JsoncStripper,
+    load_jsonc
+)
+from .p3_content_cache import (
+    CONTENT_CACHE_MAX_BYTES,
+    ContentCache,
+    load_cached,
+    content_cache_stats
+)
+from .p3_stat_cache import (
+    STAT_CACHE_TTL,
+    stat_cache_scope,
+    cached_stat,
+    path_exists,
+    path_is_file,
+    path_is_dir,
+    invalidate_stat,
+    stat_cache_stats
+)
+from .p3_folder_index import (
+    FolderIndex,
+    FOLDER_INDEX_MAX_AGE
+)
+from .p3_fault_points import (
+    P3_FAULTS_ENV_VAR,
+    FaultSpec,
+    arm_fault,
+    disarm_fault,
+    armed_faults,
+    exception_class,
+    fault_point,
+    fault_injection,
+    load_faults_from_env
+)
 from .p3_print_output_utils import (
     get_print_output, 
     set_print_output, 
@@ -42,7 +99,11 @@ from .p3_print_output_utils import (
 from .p3_common_utils import (
     FORCE_EXCEPTION,
     FORCE_EXCEPTION_MSG,
+    EXC_CHAIN_MAX_DEPTH,
+    EXC_CHAIN_MAX_CHARS,
+    ExcFrame,
     append_cause, 
+    walk_exception_chain,
     force_exception, 
     t_of, 
     v_of, 
@@ -72,15 +133,35 @@ from .p3_helper_utils import (
     validate_iso_date_string,
     now_iso_date,
     now_iso_date_string,
+    COARSE_CLOCK_GRANULARITY,
+    set_coarse_clock,
     iso_date_approx,
+    ISO_PARSE_CACHE_SIZE,
+    set_iso_parse_cache,
+    iso_parse_cache_info,
     to_int,
     to_float,
+    # Batch ISO 8601 helpers
+    ISO_BATCH_BLOCK,
+    IsoBatch,
+    iso_dates,
+    iso_strings,
+    # Timestamp and TimeSpan classes
+    Timestamp,
+    TimeSpan,
+    # IntervalIndex class
+    INTERVAL_INDEX_BUFFER,
+    IntervalIndex,
+    # join_within() merge-join of timestamp series
+    join_within,
+    join_within_batch,
     # Timestamp helper functions
     validate_start,
     validate_stop,
     increase_time,
     decrease_time,
     calculate_duration,
+    calculate_durations,
     default_duration,
     default_start_time,
     default_stop_time,
@@ -107,6 +188,11 @@ from .p3_helper_utils import (
     verify_url_file_path,
     verify_file_path_for_load,
     verify_file_path_for_save,
+    LOAD_FILE_SUFFIXES,
+    SAVE_FILE_SUFFIXES,
+    PathVerifyReport,
+    verify_file_paths_for_load,
+    verify_file_paths_for_save,
     file_uri_to_path,
     path_to_file_uri,
     # ptid functions 
@@ -141,11 +227,58 @@ __all__ = [
     "elapsed_timer_str",
     "APP_START_TIME",
     # p3_file_helpers
+    "BackupResult",
+    "backup_files",
     "copy_backup",
+    "restore_backup",
     "find_folder",
+    "FIND_FOLDER_EXCLUDES",
     "is_file_locked",
+    "are_files_locked",
+    "wait_until_unlocked",
+    "async_wait_until_unlocked",
+    "FolderEvent",
+    "FolderWatcher",
+    "ATOMIC_WRITE_DURABILITY",
+    "AtomicWriteGroup",
+    "atomic_write",
+    "read_csv_columns",
     "is_filename_only",
     "is_valid_path",
+    # p3_loaders
+    "LOAD_BATCH_SIZE",
+    "load_records",
+    "iter_json_values",
+    "strip_jsonc_comments",
+    "JsoncStripper",
+    "load_jsonc",
+    # p3_content_cache
+    "CONTENT_CACHE_MAX_BYTES",
+    "ContentCache",
+    "load_cached",
+    "content_cache_stats",
+    # p3_stat_cache
+    "STAT_CACHE_TTL",
+    "stat_cache_scope",
+    "cached_stat",
+    "path_exists",
+    "path_is_file",
+    "path_is_dir",
+    "invalidate_stat",
+    "stat_cache_stats",
+    # p3_folder_index
+    "FolderIndex",
+    "FOLDER_INDEX_MAX_AGE",
+    # p3_fault_points
+    "P3_FAULTS_ENV_VAR",
+    "FaultSpec",
+    "arm_fault",
+    "disarm_fault",
+    "armed_faults",
+    "exception_class",
+    "fault_point",
+    "fault_injection",
+    "load_faults_from_env",
     # p3_print_output_utils
     "get_print_output",
     "set_print_output",
@@ -161,7 +294,11 @@ __all__ = [
     # p3_common_utils
     FORCE_EXCEPTION,
     FORCE_EXCEPTION_MSG,
+    "EXC_CHAIN_MAX_DEPTH",
+    "EXC_CHAIN_MAX_CHARS",
+    "ExcFrame",
     "append_cause",
+    "walk_exception_chain",
     "force_exception",
     "t_of",
     "v_of",
@@ -190,15 +327,35 @@ __all__ = [
     "validate_iso_date_string",
     "now_iso_date",
     "now_iso_date_string",
+    "COARSE_CLOCK_GRANULARITY",
+    "set_coarse_clock",
     "iso_date_approx",
+    "ISO_PARSE_CACHE_SIZE",
+    "set_iso_parse_cache",
+    "iso_parse_cache_info",
     "to_int",
     "to_float",
+    # p3_helper_utils - Batch ISO 8601 helpers
+    "ISO_BATCH_BLOCK",
+    "IsoBatch",
+    "iso_dates",
+    "iso_strings",
+    # p3_helper_utils - Timestamp and TimeSpan classes
+    "Timestamp",
+    "TimeSpan",
+    # p3_helper_utils - IntervalIndex class
+    "INTERVAL_INDEX_BUFFER",
+    "IntervalIndex",
+    # p3_helper_utils - join_within() merge-join of timestamp series
+    "join_within",
+    "join_within_batch",
     # p3_helper_utils - Timestamp helper functions
     "validate_start",
     "validate_stop",
     "increase_time",
     "decrease_time",
     "calculate_duration",
+    "calculate_durations",
     "default_duration",
     "default_start_time",
     "default_stop_time",
@@ -224,6 +381,12 @@ __all__ = [
     # p3_helper_utils - uri parsing functions
     "verify_url_file_path",
     "verify_file_path_for_load",
+    "verify_file_path_for_save",
+    "LOAD_FILE_SUFFIXES",
+    "SAVE_FILE_SUFFIXES",
+    "PathVerifyReport",
+    "verify_file_paths_for_load",
+    "verify_file_paths_for_save",
     "file_uri_to_path",
     "path_to_file_uri",
     # p3_helper_utils - ptid functions
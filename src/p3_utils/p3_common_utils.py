@@ -5,11 +5,14 @@
 
     is_filename_only() - Check if a path is a filename only, no parent folders.
     append_cause() - Append the cause chain of an exception to the message.
+    walk_exception_chain() - Return the exception chain as ExcFrame tuples.
     fpfx() - Return a prefix for the function name and its module.
     force_exception() - Force an exception to test exception handling.
     t_of() - Return the type of an object as a string.
     v_of() - Return the value of an object as a string.
     check_testcase() - Raise test case exception if var = p3l.FORCE_EXCEPTION.
+    force_exception() and check_testcase() fire one-shot fault points, see
+    p3_fault_points for named fault injection in production code.
     is_file_locked() - Check if a file is locked by another process.
 
     Explanation:
@@ -31,43 +34,111 @@
 # Standard Module Libraries
 import shutil, hashlib, sys, uuid
 from pathlib import Path
-from typing import Callable as function, Union
+from typing import Callable as function, NamedTuple, Union
 import importlib.util
 import types
 
 # Local Modules
 from .p3_print_output_utils import *
+from .p3_fault_points import fault_point, exception_class
 
 #endregion Imports
 # ---------------------------------------------------------------------------- +
 #region Globals and Constants
 FORCE_EXCEPTION = "force_exception"
 FORCE_EXCEPTION_MSG = "Forced exception for testing purposes."
+EXC_CHAIN_MAX_DEPTH = 32    # Max exceptions visited by walk_exception_chain()
+EXC_CHAIN_MAX_CHARS = 4096  # Max length of the append_cause() result
 #endregion Globals and Constants
 # ---------------------------------------------------------------------------- +
+#region walk_exception_chain(e:BaseException, ...) -> list[ExcFrame]
+class ExcFrame(NamedTuple):
+    """p3_utils: One exception in a walked exception chain."""
+    level: int          # 0 for the exception passed in, +1 per hop
+    relation: str       # 'root', 'cause', 'context' or 'group'
+    type: str           # exception class name
+    message: str        # str(exception), truncated to max_msg characters
+    filename: str       # file name where raised, "" if no traceback
+    lineno: int         # line number where raised, 0 if no traceback
+    function: str       # function name where raised, "" if no traceback
+
+def walk_exception_chain(e:BaseException, max_depth:int=EXC_CHAIN_MAX_DEPTH,
+                         max_msg:int=200) -> list[ExcFrame]:
+    """p3_utils: Walk __cause__/__context__ and ExceptionGroup members of e.
+
+    Each exception is visited once, so cycles in the chain are safe. The walk
+    stops after max_depth exceptions. Messages are cut to max_msg characters.
+
+    Returns:
+        list[ExcFrame]: The exceptions in depth-first order, e first.
+    """
+    frames : list[ExcFrame] = []
+    if not isinstance(e, BaseException):
+        return frames
+    seen : set[int] = set()
+    stack : list[tuple[BaseException, int, str]] = [(e, 0, "root")]
+    while stack and len(frames) < max_depth:
+        exc, level, relation = stack.pop()
+        if id(exc) in seen:
+            continue
+        seen.add(id(exc))
+        e_str = str(exc)
+        if len(e_str) > max_msg:
+            e_str = first_n(e_str, n=max_msg)
+        filename, lineno, function_name = "", 0, ""
+        tb = exc.__traceback__
+        if tb is not None:
+            while tb.tb_next is not None:
+                tb = tb.tb_next
+            code = tb.tb_frame.f_code
+            filename = Path(code.co_filename).name
+            lineno, function_name = tb.tb_lineno, code.co_name
+        frames.append(ExcFrame(level, relation, type(exc).__name__, e_str,
+                               filename, lineno, function_name))
+        # Push in reverse of the order to visit: group members, cause, context
+        nxt = exc.__cause__ or (None if exc.__suppress_context__
+                                else exc.__context__)
+        if nxt is not None:
+            relation = "cause" if exc.__cause__ is not None else "context"
+            stack.append((nxt, level + 1, relation))
+        if isinstance(exc, BaseExceptionGroup):
+            for sub in reversed(exc.exceptions):
+                stack.append((sub, level + 1, "group"))
+    return frames
+#endregion walk_exception_chain(e:BaseException, ...) -> list[ExcFrame]
+# ---------------------------------------------------------------------------- +
 #region append_cause(msg:str = None, e:Exception=None, depth:int=0) -> str
-def append_cause(msg:str = None, e:Exception=None, depth:int=0) -> str:
-    """p3_utils: Trace and exception chain appending the causes """
-    # If the exception has a cause, append the chain up to depth
-    exc = e
-    msg = ""
-    t1 = t2 = True
-    while t1 or t2:
-        msg += f"Exception({depth}): {str(exc)}"
-        msg += f" >>> " if depth > 0 else ""
-        t1 = exc.__cause__ is not None and exc != exc.__cause__ 
-        t2 = exc.__context__ is not None and exc != exc.__context__
-        exc = exc.__cause__ or exc.__context__
-        depth -= 1 if depth > 0 else 0
-    return msg 
+def append_cause(msg:str = None, e:Exception=None, depth:int=0,
+                 max_chars:int=EXC_CHAIN_MAX_CHARS) -> str:
+    """p3_utils: Trace and exception chain appending the causes 
+
+    Walks at most depth + 1 exceptions, or EXC_CHAIN_MAX_DEPTH if depth is 0,
+    and returns no more than about max_chars characters.
+    """
+    max_depth = depth + 1 if depth > 0 else EXC_CHAIN_MAX_DEPTH
+    parts : list[str] = []
+    size = 0
+    for i, frame in enumerate(walk_exception_chain(e, max_depth)):
+        part = f"Exception({max(depth - i, 0)}): {frame.message}"
+        size += len(part) + 5
+        if size > max_chars:
+            parts.append("...<truncated>")
+            break
+        parts.append(part)
+    return " >>> ".join(parts)
 #endregion append_cause(msg:str = None, e:Exception=None, depth:int=0) -> str
 # ---------------------------------------------------------------------------- +
 #region force_exception(func, e:Exception=None
 def force_exception(func, e:Exception=None) -> str:
-    """p3_utils: Raise exception e from func as caller, default ZeroDivisionError. """
+    """p3_utils: Raise exception e from func as caller, default ZeroDivisionError. 
+
+    Passes the fault point 'force_exception.<func name>' first, so a fault
+    armed there fires instead, then raises e.
+    """
     func = force_exception if func is None else func
     dm = f"testcase: Default Exception Test for func:{func.__name__}()"
     e = ZeroDivisionError(dm) if e is None else e
+    fault_point(f"force_exception.{func.__name__}")
     raise e
 #endregion fpfx(func, e:Exception=None
 # ---------------------------------------------------------------------------- +
@@ -101,7 +172,7 @@ def check_testcase(func, var : str, exc : str = "ZeroDivisionError") -> str:
     Args:
         func (function): The function calling for the check.
         var (str): The variable to be checked as equal to prl.FORCE_EXCEPTION.
-        exc (str): The exception class name to be raised.
+        exc (str): The exception class name, or class, to be raised.
 
     Returns:
         str: A short string explaining why no exception was raised.
@@ -110,30 +181,27 @@ def check_testcase(func, var : str, exc : str = "ZeroDivisionError") -> str:
         Exception: of the class name passed in the exc argument
 
     """
-    # Validate input
-    if var is None or not isinstance(var, str) or len(var.strip()) == 0:
-        return F"param 'var' is not a non-empty string {v_of(var)}."
+    # Fast path, the common case in production code is not a test case.
     if var != FORCE_EXCEPTION:
+        if var is None or not isinstance(var, str) or len(var.strip()) == 0:
+            return F"param 'var' is not a non-empty string {v_of(var)}."
         return F"param 'var' is not equal to p3l.FORCE_EXCEPTION {v_of(var)}."
-    if exc is None or not isinstance(var, str) or len(var.strip()) == 0:
+    if exc is None or not isinstance(exc, (str, type)) or \
+        (isinstance(exc, str) and len(exc.strip()) == 0):
         return F"param 'exc' is not a non-empty string {v_of(exc)}."
+    try:
+        exc_class = exception_class(exc)
+    except TypeError:
+        return f"param 'exc' {v_of(exc)} is not a valid exception class name."
     func_valid = True if func is not None and isinstance(func, function) else False
     func_name = func.__name__ if func_valid else "unknownFunction"
+    dm = f"testcase: {exc_class.__name__} Exception Test for func:{func_name}()"
     try:
-        import builtins
-        try:
-            exc_class = getattr(builtins,exc)
-            if exc_class is None or not isinstance(exc_class, type):
-                return f"param 'exc' {v_of(exc)} is not a valid exception class name."
-            dm = f"testcase: {exc} Exception Test for func:{func_name}()"
-            te = exc_class(dm)
-            raise te
-        except AttributeError as e:
-            return f"param 'exc' {v_of(exc)} error retrieving from builtins: str{e}."
+        te = exc_class(dm)
     except Exception as e:
-        if e == te:
-            raise e
-        return f"Error creating {exc}(), msg = '{str(e)}'"
+        return f"Error creating {exc_class.__name__}(), msg = '{str(e)}'"
+    fault_point(f"check_testcase.{func_name}")  # a fault armed here fires first
+    raise te
 #endregion check_testcase(func, var : str, exc : str = "ZeroDivisionError") -> str
 # ---------------------------------------------------------------------------- +
 #region gen_hash_key(text: str, length:int=12) -> str
@@ -0,0 +1,264 @@
+# ---------------------------------------------------------------------------- +
+#region p3_content_cache.py
+""" Cache of parsed file contents, for inputs loaded again and again.
+
+    ContentCache - LRU cache of parsed files in a memory budget, optionally
+        shared between processes through pickles on disk.
+    load_cached() - Load a file through the default ContentCache.
+    content_cache_stats() - Counters of the default ContentCache.
+
+    Explanation:
+    ------------
+    A cached file is verified with verify_file_path_for_load() and parsed
+    by a loader, by default by its suffix: json.load() for .json,
+    load_jsonc() for .jsonc, tomllib for .toml, the text of a .txt file,
+    and the list of records of load_records() for .csv, .xlsx and .xls.
+
+    An entry is valid while the file's (size, mtime_ns, inode) signature is
+    unchanged, checked by one stat() per load. Entries are kept in least
+    recently used order, and evicted when the estimated size of all values
+    passes max_bytes.
+
+    Contents are cached per loader: per loader object, or per loader_key
+    naming what the loader does. With a disk_dir, each file parsed by the
+    default loader or a loader_key is also pickled there, named by
+    gen_hash_key() of its path and loader, so other processes load the
+    pickle instead of parsing the file again. Pickles are trusted when loaded, so disk_dir
+    must only be writable by the user.
+
+    Cached values are shared by all callers, treat them as read-only.
+"""
+#endregion p3_content_cache.py
+# ---------------------------------------------------------------------------- +
+#region Imports
+# python standard library modules and packages
+import json, os, pickle, sys, threading, tomllib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+# local modules and packages
+from .p3_common_utils import gen_hash_key
+from .p3_helper_utils import verify_file_path_for_load
+from .p3_file_helpers import atomic_write
+from .p3_loaders import load_jsonc, load_records
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals and Constants
+CONTENT_CACHE_MAX_BYTES = 256 * 2**20  # default memory budget of the values
+#endregion Globals and Constants
+# ---------------------------------------------------------------------------- +
+#region loaders and sizes
+def _load_content(file_path: Path) -> Any:
+    """p3_utils: Parse file_path by its suffix."""
+    suffix = file_path.suffix
+    if suffix == ".json":
+        with open(file_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    if suffix == ".jsonc":
+        return load_jsonc(file_path)
+    if suffix == ".toml":
+        with open(file_path, "rb") as f:
+            return tomllib.load(f)
+    if suffix == ".txt":
+        return file_path.read_text(encoding="utf-8")
+    return [record for batch in load_records(file_path) for record in batch]
+
+def _deep_sizeof(value: Any) -> int:
+    """p3_utils: Estimate the bytes of value and the containers in it."""
+    size, seen, stack = 0, set(), [value]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+    return size
+
+def _signature(st: os.stat_result) -> tuple[int, int, int]:
+    return (st.st_size, st.st_mtime_ns, st.st_ino)
+#endregion loaders and sizes
+# ---------------------------------------------------------------------------- +
+#region ContentCache class
+class ContentCache:
+    """p3_utils: LRU cache of parsed file contents in a memory budget.
+
+    Args:
+        max_bytes (int): Budget of the estimated size of all cached values.
+            A value larger than the budget is not kept in memory.
+        disk_dir (Path|str): Folder of pickled contents shared between
+            processes, None for a memory-only cache.
+        sizeof (Callable): Estimate of a value's size in bytes, default a
+            walk of its dicts, lists, tuples and sets.
+    """
+    def __init__(self, max_bytes: int = CONTENT_CACHE_MAX_BYTES,
+                 disk_dir: Union[Path, str, None] = None,
+                 sizeof: Optional[Callable[[Any], int]] = None) -> None:
+        if not isinstance(max_bytes, int) or max_bytes < 0:
+            raise ValueError(f"max_bytes must be an int >= 0, not '{max_bytes}'")
+        self.max_bytes = max_bytes
+        self.disk_dir = None if disk_dir is None else Path(disk_dir)
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.sizeof = sizeof or _deep_sizeof
+        # (path, loader_key or loader) -> (signature, size, value)
+        self._entries : OrderedDict[tuple[str, Any], tuple] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = self._disk_hits = self._misses = self._evictions = 0
+
+    def load(self, file_path: Union[Path, str],
+             loader: Optional[Callable[[Path], Any]] = None,
+             loader_key: Optional[str] = None) -> Any:
+        """p3_utils: Return the parsed contents of file_path, cached.
+
+        Args:
+            file_path (Path|str): A file verify_file_path_for_load() accepts.
+            loader (Callable): Parses a Path, default by its suffix. Contents
+                are cached per loader object, so pass the same object each
+                time, not a new lambda or partial.
+            loader_key (str): Names what loader does, to cache its contents
+                by name instead, also in disk_dir. Loaders given the same
+                loader_key must return the same contents.
+
+        Raises:
+            TypeError: If loader_key is not a str.
+            As verify_file_path_for_load() and the loader.
+        """
+        if loader_key is not None and not isinstance(loader_key, str):
+            raise TypeError(f"loader_key must be a str, not "
+                            f"'{type(loader_key).__name__}'")
+        file_path = Path(file_path)
+        verify_file_path_for_load(file_path)
+        if loader is None:
+            loader = _load_content
+            loader_key = loader_key or f"{__name__}._load_content"
+        # Without a loader_key, only the loader object itself tells loaders
+        # apart, and it means nothing to another process: memory only.
+        key = (os.path.abspath(file_path),
+               loader if loader_key is None else loader_key)
+        signature = _signature(os.stat(file_path))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[2]
+        cached = self._load_pickle(key, signature)
+        if cached is not None:
+            with self._lock:
+                self._disk_hits += 1
+            value = cached[0]
+        else:
+            value = loader(file_path)
+            with self._lock:
+                self._misses += 1
+            # Not cached if the file changed while it was parsed.
+            if _signature(os.stat(file_path)) != signature:
+                return value
+            self._save_pickle(key, signature, value)
+        self._put(key, signature, value)
+        return value
+
+    def invalidate(self, file_path: Union[Path, str, None] = None) -> None:
+        """p3_utils: Drop file_path from memory, or every file if None.
+
+        Pickles on disk are kept, they are checked by signature when loaded.
+        """
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+            path = os.path.abspath(file_path)
+            for key in [k for k in self._entries if k[0] == path]:
+                self._bytes -= self._entries.pop(key)[1]
+
+    def stats(self, reset: bool = False) -> dict[str, int]:
+        """p3_utils: Return counters of hits, disk hits, misses and evictions.
+
+        Args:
+            reset (bool): Zero the counters after reading them.
+        """
+        with self._lock:
+            stats = {"hits": self._hits, "disk_hits": self._disk_hits,
+                     "misses": self._misses, "evictions": self._evictions,
+                     "entries": len(self._entries), "bytes": self._bytes,
+                     "max_bytes": self.max_bytes}
+            if reset:
+                self._hits = self._disk_hits = self._misses = self._evictions = 0
+        return stats
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _put(self, key: tuple[str, Any], signature: tuple, value: Any) -> None:
+        size = self.sizeof(value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (signature, size, value)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                self._bytes -= self._entries.popitem(last=False)[1][1]
+                self._evictions += 1
+
+    def _pickle_path(self, key: tuple[str, str]) -> Path:
+        return self.disk_dir / f"{gen_hash_key(key[0] + chr(0) + key[1])}.pickle"
+
+    def _load_pickle(self, key: tuple[str, Any],
+                     signature: tuple) -> Optional[tuple[Any]]:
+        """p3_utils: Return (value,) from disk_dir if current there, else None."""
+        if self.disk_dir is None or not isinstance(key[1], str):
+            return None
+        try:
+            with open(self._pickle_path(key), "rb") as f:
+                saved = pickle.load(f)
+        except Exception:  # a missing, truncated or foreign pickle is a miss
+            return None
+        if not isinstance(saved, dict) or \
+            (saved.get("path"), saved.get("loader")) != key or \
+            saved.get("signature") != signature:
+            return None
+        return (saved.get("value"),)
+
+    def _save_pickle(self, key: tuple[str, Any], signature: tuple,
+                     value: Any) -> None:
+        if self.disk_dir is None or not isinstance(key[1], str):
+            return
+        saved = {"path": key[0], "loader": key[1], "signature": signature,
+                 "value": value}
+        try:
+            data = pickle.dumps(saved, protocol=pickle.HIGHEST_PROTOCOL)
+            with atomic_write(self._pickle_path(key), "wb", durability="none",
+                              verify=False) as f:
+                f.write(data)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            pass  # the value is still cached in memory
+#endregion ContentCache class
+# ---------------------------------------------------------------------------- +
+#region load_cached()
+_default_cache = ContentCache()
+
+def load_cached(file_path: Union[Path, str],
+                loader: Optional[Callable[[Path], Any]] = None,
+                loader_key: Optional[str] = None) -> Any:
+    """p3_utils: Return the parsed contents of file_path, from the default cache.
+
+    See ContentCache.load().
+    """
+    return _default_cache.load(file_path, loader, loader_key)
+
+def content_cache_stats(reset: bool = False) -> dict[str, int]:
+    """p3_utils: Return the counters of the default cache, see ContentCache.stats()."""
+    return _default_cache.stats(reset)
+#endregion load_cached()
+# ---------------------------------------------------------------------------- +
@@ -13,6 +13,7 @@ from typing import Callable as function
 import win32com.client
 # Local Package and Module Libraries
 from .p3_print_output_utils import out_msg, exc_msg, exc_err_msg, po, set_print_output, get_print_output
+from .p3_fault_points import fault_point
 #endregion Imports
 # ---------------------------------------------------------------------------- +
 #region Globals and Constants
@@ -169,6 +170,7 @@ def open_excel_workbooks() -> Tuple[bool, WORKBOOK_INFO_COLLECTION]:
     global _excel
     try:
         _init_excel_files()  # Always initialize first
+        fault_point("excel.open")
         ewbs = _excel.Workbooks
         wi_collection = dict()
         for wb in ewbs:
@@ -0,0 +1,234 @@
+# ---------------------------------------------------------------------------- +
+#region p3_fault_points.py
+""" Named fault-injection points for testing error handling and load.
+
+    fault_point() - Fire the named fault point, if armed.
+    arm_fault() - Arm a named fault point to raise and/or add latency.
+    disarm_fault() - Disarm one named fault point, or all of them.
+    armed_faults() - Return a dict of the currently armed fault points.
+    fault_injection() - Context manager to arm a fault point for a scope.
+    load_faults_from_env() - Arm fault points from the P3_FAULTS env var.
+
+    Explanation:
+    ------------
+    Production code calls fault_point("some.name") at interesting places.
+    When nothing is armed, the call costs one function call and a single
+    attribute check, so it can be left in hot paths. Test cases, or a load
+    test via the P3_FAULTS environment variable, arm a point with an
+    exception type, a probability, a count of firings and/or a latency in
+    seconds to inject.
+
+    P3_FAULTS format, entries separated by ';', options by ':':
+        P3_FAULTS="excel.open=PermissionError:p=0.5:n=3;file.copy=:latency=0.2"
+"""
+#endregion p3_fault_points.py
+# ---------------------------------------------------------------------------- +
+#region Imports
+# Standard Module Libraries
+import builtins, os, random, threading, time
+from contextlib import contextmanager
+from typing import Dict, Optional, Type, Union
+
+# Local Modules
+
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals and Constants
+P3_FAULTS_ENV_VAR = "P3_FAULTS"
+#endregion Globals and Constants
+# ---------------------------------------------------------------------------- +
+#region FaultSpec class
+class FaultSpec:
+    """p3_utils: Settings for one armed fault point."""
+    __slots__ = ("name", "exc", "probability", "count", "latency", "fired")
+
+    def __init__(self, name: str,
+                 exc: Union[Type[BaseException], BaseException, None] = ZeroDivisionError,
+                 probability: float = 1.0, count: Optional[int] = None,
+                 latency: float = 0.0) -> None:
+        self.name = name
+        self.exc = exc
+        self.probability = probability
+        self.count = count      # None means fire every time
+        self.latency = latency  # seconds to sleep before raising
+        self.fired = 0
+
+    def __repr__(self) -> str:
+        exc = self.exc if self.exc is None or isinstance(self.exc, type) \
+            else type(self.exc)
+        exc_name = exc.__name__ if exc is not None else None
+        return (f"FaultSpec(name='{self.name}', exc={exc_name}, "
+                f"probability={self.probability}, count={self.count}, "
+                f"latency={self.latency}, fired={self.fired})")
+#endregion FaultSpec class
+# ---------------------------------------------------------------------------- +
+#region _FaultRegistry class
+class _FaultRegistry:
+    """p3_utils: Internal registry of armed fault points. """
+    __slots__ = ("armed", "specs", "lock")
+
+    def __init__(self) -> None:
+        self.armed: bool = False   # the one attribute checked on the fast path
+        self.specs: Dict[str, FaultSpec] = {}
+        self.lock = threading.Lock()
+
+    def _refresh(self) -> None:
+        self.armed = len(self.specs) > 0
+
+_faults = _FaultRegistry()
+#endregion _FaultRegistry class
+# ---------------------------------------------------------------------------- +
+#region exception_class(name: str) -> type
+def exception_class(exc: Union[str, Type[BaseException]]) -> Type[BaseException]:
+    """p3_utils: Return a builtin exception class by name, or the class given.
+
+    Raises:
+        TypeError: if exc does not name or is not an exception class.
+    """
+    if isinstance(exc, type) and issubclass(exc, BaseException):
+        return exc
+    if isinstance(exc, str) and len(exc.strip()) > 0:
+        exc_class = getattr(builtins, exc.strip(), None)
+        if isinstance(exc_class, type) and issubclass(exc_class, BaseException):
+            return exc_class
+    raise TypeError(f"Invalid exception class: type='{type(exc).__name__}', "
+                    f"value='{exc}'")
+#endregion exception_class(name: str) -> type
+# ---------------------------------------------------------------------------- +
+#region arm_fault()
+def arm_fault(name: str,
+              exc: Union[str, Type[BaseException], BaseException, None] = ZeroDivisionError,
+              probability: float = 1.0, count: Optional[int] = None,
+              latency: float = 0.0) -> FaultSpec:
+    """p3_utils: Arm the named fault point.
+
+    Args:
+        name (str): The fault point name, e.g. "excel.open".
+        exc: Exception class, builtin class name or instance to raise. Use
+            None to only inject latency.
+        probability (float): Chance in [0.0, 1.0] that a call fires.
+        count (int): Number of firings before auto-disarm, None for no limit.
+        latency (float): Seconds to sleep each time the point fires.
+
+    Returns:
+        FaultSpec: The armed spec, its 'fired' attribute counts firings.
+    """
+    if not isinstance(name, str) or len(name.strip()) == 0:
+        raise TypeError(f"Invalid fault point name: type='{type(name).__name__}', "
+                        f"value='{name}'")
+    if exc is not None and not isinstance(exc, BaseException):
+        exc = exception_class(exc)
+    if not isinstance(probability, (int, float)) or not 0.0 <= probability <= 1.0:
+        raise ValueError(f"probability must be in [0.0, 1.0], not '{probability}'")
+    if count is not None and (not isinstance(count, int) or count <= 0):
+        raise ValueError(f"count must be a positive int or None, not '{count}'")
+    if not isinstance(latency, (int, float)) or latency < 0:
+        raise ValueError(f"latency must be a non-negative number, not '{latency}'")
+    spec = FaultSpec(name, exc, float(probability), count, float(latency))
+    with _faults.lock:
+        _faults.specs[name] = spec
+        _faults._refresh()
+    return spec
+#endregion arm_fault()
+# ---------------------------------------------------------------------------- +
+#region disarm_fault()
+def disarm_fault(name: Optional[str] = None) -> None:
+    """p3_utils: Disarm the named fault point, or all points if name is None."""
+    with _faults.lock:
+        if name is None:
+            _faults.specs.clear()
+        else:
+            _faults.specs.pop(name, None)
+        _faults._refresh()
+#endregion disarm_fault()
+# ---------------------------------------------------------------------------- +
+#region armed_faults()
+def armed_faults() -> Dict[str, FaultSpec]:
+    """p3_utils: Return a copy of the armed fault points by name."""
+    with _faults.lock:
+        return dict(_faults.specs)
+#endregion armed_faults()
+# ---------------------------------------------------------------------------- +
+#region fault_point(name: str) -> None
+def fault_point(name: str) -> None:
+    """p3_utils: Fire the named fault point if it is armed, else do nothing."""
+    if not _faults.armed:
+        return None
+    spec = _faults.specs.get(name)
+    if spec is None:
+        return None
+    return _fire(spec)
+
+def _fire(spec: FaultSpec) -> None:
+    """p3_utils: Slow path of fault_point(), only reached when armed."""
+    if spec.probability < 1.0 and random.random() >= spec.probability:
+        return None
+    with _faults.lock:
+        if _faults.specs.get(spec.name) is not spec:
+            return None  # disarmed, or used up by another thread
+        spec.fired += 1
+        if spec.count is not None and spec.fired >= spec.count:
+            del _faults.specs[spec.name]
+            _faults._refresh()
+    if spec.latency > 0:
+        time.sleep(spec.latency)
+    if spec.exc is None:
+        return None
+    if isinstance(spec.exc, BaseException):
+        raise spec.exc
+    raise spec.exc(f"fault_point: {spec.exc.__name__} injected at '{spec.name}'")
+#endregion fault_point(name: str) -> None
+# ---------------------------------------------------------------------------- +
+#region fault_injection() context manager
+@contextmanager
+def fault_injection(name: str, **kwargs):
+    """p3_utils: Arm the named fault point for the scope of a with block.
+
+    Keyword arguments are passed to arm_fault(). Yields the FaultSpec.
+    """
+    spec = arm_fault(name, **kwargs)
+    try:
+        yield spec
+    finally:
+        with _faults.lock:
+            if _faults.specs.get(name) is spec:
+                del _faults.specs[name]
+            _faults._refresh()
+#endregion fault_injection() context manager
+# ---------------------------------------------------------------------------- +
+#region load_faults_from_env()
+def load_faults_from_env(value: Optional[str] = None) -> list[FaultSpec]:
+    """p3_utils: Arm fault points described by value or $P3_FAULTS.
+
+    Each entry is name=[ExceptionName][:p=0.5][:n=3][:latency=0.1], and
+    entries are separated by ';'. An empty exception name injects latency
+    only. Returns the list of armed FaultSpecs.
+    """
+    value = os.environ.get(P3_FAULTS_ENV_VAR, "") if value is None else value
+    specs = []
+    for entry in value.split(";"):
+        entry = entry.strip()
+        if len(entry) == 0:
+            continue
+        name, _, options = entry.partition("=")
+        parts = options.split(":")
+        kwargs = {"exc": parts[0].strip() or None}
+        for opt in parts[1:]:
+            key, _, val = opt.partition("=")
+            key = key.strip()
+            if key in ("p", "probability"):
+                kwargs["probability"] = float(val)
+            elif key in ("n", "count"):
+                kwargs["count"] = int(val)
+            elif key == "latency":
+                kwargs["latency"] = float(val)
+            else:
+                raise ValueError(f"Unknown {P3_FAULTS_ENV_VAR} option '{key}' "
+                                 f"in entry '{entry}'")
+        specs.append(arm_fault(name.strip(), **kwargs))
+    return specs
+#endregion load_faults_from_env()
+# ---------------------------------------------------------------------------- +
+if os.environ.get(P3_FAULTS_ENV_VAR):
+    load_faults_from_env()
+# ---------------------------------------------------------------------------- +
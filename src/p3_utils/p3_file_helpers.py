@@ -8,138 +8,891 @@
 #region Imports
 # ---------------------------------------------------------------------------- +
 # python standard library modules and packages
-import shutil
+import asyncio, bz2, csv, ctypes, errno, fnmatch, functools, gzip, hashlib, io
+import json
+import lzma, mmap, multiprocessing, os, re
+import random, shutil, stat, sys, threading, time
+from collections import deque
+from contextlib import ExitStack, contextmanager
+from operator import itemgetter
+from concurrent.futures import (FIRST_COMPLETED, ProcessPoolExecutor,
+                                ThreadPoolExecutor, wait)
 from pathlib import Path, PurePath
-from typing import List, Any, Type, Union
+from typing import List, Any, NamedTuple, Optional, Type, Union
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+    import msvcrt
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:  # optional, zstd compression is not available
+        zstd = None
 
 # third-party modules and packages
+try:
+    import numpy as np
+except ImportError:  # optional, read_csv_columns() returns lists only
+    np = None
 from .p3_common_utils import *
-from .p3_helper_utils import is_not_obj_of_type, str_notempty
+from .p3_helper_utils import (is_not_obj_of_type, str_notempty,
+                              verify_file_path_for_save)
+from .p3_fault_points import fault_point
+from .p3_folder_index import FolderIndex
+from .p3_stat_cache import (stat_cache_scope, cached_stat, invalidate_stat,
+                            path_exists, path_is_file)
 # local modules and packages
 #endregion Imports
 # ---------------------------------------------------------------------------- +
 #region Globals and Constants
+BACKUP_RESERVE_RETRIES = 1000  # O_EXCL collisions tolerated per backup file
+FICLONE = 0x40049409           # Linux ioctl to reflink clone a whole file
+BACKUP_MANIFEST_NAME = ".p3_backup_manifest.json"  # incremental backup state
+BACKUP_CHUNK_SIZE = 1024 * 1024  # bytes per read when streaming compression
+# compress= method name -> file extension added to the backup file name
+BACKUP_COMPRESSION_EXT = {"gzip": ".gz", "bz2": ".bz2", "lzma": ".xz",
+                          "zstd": ".zst"}
+_COMPRESSION_OF_EXT = {ext: method for method, ext in BACKUP_COMPRESSION_EXT.items()}
+# Folder names find_folder() callers commonly exclude from the walk
+FIND_FOLDER_EXCLUDES = ["node_modules", ".git", ".venv", "venv", "__pycache__",
+                        ".tox", ".mypy_cache", ".pytest_cache"]
 #endregion Globals and Constants
 # ---------------------------------------------------------------------------- +
 #region find_folder()
-def find_folder(folder_name: str, start_dir: Path = None):
+def _scan_for_folder(folder: Path, is_match, exclude, follow_symlinks: bool,
+                     want_subdirs: bool) -> tuple[Path|None, list[Path]]:
+    """p3_utils: List folder once, return (first matching dir, subdirs to walk)."""
+    subdirs : list[Path] = []
+    try:
+        it = os.scandir(folder)
+    except OSError:
+        return None, subdirs  # unreadable folders are skipped, like rglob()
+    with it:
+        for entry in it:
+            name = entry.name
+            try:
+                if is_match(name) and entry.is_dir():
+                    return folder / name, subdirs
+                if want_subdirs and entry.is_dir(follow_symlinks=follow_symlinks) \
+                    and not (exclude and any(fnmatch.fnmatch(name, pat)
+                                             for pat in exclude)):
+                    subdirs.append(folder / name)
+            except OSError:
+                continue
+    return None, subdirs
+
+def find_folder(folder_name: str, start_dir: Path = None,
+                max_depth: int = None, exclude: list[str] = None,
+                follow_symlinks: bool = False, order: str = "dfs",
+                workers: int = 1, index: FolderIndex = None) -> Path|None:
+    """p3_utils: Find the first folder named folder_name below start_dir.
+
+    Walks with os.scandir, listing each folder once, and returns on the first
+    match. With the defaults, the match is the same one the former
+    Path.home().rglob(folder_name) search returned.
+
+    Args:
+        folder_name (str): Folder name, or glob pattern such as 'data_*'.
+        start_dir (Path): Where to start, default is the user's home folder.
+        max_depth (int): Deepest match to consider, 1 is a child of start_dir.
+        exclude (list[str]): Glob patterns of folder names not to descend
+            into, e.g. FIND_FOLDER_EXCLUDES.
+        follow_symlinks (bool): Descend into symlinked folders.
+        order (str): 'dfs' as rglob() does, or 'bfs' for shallow matches first.
+        workers (int): Threads walking subtrees in parallel. The first match
+            found by any thread is returned, so it may not be the shallowest.
+        index (FolderIndex): Look folder_name up in this persistent index
+            instead of walking, the other walk options come from the index.
+
+    Returns:
+        Path|None: The first matching folder, or None.
+    """
+    if index is not None and os.sep not in folder_name and "/" not in folder_name:
+        if start_dir is not None and Path(start_dir).absolute() != index.root:
+            raise ValueError(f"start_dir '{start_dir}' is not the index root "
+                             f"'{index.root}'")
+        match = index.find(folder_name)
+        if match is not None and max_depth is not None and \
+            len(match.relative_to(index.root).parts) > max_depth:
+            return None
+        return match
     if start_dir is None:
         start_dir = Path.home()
-    for path in start_dir.rglob(folder_name):
-        if path.is_dir():
-            return path  # Return the first match
+    if os.sep in folder_name or "/" in folder_name:
+        # multi-part patterns are left to rglob()
+        for path in start_dir.rglob(folder_name):
+            if path.is_dir():
+                return path  # Return the first match
+        return None
+    if order not in ("dfs", "bfs"):
+        raise ValueError(f"order must be 'dfs' or 'bfs', not '{order}'")
+    if any(c in folder_name for c in "*?["):
+        is_match = lambda name: fnmatch.fnmatch(name, folder_name)
+    else:
+        target = os.path.normcase(folder_name)
+        is_match = lambda name: os.path.normcase(name) == target
+    max_depth = sys.maxsize if max_depth is None else max_depth
+    if max_depth < 1:
+        return None
+    def scan(folder: Path, depth: int) -> tuple[Path|None, list[Path]]:
+        # subdirs are only needed if a match below them is within max_depth
+        return _scan_for_folder(folder, is_match, exclude, follow_symlinks,
+                                depth + 1 < max_depth)
+
+    if workers > 1:
+        return _find_folder_parallel(start_dir, scan, workers)
+    if order == "bfs":
+        queue = deque([(start_dir, 0)])
+        while queue:
+            folder, depth = queue.popleft()
+            match, subdirs = scan(folder, depth)
+            if match is not None:
+                return match
+            queue.extend((sub, depth + 1) for sub in subdirs)
+        return None
+    # 'dfs' checks folders in the order rglob() does: start_dir, then the
+    # children of each folder in Path.walk() top-down order.
+    match, subdirs = scan(start_dir, 0)
+    if match is not None:
+        return match
+    children = {start_dir: subdirs}
+    stack = [(start_dir, 0)]
+    while stack:
+        folder, depth = stack.pop()
+        subdirs = children.pop(folder)
+        for sub in subdirs:
+            match, children[sub] = scan(sub, depth + 1)
+            if match is not None:
+                return match
+        stack.extend((sub, depth + 1) for sub in reversed(subdirs))
     return None
+
+def _find_folder_parallel(start_dir: Path, scan, workers: int) -> Path|None:
+    """p3_utils: find_folder() walking folders in a thread pool."""
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        pending = {pool.submit(scan, start_dir, 0): 0}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                depth = pending.pop(future)
+                match, subdirs = future.result()
+                if match is not None:
+                    return match
+                for sub in subdirs:
+                    pending[pool.submit(scan, sub, depth + 1)] = depth + 1
+        return None
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
 #endregion find_folder()
 # ---------------------------------------------------------------------------- +
-#region copy_backup()
-def copy_backup(src_path: Path, dst_folder: Union[Path,str]) -> list[Path]:
+#region _backup_version_index()
+def _backup_version_index(dst_folder: Path) -> dict[tuple[str, str], int]:
+    """p3_utils: Scan dst_folder once, return max version by (stem, suffix).
+
+    Backup files are named '<stem>_v<N><suffix>', as written by copy_backup(),
+    plus a compression extension for compressed backups.
     """
-    Create a backup copy of the specified file or directory.
+    index : dict[tuple[str, str], int] = {}
+    with os.scandir(dst_folder) as it:
+        for entry in it:
+            name = entry.name
+            stem, suffix = os.path.splitext(name)
+            if suffix in _COMPRESSION_OF_EXT:
+                stem, suffix = os.path.splitext(stem)
+            base, sep, ver = stem.rpartition("_v")
+            if not sep or not ver.isdigit():
+                continue
+            key = (base, suffix)
+            version = int(ver)
+            if version > index.get(key, 0):
+                index[key] = version
+    return index
+#endregion _backup_version_index()
+# ---------------------------------------------------------------------------- +
+#region _reserve_backup_path()
+def _reserve_backup_path(dst_folder: Path, stem: str, suffix: str,
+                         index: dict[tuple[str, str], int],
+                         ext: str = "") -> Path:
+    """p3_utils: Atomically create the next free '<stem>_v<N><suffix><ext>' file.
+
+    The index gives the starting version. O_EXCL creation makes the name ours
+    even when other processes back up into the same folder; on a collision
+    the next version is tried.
+    """
+    key = (stem, suffix)
+    version = index.get(key, 0)
+    for _ in range(BACKUP_RESERVE_RETRIES):
+        version += 1
+        dst_path = dst_folder / f"{stem}_v{version}{suffix}{ext}"
+        try:
+            fd = os.open(dst_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            continue
+        os.close(fd)
+        index[key] = version
+        return dst_path
+    raise FileExistsError(f"No free backup version for '{stem}{suffix}' in "
+                          f"'{dst_folder}' after {BACKUP_RESERVE_RETRIES} tries")
+#endregion _reserve_backup_path()
+# ---------------------------------------------------------------------------- +
+#region BackupResult class
+class BackupResult:
+    """p3_utils: Outcome of backup_files(), one entry per matched file."""
+    __slots__ = ("copied", "linked", "skipped", "errors", "bytes_copied",
+                 "bytes_written", "elapsed")
+
+    def __init__(self) -> None:
+        self.copied : list[Path] = []          # backup paths written
+        self.linked : list[Path] = []          # of copied, hardlinks to same content
+        self.skipped : list[Path] = []         # unchanged source paths, incremental
+        self.errors : dict[Path, str] = {}     # source path -> error message
+        self.bytes_copied : int = 0            # source bytes read
+        self.bytes_written : int = 0           # backup bytes, after compression
+        self.elapsed : float = 0.0             # seconds
+
+    @property
+    def ok(self) -> bool:
+        """True if every matched file was backed up."""
+        return len(self.errors) == 0
+
+    @property
+    def throughput(self) -> float:
+        """Bytes copied per second."""
+        return self.bytes_copied / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return (f"BackupResult(copied={len(self.copied)}, "
+                f"linked={len(self.linked)}, skipped={len(self.skipped)}, "
+                f"errors={len(self.errors)}, bytes_copied={self.bytes_copied}, "
+                f"bytes_written={self.bytes_written}, "
+                f"elapsed={self.elapsed:.6f}, throughput={self.throughput:.0f})")
+#endregion BackupResult class
+# ---------------------------------------------------------------------------- +
+#region _fast_copy_file()
+def _fast_copy_file(src: Path, dst: Path) -> int:
+    """p3_utils: Copy src over dst with the fastest available method.
+
+    Tries a reflink clone (FICLONE), then os.copy_file_range(), and falls back
+    to shutil.copyfile(), which uses sendfile() where available, also when
+    copy_file_range() copies nothing, as on some procfs, FUSE and overlay
+    files. Metadata is copied like shutil.copy2(). Returns the number of
+    bytes copied.
+
+    Raises:
+        OSError: if copy_file_range() stops short after copying some bytes.
+    """
+    size = cached_stat(src).st_size
+    copied = False
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        if fcntl is not None and size > 0:
+            try:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                copied = True
+            except OSError:
+                pass  # not a reflink capable filesystem, or across devices
+        if not copied and hasattr(os, "copy_file_range") and size > 0:
+            offset = 0
+            try:
+                while offset < size:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(),
+                                           size - offset)
+                    if n == 0:
+                        break
+                    offset += n
+            except OSError:
+                if offset > 0:
+                    raise
+            if 0 < offset < size:
+                raise OSError(f"copy_file_range() stopped at byte {offset} "
+                              f"of {size} copying '{src}'")
+            copied = offset == size
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+    return size
+#endregion _fast_copy_file()
+# ---------------------------------------------------------------------------- +
+#region backup manifest functions
+# An incremental backup folder holds a JSON manifest of what was backed up:
+#   "files":   absolute source path -> {size, mtime_ns, sha256, backup}
+#   "content": sha256 -> {backup, size, mtime_ns, ino} of a backup file
+#              holding that content, checked by stat() before linking to it
+# Runs backing up into one folder are serialized by an exclusive lock on
+# the '<manifest>.lock' file, held from loading the manifest to saving it.
+# "content" keeps every backup ever made, so a run looks its entries up by
+# backup name in an index of backup name -> content keys, built once.
+def _file_digest(file: Path) -> str:
+    """p3_utils: Return the sha256 hex digest of a file's content."""
+    with open(file, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+def _load_backup_manifest(dst_folder: Path) -> dict:
+    """p3_utils: Load the backup manifest of dst_folder, or a new empty one."""
+    manifest_path = dst_folder / BACKUP_MANIFEST_NAME
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if isinstance(manifest.get("files"), dict) and \
+            isinstance(manifest.get("content"), dict):
+            return manifest
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, AttributeError) as e:
+        po(f"Ignoring unreadable backup manifest '{manifest_path}': {e}")
+    return {"files": {}, "content": {}}
+
+@contextmanager
+def _backup_manifest_lock(dst_folder: Path):
+    """p3_utils: Hold an exclusive lock on the backup manifest of dst_folder."""
+    fd = os.open(dst_folder / f"{BACKUP_MANIFEST_NAME}.lock",
+                 os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK gives up after 10 seconds
+        yield
+    finally:
+        os.close(fd)  # closing releases the lock
+
+def _content_index(manifest: dict) -> dict[str, set[str]]:
+    """p3_utils: Return the backup name -> content keys index of manifest."""
+    index : dict[str, set[str]] = {}
+    for key, entry in manifest["content"].items():
+        if isinstance(entry, dict):
+            index.setdefault(entry.get("backup"), set()).add(key)
+    return index
+
+def _drop_content(manifest: dict, index: dict[str, set[str]], key: str) -> None:
+    """p3_utils: Drop content key from manifest and index."""
+    entry = manifest["content"].pop(key, None)
+    if isinstance(entry, dict):
+        index.get(entry.get("backup"), set()).discard(key)
+
+def _put_content(manifest: dict, index: dict[str, set[str]], key: str,
+                 entry: dict) -> None:
+    """p3_utils: Record content key held by the backup entry describes."""
+    _drop_content(manifest, index, key)
+    manifest["content"][key] = entry
+    index.setdefault(entry["backup"], set()).add(key)
+
+def _content_backup(manifest: dict, index: dict[str, set[str]], key: str,
+                    dst_folder: Path) -> Optional[Path]:
+    """p3_utils: Return the backup file holding content key, if unchanged.
+
+    The file's size, mtime and inode must still be as recorded, else the
+    name was pruned or reused and the entry is dropped.
+    """
+    entry = manifest["content"].get(key)
+    if not isinstance(entry, dict):
+        _drop_content(manifest, index, key)  # missing, or unverifiable
+        return None
+    path = dst_folder / entry["backup"]
+    try:
+        st = os.stat(path)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode) or \
+        (st.st_size, st.st_mtime_ns, st.st_ino) != \
+        (entry["size"], entry["mtime_ns"], entry["ino"]):
+        _drop_content(manifest, index, key)
+        return None
+    return path
+
+def _save_backup_manifest(dst_folder: Path, manifest: dict) -> None:
+    """p3_utils: Atomically replace the backup manifest of dst_folder."""
+    manifest_path = dst_folder / BACKUP_MANIFEST_NAME
+    tmp_path = dst_folder / f"{BACKUP_MANIFEST_NAME}.{gen_hex_id()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, manifest_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+def _skip_unchanged(files: list[Path], manifest: dict, result: BackupResult,
+                    run) -> tuple[list[Path], dict, dict]:
+    """p3_utils: Drop files unchanged since their last backup.
+
+    Files are compared by size and mtime first and by content hash second.
+    Returns the changed files with their os.stat() results and digests.
+    """
+    entries = manifest["files"]
+    stats : dict[Path, os.stat_result] = {}
+    maybe_changed : list[Path] = []
+    for file in files:
+        try:
+            st = stats[file] = cached_stat(file)
+        except OSError as e:
+            result.errors[file] = exc_err_msg(e)
+            continue
+        entry = entries.get(os.path.abspath(file))
+        if entry is not None and entry["size"] == st.st_size and \
+            entry["mtime_ns"] == st.st_mtime_ns:
+            result.skipped.append(file)
+            continue
+        maybe_changed.append(file)
+
+    def digest_job(file: Path) -> tuple[str, str]:
+        try:
+            return _file_digest(file), None
+        except Exception as e:
+            return None, exc_err_msg(e)
+
+    changed : list[Path] = []
+    digests : dict[Path, str] = {}
+    for file, (digest, error) in zip(maybe_changed, run(digest_job, maybe_changed)):
+        if error is not None:
+            result.errors[file] = error
+            continue
+        entry = entries.get(os.path.abspath(file))
+        if entry is not None and entry["sha256"] == digest:
+            # Touched but not changed, remember the new metadata
+            entry["size"] = stats[file].st_size
+            entry["mtime_ns"] = stats[file].st_mtime_ns
+            result.skipped.append(file)
+            continue
+        digests[file] = digest
+        changed.append(file)
+    return changed, stats, digests
+#endregion backup manifest functions
+# ---------------------------------------------------------------------------- +
+#region compression functions
+def _open_compressed(path: Union[Path,str], mode: str, method: str,
+                     level: int = None):
+    """p3_utils: Open a file object that (de)compresses with method."""
+    if method == "gzip":
+        return gzip.open(path, mode, compresslevel=9 if level is None else level)
+    if method == "bz2":
+        return bz2.open(path, mode, compresslevel=9 if level is None else level)
+    if method == "lzma":
+        return lzma.open(path, mode, preset=level)
+    if method == "zstd":
+        if zstd is None:
+            raise ValueError("zstd compression requires Python 3.14+ or the "
+                             "'zstandard' package")
+        if level is None or "r" in mode:
+            return zstd.open(path, mode)
+        if hasattr(zstd, "ZstdCompressor"):  # zstandard package
+            return zstd.open(path, mode, cctx=zstd.ZstdCompressor(level=level))
+        return zstd.open(path, mode, level=level)
+    raise ValueError(f"compress must be one of {tuple(BACKUP_COMPRESSION_EXT)}, "
+                     f"not '{method}'")
+
+def _compress_file(src: str, dst: str, method: str,
+                   level: int = None) -> tuple[int, int]:
+    """p3_utils: Stream src into dst compressed, return (bytes in, bytes out).
+
+    Memory use is bounded by BACKUP_CHUNK_SIZE. Top level so it can run in a
+    ProcessPoolExecutor.
+    """
+    with open(src, "rb") as fsrc, _open_compressed(dst, "wb", method, level) as fdst:
+        shutil.copyfileobj(fsrc, fdst, BACKUP_CHUNK_SIZE)
+    shutil.copystat(src, dst)
+    return os.stat(src).st_size, os.stat(dst).st_size
+
+def restore_backup(backup_path: Path, dst_path: Path) -> Path:
+    """p3_utils: Restore a backup written by copy_backup() to dst_path.
+
+    Compressed backups are detected by extension and decompressed by
+    streaming. If dst_path is a folder, the original name '<stem><suffix>'
+    is restored into it. The restored file replaces dst_path atomically.
+
+    Returns:
+        Path: The restored file path.
+    """
+    is_not_obj_of_type("backup_path", backup_path, Path, raise_error=True)
+    is_not_obj_of_type("dst_path", dst_path, Path, raise_error=True)
+    method = _COMPRESSION_OF_EXT.get(backup_path.suffix)
+    if dst_path.is_dir():
+        name = backup_path.stem if method is not None else backup_path.name
+        stem, suffix = os.path.splitext(name)
+        base, sep, ver = stem.rpartition("_v")
+        dst_path = dst_path / (f"{base}{suffix}" if sep and ver.isdigit() else name)
+    tmp_path = dst_path.with_name(f"{dst_path.name}.{gen_hex_id()}.tmp")
+    try:
+        if method is None:
+            shutil.copyfile(backup_path, tmp_path)
+        else:
+            with _open_compressed(backup_path, "rb", method) as fsrc, \
+                open(tmp_path, "wb") as fdst:
+                shutil.copyfileobj(fsrc, fdst, BACKUP_CHUNK_SIZE)
+        shutil.copystat(backup_path, tmp_path)
+        os.replace(tmp_path, dst_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return dst_path
+#endregion compression functions
+# ---------------------------------------------------------------------------- +
+#region _backup_one_file()
+def _backup_one_file(file: Path, dst_path: Path, link_src: Path = None,
+                     compress: str = None, level: int = None,
+                     cpool: ProcessPoolExecutor = None) -> tuple[int, int, bool]:
+    """p3_utils: Fill the reserved dst_path, by hardlink to link_src if given.
+
+    Falls back to copying when the link cannot be made. Compression runs in
+    cpool when given. Returns the bytes read and written, and whether
+    dst_path is a hardlink.
+    """
+    fault_point("file.copy_backup")
+    if link_src is not None:
+        tmp_path = dst_path.with_name(f"{dst_path.name}.{gen_hex_id()}.tmp")
+        try:
+            os.link(link_src, tmp_path)
+            os.replace(tmp_path, dst_path)
+            return 0, 0, True
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+    if compress is not None:
+        if cpool is not None:
+            return *cpool.submit(_compress_file, str(file), str(dst_path),
+                                 compress, level).result(), False
+        return *_compress_file(str(file), str(dst_path), compress, level), False
+    nbytes = _fast_copy_file(file, dst_path)
+    return nbytes, nbytes, False
+#endregion _backup_one_file()
+# ---------------------------------------------------------------------------- +
+#region backup_files()
+@stat_cache_scope()
+def backup_files(src_path: Path, dst_folder: Union[Path,str],
+                 workers: int = 1, incremental: bool = False,
+                 compress: str = None, level: int = None) -> BackupResult:
+    """
+    Back up a file, or the files matching a glob, as versioned copies.
+
+    Each copy gets the next version after the highest '_v<N>' already in
+    dst_folder, found with one scan of the folder. Errors are collected per
+    file in the result rather than stopping the backup.
+
+    With incremental=True, a manifest in dst_folder records each source's
+    size, mtime and sha256. Unchanged files are skipped, and a changed file
+    whose content is already backed up becomes a hardlink to that backup,
+    if that backup's size, mtime and inode are as recorded. Incremental runs
+    into one folder wait for each other on a lock file.
+
+    With compress set, backups are streamed through gzip, bz2, lzma or zstd
+    and named '<stem>_v<N><suffix>.gz' (.bz2, .xz, .zst). Versions count on
+    from the highest version, compressed or not. With workers > 1, files are
+    compressed in parallel processes. See restore_backup().
 
     Args:
-        src_path (Path): The source file or directory to back up.
-        dst_folder (Path): The destination folder where the backup will be stored.
+        src_path (Path): The source file, or glob pattern, to back up.
+        dst_folder (Path|str): The destination folder, a str is relative to
+            the parent folder of src_path.
+        workers (int): Number of threads hashing and copying in parallel,
+            and of processes compressing.
+        incremental (bool): Skip unchanged files and store content once.
+        compress (str): None, or one of 'gzip', 'bz2', 'lzma' or 'zstd'.
+        level (int): Compression level, None for the method's default.
 
     Returns:
-        list[Path]: A list of paths to the copied files.
+        BackupResult: Copied paths, per-file errors, bytes and timing.
     """
+    result = BackupResult()
+    start = time.perf_counter()
+    is_not_obj_of_type("src_path", src_path, Path,raise_error=True)
+    if compress is not None and compress not in BACKUP_COMPRESSION_EXT:
+        raise ValueError(f"compress must be one of "
+                         f"{tuple(BACKUP_COMPRESSION_EXT)}, not '{compress}'")
+    if compress == "zstd" and zstd is None:
+        raise ValueError("zstd compression requires Python 3.14+ or the "
+                         "'zstandard' package")
+    ext = BACKUP_COMPRESSION_EXT.get(compress, "")
+    pool = cpool = None
+    lock = ExitStack()
     try:
-        copied_paths = []
-        is_not_obj_of_type("src_path", src_path, Path,raise_error=True)
-        if not src_path.exists(): return copied_paths
+        is_glob = "*" in src_path.name
+        if not is_glob and not path_exists(src_path): return result
 
         if isinstance(dst_folder, str) and str_notempty(dst_folder):
             parent_path = src_path.parent
             dst_folder = parent_path / dst_folder
-        if not dst_folder.exists():
+        if not path_exists(dst_folder):
             dst_folder.mkdir(parents=True, exist_ok=True)
+            invalidate_stat(dst_folder)
 
-        # Match files if src_path is a glob
-        matched_files = list(src_path.parent.glob(src_path.name)) if "*" in src_path.name else [src_path]
+        # Match files if src_path is a glob, skip directories or invalid files
+        matched_files = list(src_path.parent.glob(src_path.name)) if is_glob else [src_path]
+        files = [file for file in matched_files if path_is_file(file)]
+        if workers > 1 and len(files) > 1:
+            pool = ThreadPoolExecutor(max_workers=workers)
+            if compress is not None:
+                # spawn, as forking with the thread pool running can deadlock
+                cpool = ProcessPoolExecutor(max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"))
+        run = pool.map if pool is not None else map
 
-        for file in matched_files:
-            if not file.is_file():
-                continue  # skip directories or invalid files
+        digests : dict[Path, str] = {}
+        if incremental:
+            lock.enter_context(_backup_manifest_lock(dst_folder))
+            manifest = _load_backup_manifest(dst_folder)
+            content_index = _content_index(manifest)
+            files, stats, digests = _skip_unchanged(files, manifest, result, run)
+        version_index = _backup_version_index(dst_folder)
 
-            original_stem = file.stem
-            suffix = file.suffix
+        # Reserve the next available versioned filenames, and find backups
+        # already holding the same content to link to.
+        jobs : list[tuple[Path, Path, Path]] = []
+        later_jobs : list[tuple[Path, Path, Path]] = []
+        first_copy : dict[str, Path] = {}
+        for file in files:
+            try:
+                dst_path = _reserve_backup_path(dst_folder, file.stem,
+                                                file.suffix, version_index, ext)
+            except Exception as e:
+                result.errors[file] = exc_err_msg(e)
+                continue
+            digest = digests.get(file)
+            if digest is None:
+                jobs.append((file, dst_path, None))
+                continue
+            # A name reserved again no longer holds the content recorded
+            for key in list(content_index.pop(dst_path.name, ())):
+                manifest["content"].pop(key, None)
+            link_src = _content_backup(manifest, content_index, digest + ext,
+                                       dst_folder)
+            if link_src is not None:
+                jobs.append((file, dst_path, link_src))
+            elif digest in first_copy:
+                later_jobs.append((file, dst_path, first_copy[digest]))
+            else:
+                first_copy[digest] = dst_path
+                jobs.append((file, dst_path, None))
 
-            # Find the next available versioned filename
-            version = 1
-            while True:
-                new_name = f"{original_stem}_v{version}{suffix}"
-                dst_path = dst_folder / new_name
-                if not dst_path.exists():
-                    break
-                version += 1
+        def backup_job(job: tuple[Path, Path, Path]) -> tuple[int, int, bool, str]:
+            file, dst_path, link_src = job
+            try:
+                return *_backup_one_file(file, dst_path, link_src, compress,
+                                         level, cpool), None
+            except Exception as e:
+                dst_path.unlink(missing_ok=True)  # release the reservation
+                return 0, 0, False, exc_err_msg(e)
+            finally:
+                invalidate_stat(dst_path)
+
+        # Copy first, then link to content copied in this run
+        for job_list in (jobs, later_jobs):
+            for (file, dst_path, _), (nread, nwritten, linked, error) in \
+                    zip(job_list, list(run(backup_job, job_list))):
+                if error is not None:
+                    result.errors[file] = error
+                    continue
+                result.copied.append(dst_path)
+                result.bytes_copied += nread
+                result.bytes_written += nwritten
+                if linked:
+                    result.linked.append(dst_path)
+                digest = digests.get(file)
+                if digest is not None:
+                    try:
+                        st = os.stat(dst_path)
+                    except OSError:
+                        continue  # not recorded, backed up again next run
+                    manifest["files"][os.path.abspath(file)] = {
+                        "size": stats[file].st_size,
+                        "mtime_ns": stats[file].st_mtime_ns,
+                        "sha256": digest,
+                        "backup": dst_path.name}
+                    _put_content(manifest, content_index, digest + ext, {
+                        "backup": dst_path.name, "size": st.st_size,
+                        "mtime_ns": st.st_mtime_ns, "ino": st.st_ino})
+        if incremental:
+            _save_backup_manifest(dst_folder, manifest)
+    except Exception as e:
+        result.errors[src_path] = exc_err_msg(e)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if cpool is not None:
+            cpool.shutdown()
+        lock.close()
+    result.elapsed = time.perf_counter() - start
+    return result
+#endregion backup_files()
+# ---------------------------------------------------------------------------- +
+#region copy_backup()
+def copy_backup(src_path: Path, dst_folder: Union[Path,str],
+                workers: int = 1, incremental: bool = False,
+                compress: str = None, level: int = None) -> list[Path]:
+    """
+    Create a backup copy of the specified file or directory.
 
-            shutil.copy2(file, dst_path)
-            copied_paths.append(dst_path)
+    See backup_files() for a result with per-file errors and throughput.
 
-        return copied_paths
+    Args:
+        src_path (Path): The source file or directory to back up.
+        dst_folder (Path): The destination folder where the backup will be stored.
+        workers (int): Number of threads copying files in parallel.
+        incremental (bool): Skip unchanged files and store content once.
+        compress (str): None, or one of 'gzip', 'bz2', 'lzma' or 'zstd'.
+        level (int): Compression level, None for the method's default.
+
+    Returns:
+        list[Path]: A list of paths to the copied files.
+    """
+    try:
+        result = backup_files(src_path, dst_folder, workers=workers,
+                              incremental=incremental, compress=compress,
+                              level=level)
+        for m in result.errors.values():
+            print(m)
+        return result.copied
     except Exception as e:
         m = exc_err_msg(e)
         print(m)
-        return copied_paths 
+        return []
 #endregion copy_backup()
 # ---------------------------------------------------------------------------- +
+#region lock probe functions
+def _office_lock_names(name: str) -> list[str]:
+    """p3_utils: Return the possible Office '~$name' owner file names.
+
+    Office names it '~$' plus the file name, dropping the first one or two
+    characters of longer names, so each form is checked.
+    """
+    return ["~$" + name[n:] for n in (0, 1, 2) if len(name) - n >= 1]
+
+def _office_lock_path(path: Path) -> Path|None:
+    """p3_utils: Return the Office '~$name' owner file for path, if present."""
+    for lock_name in _office_lock_names(path.name):
+        lock_path = path.with_name(lock_name)
+        if lock_path.exists():
+            return lock_path
+    return None
+
+def _exclusive_open_locked(path: Path) -> bool:
+    """p3_utils: Probe for a lock by opening path exclusively, no data read.
+
+    On Windows, an open with no sharing fails if any other handle is open.
+    Elsewhere, a non-blocking exclusive flock() fails if another open file
+    holds a flock(), and a non-blocking shared lockf() fails if another
+    process holds a POSIX write lock. Closing the probe's descriptor drops
+    every POSIX lock the calling process holds on the file, as any close of
+    it does, so on Linux the /proc/locks table is read instead.
+    """
+    if os.name == "nt":
+        import ctypes
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.CreateFileW.restype = ctypes.c_void_p
+        handle = kernel32.CreateFileW(str(path), 0x80000000, 0, None, 3, 0x80, None)
+        if handle == ctypes.c_void_p(-1).value:
+            err = ctypes.get_last_error()
+            if err in (32, 33):  # ERROR_SHARING_VIOLATION, ERROR_LOCK_VIOLATION
+                return True
+            raise ctypes.WinError(err)
+        kernel32.CloseHandle(ctypes.c_void_p(handle))
+        return False
+    if fcntl is None:
+        return False
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        fcntl.lockf(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+    except OSError as e:
+        if e.errno in (errno.EAGAIN, errno.EACCES):
+            return True
+        raise
+    finally:
+        os.close(fd)  # closing also releases our probe locks
+    return False
+
+def _proc_locked_inodes(proc_locks: str = "/proc/locks",
+                        pid: Optional[int] = None) -> Optional[set[tuple[int, int, int]]]:
+    """p3_utils: Return (major, minor, inode) of files locked in /proc/locks.
+
+    Counts flock() and open file description locks, which conflict with any
+    other open of the file, and POSIX fcntl() locks of processes other than
+    pid. Returns None if the table cannot be read, e.g. not on Linux.
+    """
+    inodes : set[tuple[int, int, int]] = set()
+    try:
+        with open(proc_locks, "r") as f:
+            lines = f.readlines()
+    except OSError:
+        return None
+    for line in lines:
+        fields = line.split()
+        # e.g. '1: POSIX  ADVISORY  WRITE 1234 08:01:1835 0 EOF', blocked
+        # waiters have a '->' field after the id.
+        if len(fields) > 1 and fields[1] == "->":
+            continue
+        if len(fields) < 6 or fields[1] not in ("FLOCK", "OFDLCK", "POSIX"):
+            continue
+        if fields[1] == "POSIX" and pid is not None and fields[4] == str(pid):
+            continue  # the caller's own POSIX locks do not block it
+        parts = fields[5].split(":")
+        if len(parts) != 3:
+            continue
+        try:
+            inodes.add((int(parts[0], 16), int(parts[1], 16), int(parts[2])))
+        except ValueError:
+            continue
+    return inodes
+
+def _inode_key(st: os.stat_result) -> tuple[int, int, int]:
+    """p3_utils: Return the /proc/locks (major, minor, inode) key of a stat."""
+    return (os.major(st.st_dev), os.minor(st.st_dev), st.st_ino)
+#endregion lock probe functions
+# ---------------------------------------------------------------------------- +
 #region is_file_locked(file_path : str =  None) -> bool
-def is_file_locked(file_path : str|Path =  None, errors : str = 'forgive') -> bool:
-    """p3_utils: Is a file locked by another process? """
+def is_file_locked(file_path : str|Path =  None, errors : str = 'forgive',
+                   office : bool = True, proc_locks : bool = True) -> bool:
+    """p3_utils: Is a file locked by another process? 
+
+    Probes without copying, renaming or reading the file: an Office
+    '~$name' owner file, then on Linux the /proc/locks table, which shows
+    flock() and POSIX fcntl() locks without opening the file. Elsewhere, or
+    with proc_locks=False, an exclusive open (Windows) or flock() and
+    lockf() probe, whose close drops POSIX locks the calling process itself
+    holds on the file.
+
+    Args:
+        file_path (str|Path): The file to check.
+        errors (str): 'forgive' returns False on errors, 'strict' raises.
+        office (bool): Treat an Office owner file as a lock.
+        proc_locks (bool): Check /proc/locks, where available, instead of
+            opening the file.
+    """
     try:
         me = is_file_locked
         test_path : Path = None
         # Validate file_path is non-zero length str or Path object
-        if (file_path is None or 
-            not isinstance(file_path, Path) or
-            (isinstance(file_path, str) and 
-            len(file_path.name) <= 0)):
+        if isinstance(file_path, Path):
+            test_path = file_path
+        elif isinstance(file_path, str) and len(file_path.strip()) > 0:
+            # convert str file_path to Path obj
+            test_path = Path(file_path)
+        else:
             # file_path is None or not a Path obj, or a non-zero length str
             if errors == 'strict':
                 # 'strict' mode, raise error file_path not a str or Path object
                 m = out_msg(me, f"Invalid file_path: type=" 
                                 f"'{type(file_path).__name__}', value='{file_path}'")
                 raise TypeError(m)
-            return False # add errors support here
-        elif isinstance(file_path, str) and len(file_path.strip()) > 0:
-            # convert str file_path to Path obj
-            test_path = Path(file_path)
-        else:
-            # file_path is a Path object
-            test_path = file_path
-        # Validate the test_path is reachable
-        if not test_path.is_absolute():
-            # Resolve the path before checking if it exists
-            test_path = test_path.resolve()
-        # Check if the file exists
-        if not test_path.exists():
-            # Non-existing file cannot be locked, but error?
-            return False            
-            # file_path is not a str or Path object
-            # TODO: support error param for selecting what to do about errors
-            # 'forgive' mode, default, try to forgive and continue the mission 
-            # if errors == 'forgive': return False
-            # if errors == 'strict':
-            #     # 'strict' mode, raise error file_path not a str or Path object
-            #     m = out_msg(me, f"Invalid file_path: type=" 
-            #                     f"'{type(file_path).__name__}', value='{file_path}'")
-            #     raise TypeError(m)
-        # To check a lock, attempt to rename the file
-        temp_path = test_path.with_suffix(test_path.suffix + ".temp")
-        if temp_path.exists():
-            # If the temp file already exists, remove it
-            temp_path.unlink()
-        backup_path = test_path.with_suffix(test_path.suffix + ".bak")
-        if backup_path.exists():
-            # If the backup file already exists, remove it
-            backup_path.unlink()
-        # copy the original file to a backup
-        shutil.copy(test_path,backup_path)  
-        # rename test_path to temp_path
-        # This will raise a PermissionError if the file is locked
-        test_path.rename(temp_path)  # Rename to temp
-        # must not be locked, so undo the rename
-        temp_path.rename(test_path)  # Rename back to original
+            return False
+        # Check if the file exists, a non-existing file cannot be locked
+        try:
+            st = cached_stat(test_path)
+        except FileNotFoundError:
+            return False
+        if office and _office_lock_path(test_path) is not None:
+            return True
+        locked = _proc_locked_inodes(pid=os.getpid()) if proc_locks else None
+        if locked is not None:
+            return _inode_key(st) in locked
+        if _exclusive_open_locked(test_path):
+            return True
         return False  # File is not locked - Happy Path
     except TypeError as e:
         po(str(e))
@@ -163,6 +916,734 @@ def is_file_locked(file_path : str|Path =  None, errors : str = 'forgive') -> bo
         return False
 #endregion is_file_locked(file_path : str =  None) -> bool
 # ---------------------------------------------------------------------------- +
+#region are_files_locked()
+@stat_cache_scope()
+def are_files_locked(file_paths, errors : str = 'forgive', office : bool = True,
+                     proc_locks : bool = True, workers : int = 8) -> dict[Path, bool]:
+    """p3_utils: Check many files for locks in one pass.
+
+    Like is_file_locked() for each path, but each parent folder is listed
+    once for Office owner files, /proc/locks is read once, and the open
+    probes run in up to workers threads.
+
+    Args:
+        file_paths (Iterable[str|Path]): The files to check.
+        errors (str): 'forgive' maps errors to False, 'strict' raises.
+        office (bool): Treat an Office owner file as a lock.
+        proc_locks (bool): Check /proc/locks, where available, instead of
+            opening the files.
+        workers (int): Number of threads running the open probes.
+
+    Returns:
+        dict[Path, bool]: Locked state by path, in the order given.
+    """
+    paths = [Path(p) if isinstance(p, str) else p for p in file_paths]
+    if errors == 'strict':
+        for p in paths:
+            if not isinstance(p, Path) or len(str(p).strip()) == 0:
+                raise TypeError(f"Invalid file_path: type='{type(p).__name__}', "
+                                f"value='{p}'")
+    results : dict[Path, bool] = {}
+    locked_inodes = _proc_locked_inodes(pid=os.getpid()) if proc_locks else None
+    folder_names : dict[Path, set[str]] = {}
+    to_probe : list[Path] = []
+    for p in paths:
+        if not isinstance(p, Path):
+            continue  # 'forgive' mode, not a Path is not locked
+        try:
+            st = cached_stat(p)
+        except FileNotFoundError:
+            results[p] = False
+            continue
+        except OSError as e:
+            if errors == 'strict':
+                raise
+            results[p] = isinstance(e, PermissionError)
+            continue
+        if office:
+            names = folder_names.get(p.parent)
+            if names is None:
+                try:
+                    names = folder_names[p.parent] = set(os.listdir(p.parent))
+                except OSError:
+                    names = folder_names[p.parent] = set()
+            if any(n in names for n in _office_lock_names(p.name)):
+                results[p] = True
+                continue
+        if locked_inodes is not None:
+            results[p] = _inode_key(st) in locked_inodes
+            continue
+        to_probe.append(p)
+
+    def probe(p: Path) -> bool:
+        try:
+            return _exclusive_open_locked(p)
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            if errors == 'strict':
+                raise
+            return isinstance(e, PermissionError)
+
+    if workers > 1 and len(to_probe) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            probed = list(pool.map(probe, to_probe))
+    else:
+        probed = [probe(p) for p in to_probe]
+    results.update(zip(to_probe, probed))
+    return {p: results.get(p, False) for p in paths if isinstance(p, Path)}
+#endregion are_files_locked()
+# ---------------------------------------------------------------------------- +
+#region wait_until_unlocked()
+def _backoff_delays(initial : float, maximum : float, factor : float,
+                    jitter : float):
+    """p3_utils: Yield exponential backoff delays with +/- jitter fraction."""
+    delay = initial
+    while True:
+        yield delay * (1.0 + random.uniform(-jitter, jitter))
+        delay = min(maximum, delay * factor)
+
+def wait_until_unlocked(file_paths, timeout : float = 30.0,
+                        initial_delay : float = 0.05, max_delay : float = 2.0,
+                        factor : float = 2.0, jitter : float = 0.1,
+                        **kwargs) -> list[Path]:
+    """p3_utils: Wait for files to be unlocked, with exponential backoff.
+
+    Only the files still locked are re-checked each round, and the wait ends
+    as soon as all are free or timeout seconds pass. Other keyword arguments
+    are passed to are_files_locked().
+
+    Args:
+        file_paths (str|Path|Iterable[str|Path]): The file or files to wait for.
+        timeout (float): Maximum seconds to wait.
+        initial_delay, max_delay (float): First and largest sleep in seconds.
+        factor (float): Growth of the sleep each round.
+        jitter (float): Random +/- fraction applied to each sleep.
+
+    Returns:
+        list[Path]: The files still locked at timeout, empty if all are free.
+    """
+    if isinstance(file_paths, (str, Path)):
+        file_paths = [file_paths]
+    deadline = time.monotonic() + timeout
+    delays = _backoff_delays(initial_delay, max_delay, factor, jitter)
+    pending = list(file_paths)
+    while True:
+        state = are_files_locked(pending, **kwargs)
+        pending = [p for p, locked in state.items() if locked]
+        remaining = deadline - time.monotonic()
+        if len(pending) == 0 or remaining <= 0:
+            return pending
+        time.sleep(min(next(delays), remaining))
+
+async def async_wait_until_unlocked(file_paths, timeout : float = 30.0,
+                                    initial_delay : float = 0.05,
+                                    max_delay : float = 2.0, factor : float = 2.0,
+                                    jitter : float = 0.1, **kwargs) -> list[Path]:
+    """p3_utils: asyncio version of wait_until_unlocked().
+
+    The lock checks run in a worker thread, so the event loop is not blocked.
+    """
+    if isinstance(file_paths, (str, Path)):
+        file_paths = [file_paths]
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delays = _backoff_delays(initial_delay, max_delay, factor, jitter)
+    pending = list(file_paths)
+    while True:
+        state = await asyncio.to_thread(are_files_locked, pending, **kwargs)
+        pending = [p for p, locked in state.items() if locked]
+        remaining = deadline - loop.time()
+        if len(pending) == 0 or remaining <= 0:
+            return pending
+        await asyncio.sleep(min(next(delays), remaining))
+#endregion wait_until_unlocked()
+# ---------------------------------------------------------------------------- +
+#region FolderWatcher class
+# inotify(7) events that change a folder listing or a file's size or mtime
+_IN_MODIFY, _IN_ATTRIB, _IN_CLOSE_WRITE = 0x002, 0x004, 0x008
+_IN_MOVED_FROM, _IN_MOVED_TO, _IN_CREATE, _IN_DELETE = 0x040, 0x080, 0x100, 0x200
+_IN_DELETE_SELF, _IN_MOVE_SELF = 0x400, 0x800
+_INOTIFY_MASK = (_IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM |
+                 _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF |
+                 _IN_MOVE_SELF)
+
+class FolderEvent(NamedTuple):
+    """p3_utils: A change seen by FolderWatcher.poll()."""
+    kind: str       # 'created', 'modified' or 'deleted'
+    path: Path
+    size: int       # -1 for 'deleted'
+    mtime_ns: int   # -1 for 'deleted'
+
+def _inotify_open(folder: Path) -> Optional[int]:
+    """p3_utils: Return a non-blocking inotify fd watching folder, or None."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return None
+        if libc.inotify_add_watch(fd, os.fsencode(folder), _INOTIFY_MASK) < 0:
+            os.close(fd)
+            return None
+        return fd
+    except (OSError, AttributeError):
+        return None
+
+class FolderWatcher:
+    """p3_utils: Watch a folder for created, modified and deleted files.
+
+    Each poll() lists the folder with os.scandir and diffs it against a
+    snapshot of (inode, size, mtime_ns) per name, in O(n) time. On Linux,
+    inotify is used when available, so poll() only lists the folder after
+    something in it changed.
+
+    Args:
+        folder (Path): The folder to watch, its subfolders are not watched.
+        pattern (str): Glob pattern of the names to watch, e.g. '*.csv'.
+        stable_for (float): Seconds a created or modified file must keep the
+            same size and mtime before its event is emitted, 0 to emit at
+            once. Use it to skip files that are still being written.
+        include_dirs (bool): Also report subfolders.
+        use_inotify (bool): Use inotify on Linux when available.
+    """
+    def __init__(self, folder: Path, pattern: str = "*", stable_for: float = 0.0,
+                 include_dirs: bool = False, use_inotify: bool = True) -> None:
+        self.folder = Path(folder)
+        self.pattern = pattern
+        self.stable_for = stable_for
+        self.include_dirs = include_dirs
+        self._inotify = _inotify_open(self.folder) if use_inotify else None
+        # name -> (inode, size, mtime_ns)
+        self.snapshot : dict[str, tuple[int, int, int]] = self._scan()
+        # name -> (kind, signature, monotonic time the signature was seen)
+        self._pending : dict[str, tuple[str, tuple[int, int, int], float]] = {}
+
+    def __enter__(self) -> "FolderWatcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the inotify descriptor, if any."""
+        if self._inotify is not None:
+            os.close(self._inotify)
+            self._inotify = None
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self._inotify is not None
+
+    def _scan(self) -> dict[str, tuple[int, int, int]]:
+        snapshot = {}
+        match_all = self.pattern in ("*", None)
+        try:
+            it = os.scandir(self.folder)
+        except FileNotFoundError:
+            self.close()  # the watch went with the folder, poll from now on
+            return snapshot
+        with it:
+            for entry in it:
+                if not match_all and not fnmatch.fnmatch(entry.name, self.pattern):
+                    continue
+                try:
+                    if not (entry.is_file() or
+                            (self.include_dirs and entry.is_dir())):
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue  # removed while listing
+                snapshot[entry.name] = (st.st_ino, st.st_size, st.st_mtime_ns)
+        return snapshot
+
+    def _changed(self) -> bool:
+        """Drain the inotify queue, return True if any event was queued."""
+        changed = False
+        while True:
+            try:
+                data = os.read(self._inotify, 65536)
+            except BlockingIOError:
+                return changed
+            except OSError:
+                self.close()
+                return True
+            if not data:
+                return changed
+            changed = True
+
+    def poll(self) -> list[FolderEvent]:
+        """p3_utils: Return the events since the last poll()."""
+        changed = self._changed() if self._inotify is not None else True
+        if not changed and not self._pending:
+            return []
+        old, new = self.snapshot, self._scan()
+        self.snapshot = new
+        now = time.monotonic()
+        events : list[FolderEvent] = []
+        for name, sig in new.items():
+            old_sig = old.get(name)
+            if old_sig == sig:
+                continue
+            kind = "created" if old_sig is None else "modified"
+            if self.stable_for <= 0:
+                events.append(FolderEvent(kind, self.folder / name, sig[1], sig[2]))
+                continue
+            pending = self._pending.get(name)
+            if pending is not None and pending[0] == "created":
+                kind = "created"  # not reported yet, still new to the caller
+            self._pending[name] = (kind, sig, now)
+        for name in old.keys() - new.keys():
+            pending = self._pending.pop(name, None)
+            if pending is None or pending[0] == "modified":
+                events.append(FolderEvent("deleted", self.folder / name, -1, -1))
+        for name, (kind, sig, seen) in list(self._pending.items()):
+            if name in new and new[name] == sig and now - seen >= self.stable_for:
+                del self._pending[name]
+                events.append(FolderEvent(kind, self.folder / name, sig[1], sig[2]))
+        return events
+
+    def watch(self, interval: float = 1.0, timeout: float = None):
+        """p3_utils: Yield events as they happen, polling every interval
+        seconds, until timeout seconds pass or forever if timeout is None."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            yield from self.poll()
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            time.sleep(interval if deadline is None else
+                       max(0.0, min(interval, deadline - time.monotonic())))
+#endregion FolderWatcher class
+# ---------------------------------------------------------------------------- +
+#region atomic_write() and AtomicWriteGroup class
+ATOMIC_WRITE_DURABILITY = ("none", "file", "full")
+ATOMIC_WRITE_BUFFERING = 1024 * 1024  # bytes buffered before a write()
+
+def _fsync_dir(folder: Path) -> None:
+    """p3_utils: fsync a folder, making the renames in it durable."""
+    if os.name == "nt":
+        return  # folders cannot be opened to fsync on Windows
+    fd = os.open(folder, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def _fsync_path(path: Path) -> None:
+    """p3_utils: fsync a closed file."""
+    fd = os.open(path, os.O_RDWR | getattr(os, "O_BINARY", 0))
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def _syncfs(path: Path) -> bool:
+    """p3_utils: Flush the whole filesystem holding path, Linux only."""
+    if not sys.platform.startswith("linux"):
+        return False
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return ctypes.CDLL(None, use_errno=True).syncfs(fd) == 0
+    except (OSError, AttributeError):
+        return False
+    finally:
+        os.close(fd)
+
+class AtomicWriteGroup:
+    """p3_utils: Commit the files of many atomic_write() calls together.
+
+    Files written with group=this are published when the group commits,
+    on leaving its with block: all temp files are fsync'ed in parallel
+    threads, renamed into place, then each folder is fsync'ed once. This
+    group commit amortizes the flushes that dominate durable small writes.
+    If the with block raises, no file is published.
+
+    Args:
+        durability (str): 'none', 'file' to fsync the files, or 'full' to
+            also fsync their folders after the renames.
+        workers (int): Threads running the fsyncs.
+        use_syncfs (bool): On Linux, flush each filesystem once with
+            syncfs() instead of fsync'ing each file. Faster for many files,
+            but it also flushes other writers' data.
+    """
+    def __init__(self, durability: str = "full", workers: int = 8,
+                 use_syncfs: bool = False) -> None:
+        if durability not in ATOMIC_WRITE_DURABILITY:
+            raise ValueError(f"durability must be one of "
+                             f"{ATOMIC_WRITE_DURABILITY}, not '{durability}'")
+        self.durability = durability
+        self.workers = max(1, workers)
+        self.use_syncfs = use_syncfs
+        self._pending : list[tuple[Path, Path]] = []  # (temp, final) paths
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "AtomicWriteGroup":
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+    def _add(self, tmp_path: Path, file_path: Path) -> None:
+        with self._lock:
+            self._pending.append((tmp_path, file_path))
+
+    def commit(self) -> list[Path]:
+        """p3_utils: Publish the pending files, return their paths."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        published = 0
+        try:
+            if self.durability != "none" and pending:
+                tmp_paths = [tmp for tmp, _ in pending]
+                if not (self.use_syncfs and all(_syncfs(folder) for folder in
+                        {tmp.parent for tmp in tmp_paths})):
+                    with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                        list(pool.map(_fsync_path, tmp_paths))
+            for tmp_path, file_path in pending:
+                fault_point("file.atomic_write")
+                os.replace(tmp_path, file_path)
+                invalidate_stat(file_path)
+                published += 1
+        except BaseException:
+            for tmp_path, _ in pending[published:]:
+                tmp_path.unlink(missing_ok=True)
+            raise
+        if self.durability == "full":
+            for folder in {file_path.parent for _, file_path in pending}:
+                _fsync_dir(folder)
+        return [file_path for _, file_path in pending]
+
+    def abort(self) -> None:
+        """p3_utils: Discard the pending files."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for tmp_path, _ in pending:
+            tmp_path.unlink(missing_ok=True)
+
+@contextmanager
+def atomic_write(file_path: Union[Path, str], mode: str = "w",
+                 encoding: str = "utf-8", newline: str = None,
+                 durability: str = "full",
+                 buffering: int = ATOMIC_WRITE_BUFFERING,
+                 group: AtomicWriteGroup = None, verify: bool = True):
+    """p3_utils: Write a file atomically, yielding a file object.
+
+    Writes go to a temp file in the same folder, which replaces file_path
+    only when the with block ends without an error, so readers see the old
+    or the new file, never a torn one. An existing file's permissions are
+    kept.
+
+    Args:
+        file_path (Path|str): The file to write.
+        mode (str): 'w' for text or 'wb' for bytes.
+        encoding, newline (str): As for open(), text mode only.
+        durability (str): 'none' leaves flushing to the OS, 'file' fsyncs
+            the file before the rename, 'full' also fsyncs the folder after
+            it, so the rename survives a crash.
+        buffering (int): Bytes buffered between write() syscalls.
+        group (AtomicWriteGroup): Defer the fsyncs and rename to the group's
+            commit, which then sets the durability.
+        verify (bool): Check file_path with verify_file_path_for_save().
+    """
+    if mode not in ("w", "wb"):
+        raise ValueError(f"mode must be 'w' or 'wb', not '{mode}'")
+    if durability not in ATOMIC_WRITE_DURABILITY:
+        raise ValueError(f"durability must be one of "
+                         f"{ATOMIC_WRITE_DURABILITY}, not '{durability}'")
+    file_path = Path(file_path)
+    if verify:
+        verify_file_path_for_save(file_path)
+    tmp_path = file_path.with_name(f".{file_path.name}.{gen_hex_id()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL |
+                 getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(file_path).st_mode))
+        except FileNotFoundError:
+            pass  # a new file, created with the umask applied
+        binary = mode == "wb"
+        f = os.fdopen(fd, mode, buffering=buffering,
+                      encoding=None if binary else encoding,
+                      newline=None if binary else newline)
+    except BaseException:
+        os.close(fd)
+        tmp_path.unlink(missing_ok=True)
+        raise
+    try:
+        with f:
+            yield f
+            if group is None and durability != "none":
+                f.flush()
+                os.fsync(f.fileno())
+        if group is not None:
+            group._add(tmp_path, file_path)
+            return
+        fault_point("file.atomic_write")
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    invalidate_stat(file_path)
+    if durability == "full":
+        _fsync_dir(file_path.parent)
+#endregion atomic_write() and AtomicWriteGroup class
+# ---------------------------------------------------------------------------- +
+#region read_csv_columns()
+CSV_CHUNK_SIZE = 64 * 1024 * 1024      # bytes of csv parsed per task
+CSV_PARALLEL_MIN_SIZE = 128 * 1024 * 1024  # smaller files are read in-process
+
+def _csv_record_start(mm: mmap.mmap, pos: int, in_quote: bool) -> int:
+    """p3_utils: Return the start of the first csv record after pos.
+
+    in_quote is whether pos is inside a quoted field. A '""' escape toggles
+    the state twice, so only the parity of quotes matters.
+    """
+    size = len(mm)
+    while pos < size:
+        if in_quote:
+            q = mm.find(b'"', pos)
+            if q < 0:
+                return size
+            in_quote, pos = False, q + 1
+            continue
+        nl = mm.find(b"\n", pos)
+        q = mm.find(b'"', pos, nl if nl >= 0 else size)
+        if q < 0:
+            return nl + 1 if nl >= 0 else size
+        in_quote, pos = True, q + 1
+    return size
+
+def _csv_chunk_bounds(mm: mmap.mmap, start: int, chunk_size: int) -> list[int]:
+    """p3_utils: Split mm[start:] at record starts about chunk_size apart."""
+    bounds = [start]
+    quotes, counted = 0, start  # quotes in mm[start:counted]
+    cut = start + chunk_size
+    has_quotes = mm.find(b'"', start) >= 0
+    while cut < len(mm):
+        if has_quotes:
+            for i in range(counted, cut, chunk_size):
+                quotes += mm[i:min(i + chunk_size, cut)].count(b'"')
+            counted = cut
+        bound = _csv_record_start(mm, cut, quotes % 2 == 1)
+        if bound >= len(mm):
+            break
+        bounds.append(bound)
+        if has_quotes:
+            quotes += mm[counted:bound].count(b'"')
+            counted = bound
+        cut = bound + chunk_size
+    bounds.append(len(mm))
+    return bounds
+
+def _convert_column(values: list[str], dtype: Any, as_numpy: bool):
+    """p3_utils: Convert a column of strings to dtype, as a list or array."""
+    if as_numpy:
+        array = np.array(values, dtype=str)
+        return array if dtype is None else array.astype(dtype)
+    if dtype is None or dtype is str:
+        return values
+    return list(map(dtype, values))
+
+@functools.lru_cache(maxsize=32)
+def _csv_row_pattern(indexes: tuple[int, ...], delimiter: str) -> re.Pattern:
+    """p3_utils: Compile a regex capturing the fields at indexes of a record.
+
+    Fields up to the last wanted one are matched, quoted or not, then the
+    rest of the record as runs of text between paired quotes, so quoted
+    newlines in later fields are skipped too.
+    Nested optional groups let shorter rows match, with '' for missing
+    fields, and blank lines are skipped, as by csv.reader.
+    """
+    d = re.escape(delimiter)
+    field = f'(?:"[^"]*(?:""[^"]*)*"|[^{d}"\\r\\n]*)'
+    last = max(indexes)
+    rest = '[^"\\r\\n]*(?:"[^"]*"[^"\\r\\n]*)*'
+    inner = (f"({field})" if last in indexes else field) + rest
+    for i in range(last - 1, -1, -1):
+        inner = (f"({field})" if i in indexes else field) + f"(?:{d}{inner})?"
+    return re.compile(f"^(?!\\r?$){inner}", re.M)
+
+@functools.lru_cache(maxsize=32)
+def _csv_plain_pattern(indexes: tuple[int, ...], delimiter: bytes) -> re.Pattern:
+    """p3_utils: Compile a bytes regex capturing the fields at indexes of
+    an unquoted csv line, '' for missing fields, then skipping the rest of
+    it. Blank lines before the line are skipped, as by csv.reader."""
+    d = re.escape(delimiter)
+    field = b"[^" + d + b"\r\n]*"
+    last = max(indexes)
+    inner = b"(" + field + b")" if last in indexes else field
+    for i in range(last - 1, -1, -1):
+        inner = (b"(" + field + b")" if i in indexes else field) + \
+            b"(?:" + d + inner + b")?"
+    return re.compile(b"(?:\r?\n)*(?![\r\n])" + inner + b"[^\n]*\n")
+
+def _csv_split_columns(data: bytes, wanted: tuple[int, ...], delimiter: str,
+                       encoding: str) -> Optional[list[list[bytes]]]:
+    """p3_utils: Capture the fields at wanted of csv lines, undecoded.
+
+    One findall() of a regex for unquoted fields, one match per line, so
+    the rest of each line is skipped at C speed. The few lines holding
+    quotes, found with bytes.find(), are parsed again by csv.reader.
+    Returns None, to parse the data with the full regex instead, if a
+    quoted field holds a newline, there are quotes and blank lines, or the
+    data has NUL bytes or a mix of line endings.
+    """
+    if not data.endswith(b"\n"):
+        data += b"\n"
+    lines, crs = data.count(b"\n"), data.count(b"\r")
+    if b"\0" in data or crs not in (0, lines):
+        return None
+    rows = _csv_plain_pattern(wanted, delimiter.encode(encoding)).findall(data)
+    if len(wanted) == 1:
+        rows = [(v,) for v in rows] if b'"' in data else rows
+    if b'"' in data:
+        if len(rows) != lines:
+            return None  # blank lines, the quoted lines can't be numbered
+        pos, line_no, counted = 0, 0, 0
+        numbers, quoted = [], []
+        while (q := data.find(b'"', pos)) >= 0:
+            start = data.rfind(b"\n", 0, q) + 1
+            pos = data.find(b"\n", q)
+            line = data[start:pos]
+            if line.count(b'"') % 2 == 1:
+                return None  # a quoted newline, lines are not records
+            line_no += data.count(b"\n", counted, start)
+            counted = start
+            numbers.append(line_no)
+            quoted.append(line.decode(encoding))
+        for line_no, row in zip(numbers, csv.reader(quoted, delimiter=delimiter)):
+            rows[line_no] = tuple(row[i].encode(encoding) if i < len(row)
+                                  else b"" for i in wanted)
+    if len(wanted) == 1 and (not rows or type(rows[0]) is bytes):
+        return [rows]
+    return [list(map(itemgetter(k), rows)) for k in range(len(wanted))]
+
+def _convert_bytes_column(values: list[bytes], dtype: Any, encoding: str,
+                          as_numpy: bool):
+    """p3_utils: Convert a column of undecoded fields, with no NUL bytes."""
+    if not as_numpy and dtype in (int, float):
+        return list(map(dtype, values))  # int() and float() parse bytes
+    text = b"\0".join(values).decode(encoding).split("\0") if values else []
+    return _convert_column(text, dtype, as_numpy)
+
+def _csv_columns_chunk(file_path: str, start: int, end: int, indexes: list[int],
+                       dtypes: list[Any], delimiter: str, encoding: str,
+                       as_numpy: bool) -> list:
+    """p3_utils: Parse the columns at indexes of the records in [start, end).
+
+    Top-level, so it can run in a process pool. The wanted fields are
+    captured from the undecoded bytes and only they are decoded. If a
+    quoted field spans lines, one regex findall() over the decoded text
+    matches the records instead.
+    """
+    with open(file_path, "rb") as f, \
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data = mm[start:end]
+    wanted = tuple(sorted(set(indexes)))
+    fields = _csv_split_columns(data, wanted, delimiter, encoding)
+    if fields is not None:
+        return [_convert_bytes_column(fields[wanted.index(i)], dtype,
+                                      encoding, as_numpy)
+                for i, dtype in zip(indexes, dtypes)]
+    text = data.decode(encoding)
+    rows = _csv_row_pattern(wanted, delimiter).findall(text)
+    del text
+    fields = [rows] if len(wanted) == 1 else \
+        ([list(c) for c in zip(*rows)] if rows else [[] for _ in wanted])
+    if b'"' in data:
+        fields = [[v[1:-1].replace('""', '"') if v[:1] == '"' else v for v in c]
+                  if '"' in "\0".join(c) else c for c in fields]
+    return [_convert_column(fields[wanted.index(i)], dtype, as_numpy)
+            for i, dtype in zip(indexes, dtypes)]
+
+def read_csv_columns(file_path: Union[Path, str], columns: list[Union[str, int]],
+                     dtypes: dict = None, as_numpy: bool = False,
+                     workers: int = None, delimiter: str = ",",
+                     encoding: str = "utf-8", has_header: bool = True,
+                     chunk_size: int = CSV_CHUNK_SIZE) -> dict:
+    """p3_utils: Read only the given columns of a large csv file.
+
+    The file is mmap'ed and split into chunks at record starts, found from
+    the parity of the quotes before each cut, so quoted fields holding
+    delimiters, quotes or newlines are read correctly. Each chunk is parsed
+    by one regex over its bytes, capturing only the wanted fields, so only
+    they are decoded and converted. Chunks are parsed in parallel processes
+    for files of CSV_PARALLEL_MIN_SIZE bytes or more, in this process
+    otherwise, where it takes about as long as csv.reader.
+
+    Args:
+        file_path (Path|str): The csv file, in an ASCII-compatible encoding.
+        columns (list[str|int]): Header names or 0-based indexes to read.
+        dtypes (dict): Type to convert each column to, e.g. {"amount": float},
+            by column as given in columns. Columns default to str.
+        as_numpy (bool): Return NumPy arrays instead of lists.
+        workers (int): Processes parsing chunks, default os.cpu_count() for
+            files of CSV_PARALLEL_MIN_SIZE bytes or more, else 1.
+        delimiter (str): The field delimiter.
+        encoding (str): The text encoding.
+        has_header (bool): The first record names the columns.
+        chunk_size (int): Bytes of csv per parsing task.
+
+    Returns:
+        dict: Column (as given in columns) to list or NumPy array of values.
+    """
+    if as_numpy and np is None:
+        raise ValueError("as_numpy=True requires the 'numpy' package")
+    if len(columns) == 0:
+        raise ValueError("columns must name at least one column")
+    file_path = Path(file_path)
+    dtypes = dtypes or {}
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return {c: _convert_column([], dtypes.get(c), as_numpy) for c in columns}
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 3 if mm[:3] == b"\xef\xbb\xbf" else 0  # utf-8 BOM
+            header : list[str] = []
+            if has_header:
+                end = _csv_record_start(mm, start, False)
+                header = next(csv.reader(io.StringIO(
+                    mm[start:end].decode(encoding), newline=""),
+                    delimiter=delimiter), [])
+                start = end
+            bounds = _csv_chunk_bounds(mm, start, chunk_size)
+            size = len(mm)
+    indexes = []
+    for c in columns:
+        if isinstance(c, int) and c >= 0:
+            indexes.append(c)
+        elif c in header:
+            indexes.append(header.index(c))
+        else:
+            raise ValueError(f"column '{c}' is not in the header of {file_path}")
+    column_dtypes = [dtypes.get(c) for c in columns]
+    tasks = [(str(file_path), a, b, indexes, column_dtypes, delimiter, encoding,
+              as_numpy) for a, b in zip(bounds, bounds[1:]) if b > a]
+    if workers is None:
+        workers = (os.cpu_count() or 1) if size >= CSV_PARALLEL_MIN_SIZE else 1
+    if workers > 1 and len(tasks) > 1:
+        # spawn, as forking a process running threads can deadlock
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks)),
+                mp_context=multiprocessing.get_context("spawn")) as pool:
+            parts = list(pool.map(_csv_columns_chunk, *zip(*tasks)))
+    else:
+        parts = [_csv_columns_chunk(*task) for task in tasks]
+    result = {}
+    for k, c in enumerate(columns):
+        chunks = [part[k] for part in parts]
+        if as_numpy:
+            result[c] = np.concatenate(chunks) if chunks else \
+                _convert_column([], column_dtypes[k], True)
+        else:
+            result[c] = chunks[0] if chunks else []
+            for chunk in chunks[1:]:
+                result[c].extend(chunk)
+    return result
+#endregion read_csv_columns()
+# ---------------------------------------------------------------------------- +
 #region is_filename_only(path_str: str = None) -> bool
 def is_filename_only(path_str: str = None) -> bool:
     """p3_utils: Check path_str as name of file only, no parent. """
@@ -186,7 +1667,7 @@ def is_valid_path(value_name:str,value:Path,test:bool = True,raise_error:bool=Tr
         if raise_error:
             raise TypeError(f"Invalid {value_name}: type='{type(value).__name__}', value='{value}'")
         return False
-    if test and not value.exists():
+    if test and not path_exists(value):
         if raise_error:
             raise FileNotFoundError(f"{value_name} does not exist: {value}")
         return False
@@ -0,0 +1,290 @@
+# ---------------------------------------------------------------------------- +
+#region p3_folder_index.py
+""" Persistent index of folder names below a root folder.
+
+    FolderIndex - On-disk (sqlite) index of folder names to paths for a root.
+
+    Explanation:
+    ------------
+    Repeated find_folder() calls walk the same trees again and again. A
+    FolderIndex scans the tree once, in parallel threads, and keeps the
+    folders in a sqlite file shared by all processes using the same root.
+    Lookups are dict hits on an in-memory copy of the index.
+
+    Refreshes are incremental: a folder's mtime changes when entries are
+    added to or removed from it, so only folders whose mtime changed are
+    listed again, plus any new subtrees. The staleness policy is max_age,
+    the seconds after which a lookup first refreshes the index.
+
+    Writers serialize on a sqlite 'BEGIN IMMEDIATE' transaction in WAL mode,
+    and a generation counter tells a process its in-memory copy is behind
+    another process's refresh.
+"""
+#endregion p3_folder_index.py
+# ---------------------------------------------------------------------------- +
+#region Imports
+# python standard library modules and packages
+import fnmatch, json, os, sqlite3, time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+# local modules and packages
+from .p3_common_utils import gen_hash_key
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals and Constants
+FOLDER_INDEX_MAX_AGE = 300.0   # default seconds before a lookup refreshes
+FOLDER_INDEX_TIMEOUT = 60.0    # seconds to wait for another process's refresh
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirs (
+    path TEXT PRIMARY KEY, name TEXT NOT NULL, parent TEXT,
+    depth INTEGER NOT NULL, mtime_ns INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+"""
+#endregion Globals and Constants
+# ---------------------------------------------------------------------------- +
+#region _list_subdirs()
+def _list_subdirs(folder: str, exclude: list[str],
+                  follow_symlinks: bool) -> tuple[Optional[int], list[str]]:
+    """p3_utils: Return (mtime_ns, subfolder paths) of folder, (None, []) if gone."""
+    try:
+        mtime_ns = os.stat(folder).st_mtime_ns
+        it = os.scandir(folder)
+    except OSError:
+        return None, []
+    subdirs : list[str] = []
+    with it:
+        for entry in it:
+            try:
+                if not entry.is_dir(follow_symlinks=follow_symlinks):
+                    continue
+            except OSError:
+                continue
+            if exclude and any(fnmatch.fnmatch(entry.name, p) for p in exclude):
+                continue
+            subdirs.append(entry.path)
+    return mtime_ns, subdirs
+#endregion _list_subdirs()
+# ---------------------------------------------------------------------------- +
+#region FolderIndex class
+class FolderIndex:
+    """p3_utils: Persistent index of folder names to paths below root.
+
+    Args:
+        root (Path): The folder to index, default is the user's home folder.
+        index_path (Path): The sqlite file, default is in ~/.cache/p3_utils,
+            named by a hash of root and the walk options.
+        max_age (float): Seconds after a refresh before a lookup refreshes
+            again, None to refresh only when asked.
+        exclude (list[str]): Glob patterns of folder names not to index.
+        follow_symlinks (bool): Descend into symlinked folders.
+        workers (int): Threads listing folders during a refresh.
+    """
+    def __init__(self, root: Path = None, index_path: Path = None,
+                 max_age: Optional[float] = FOLDER_INDEX_MAX_AGE,
+                 exclude: list[str] = None, follow_symlinks: bool = False,
+                 workers: int = 8) -> None:
+        self.root = Path(root if root is not None else Path.home()).absolute()
+        self.exclude = list(exclude) if exclude else []
+        self.follow_symlinks = follow_symlinks
+        self.max_age = max_age
+        self.workers = max(1, workers)
+        self._params = json.dumps({"root": str(self.root), "exclude": self.exclude,
+                                   "follow_symlinks": follow_symlinks})
+        if index_path is None:
+            index_path = (Path.home() / ".cache" / "p3_utils" /
+                          f"folder_index_{gen_hash_key(self._params)}.sqlite")
+        self.index_path = Path(index_path)
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.index_path, timeout=FOLDER_INDEX_TIMEOUT,
+                                     isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._dirs : dict[str, tuple[int, int]] = {}    # path -> (mtime_ns, depth)
+        self._children : dict[str, set[str]] = {}
+        self._by_name : dict[str, list[str]] = {}       # normcase(name) -> paths
+        self._generation = -1
+        self._refreshed_at = 0.0
+        self._load()
+
+    #region context manager and close()
+    def __enter__(self) -> "FolderIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the sqlite connection."""
+        self._conn.close()
+    #endregion context manager and close()
+
+    #region in-memory copy
+    def _meta(self, key: str, default: str = None) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key=?",
+                                 (key,)).fetchone()
+        return row[0] if row is not None else default
+
+    def _add(self, path: str, mtime_ns: int, depth: int) -> None:
+        self._dirs[path] = (mtime_ns, depth)
+        parent = os.path.dirname(path)
+        if path != str(self.root):
+            self._children.setdefault(parent, set()).add(path)
+            name = os.path.normcase(os.path.basename(path))
+            self._by_name.setdefault(name, []).append(path)
+
+    def _remove_tree(self, path: str, deleted: set[str]) -> None:
+        stack = [path]
+        while stack:
+            p = stack.pop()
+            if self._dirs.pop(p, None) is None:
+                continue
+            deleted.add(p)
+            stack.extend(self._children.pop(p, ()))
+            self._children.get(os.path.dirname(p), set()).discard(p)
+            paths = self._by_name.get(os.path.normcase(os.path.basename(p)))
+            if paths is not None and p in paths:
+                paths.remove(p)
+
+    def _load(self) -> None:
+        """Load the in-memory copy from the index file, O(folders)."""
+        self._dirs.clear()
+        self._children.clear()
+        self._by_name.clear()
+        if self._meta("params") == self._params:
+            for path, mtime_ns, depth in self._conn.execute(
+                    "SELECT path, mtime_ns, depth FROM dirs ORDER BY depth, path"):
+                self._add(path, mtime_ns, depth)
+        self._generation = int(self._meta("generation", "0"))
+        self._refreshed_at = float(self._meta("refreshed_at", "0"))
+    #endregion in-memory copy
+
+    #region refresh()
+    def _scan_trees(self, tops: list[tuple[str, int]],
+                    upserts: dict[str, tuple[int, int]]) -> None:
+        """List every folder below tops, breadth first, in parallel threads."""
+        level = tops
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while level:
+                listed = pool.map(lambda item: _list_subdirs(
+                    item[0], self.exclude, self.follow_symlinks), level)
+                next_level = []
+                for (path, depth), (mtime_ns, subdirs) in zip(level, listed):
+                    if mtime_ns is None:
+                        continue
+                    self._add(path, mtime_ns, depth)
+                    upserts[path] = (mtime_ns, depth)
+                    next_level.extend((sub, depth + 1) for sub in subdirs
+                                      if sub not in self._dirs)
+                level = next_level
+
+    def refresh(self, force: bool = False) -> int:
+        """Bring the index up to date, return the number of folders listed.
+
+        Only folders whose mtime changed are listed again, unless the index
+        is empty or built with other options. Without force, nothing is done
+        if another process refreshed within max_age.
+        """
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if int(self._meta("generation", "0")) != self._generation or \
+                self._meta("params") != self._params:
+                self._load()
+            if not force and self._is_fresh():
+                conn.execute("COMMIT")
+                return 0
+            upserts : dict[str, tuple[int, int]] = {}
+            deleted : set[str] = set()
+            root = str(self.root)
+            if root not in self._dirs:
+                conn.execute("DELETE FROM dirs")
+                self._dirs.clear(); self._children.clear(); self._by_name.clear()
+                self._scan_trees([(root, 0)], upserts)
+            else:
+                # stat every folder, list again only those whose mtime changed
+                paths = list(self._dirs)
+                with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                    listed = list(pool.map(lambda p: _list_subdirs(
+                        p, self.exclude, self.follow_symlinks)
+                        if self._mtime_changed(p) else (False, None), paths))
+                new_tops : list[tuple[str, int]] = []
+                for path, (mtime_ns, subdirs) in zip(paths, listed):
+                    if mtime_ns is False or path in deleted:
+                        continue  # unchanged, or inside a removed subtree
+                    if mtime_ns is None:
+                        self._remove_tree(path, deleted)
+                        continue
+                    depth = self._dirs[path][1]
+                    self._dirs[path] = (mtime_ns, depth)
+                    upserts[path] = (mtime_ns, depth)
+                    old = self._children.get(path, set())
+                    for sub in old - set(subdirs):
+                        self._remove_tree(sub, deleted)
+                    new_tops.extend((sub, depth + 1) for sub in subdirs
+                                    if sub not in old)
+                self._scan_trees(new_tops, upserts)
+            deleted -= upserts.keys()
+            conn.executemany("DELETE FROM dirs WHERE path=?",
+                             ((p,) for p in deleted))
+            conn.executemany(
+                "INSERT OR REPLACE INTO dirs (path, name, parent, depth, mtime_ns) "
+                "VALUES (?, ?, ?, ?, ?)",
+                ((p, os.path.basename(p), os.path.dirname(p), d, m)
+                 for p, (m, d) in upserts.items()))
+            self._generation += 1
+            self._refreshed_at = time.time()
+            conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                             (("params", self._params),
+                              ("generation", str(self._generation)),
+                              ("refreshed_at", repr(self._refreshed_at))))
+            conn.execute("COMMIT")
+            return len(upserts)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            self._load()
+            raise
+
+    def _mtime_changed(self, path: str) -> bool:
+        try:
+            return os.stat(path).st_mtime_ns != self._dirs[path][0]
+        except OSError:
+            return True
+
+    def _is_fresh(self) -> bool:
+        if len(self._dirs) == 0:
+            return False
+        if self.max_age is None:
+            return True
+        return time.time() - self._refreshed_at < self.max_age
+    #endregion refresh()
+
+    #region lookups
+    def find_all(self, folder_name: str) -> list[Path]:
+        """Return all indexed folders matching folder_name, shallowest first.
+
+        folder_name may be a glob pattern, e.g. 'data_*'.
+        """
+        if not self._is_fresh() or \
+            int(self._meta("generation", "0")) != self._generation:
+            self.refresh()
+        if any(c in folder_name for c in "*?["):
+            pattern = os.path.normcase(folder_name)
+            paths = [p for name, ps in self._by_name.items()
+                     if fnmatch.fnmatchcase(name, pattern) for p in ps]
+        else:
+            paths = self._by_name.get(os.path.normcase(folder_name), [])
+        paths = sorted(paths, key=lambda p: (self._dirs[p][1], p))
+        return [Path(p) for p in paths]
+
+    def find(self, folder_name: str) -> Optional[Path]:
+        """Return the shallowest indexed folder matching folder_name, or None."""
+        paths = self.find_all(folder_name)
+        return paths[0] if paths else None
+
+    def __len__(self) -> int:
+        return max(0, len(self._dirs) - 1)  # the root is not a match
+    #endregion lookups
+#endregion FolderIndex class
+# ---------------------------------------------------------------------------- +
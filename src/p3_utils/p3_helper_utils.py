@@ -8,20 +8,36 @@ Helper functions for ISO 8601 timestamps and other common validation tests.
 #region Imports
 # ---------------------------------------------------------------------------- +
 # python standard library modules and packages
-import datetime,threading, os, inspect, sys, debugpy, typing, logging
+import datetime,threading, os, inspect, stat, sys, debugpy, typing, logging
+import bisect, collections, functools, heapq, itertools, math, re, time
+import warnings
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, unquote, quote
 from pathlib import Path, PurePath
-from typing import List, Any, Optional, Type, TypeAliasType
+from typing import (List, Any, Callable, Iterable, Iterator, NamedTuple,
+                    Optional, Sequence, Type, TypeAliasType, Union)
 
 # third-party modules and packages
 from .p3_print_output_utils import exc_err_msg, first_n
 from openpyxl import Workbook
+try:
+    import numpy as np
+except ImportError:  # optional, the batch ISO helpers parse row-wise
+    np = None
 
 # local modules and packages
+from .p3_stat_cache import (stat_cache_scope, cached_stat, path_exists,
+                            path_is_file)
 #endregion Imports
 # ---------------------------------------------------------------------------- +
 #region Globals and Constants
 logger = logging.getLogger(__name__)
+LOAD_FILE_SUFFIXES = (".csv", ".xlsx", ".xls", ".json", ".jsonc", ".txt", ".toml")
+SAVE_FILE_SUFFIXES = (".csv", ".xlsx", ".xls", ".json", ".jsonc")
+BULK_VERIFY_LIST_MIN = 8  # paths in one folder before the folder is listed
+ISO_PARSE_CACHE_SIZE = 1024  # parsed timestamps kept when the cache is set
+COARSE_CLOCK_GRANULARITY = 0.001  # seconds, a coarse clock's default step
 #endregion Globals and Constants
 # ---------------------------------------------------------------------------- +
 #region ISO 8601 Format helpers
@@ -37,6 +53,44 @@ logger = logging.getLogger(__name__)
 ATU_DEFAULT_DURATION = 0.5 # Default in hours for an activity entry
 ATU_DEFAULT_DURATION_MINUTES = ATU_DEFAULT_DURATION * 60.0 # Default in minutes
 ATU_DEFAULT_DURATION_SECONDS = ATU_DEFAULT_DURATION * 3600.0 # Default in seconds
+# All the helpers parse timestamps with _parse_iso(), once per call.
+# set_iso_parse_cache() adds an LRU cache of parsed datetimes, which are
+# immutable so callers can share them. It is off by default, as the C
+# fromisoformat() costs about as much as a cache lookup, but it pays off
+# with a slower parser or when one timestamp is parsed by many callers.
+_iso_parser = datetime.datetime.fromisoformat
+
+def set_iso_parse_cache(maxsize: int = ISO_PARSE_CACHE_SIZE) -> None:
+    """p3_utils: Set the size of the cache of parsed ISO timestamps, 0 for none."""
+    global _iso_parser
+    if not isinstance(maxsize, int) or maxsize < 0:
+        raise ValueError(f"maxsize must be an int >= 0, not '{maxsize}'")
+    _iso_parser = functools.lru_cache(maxsize=maxsize)(
+        datetime.datetime.fromisoformat) if maxsize else \
+        datetime.datetime.fromisoformat
+
+def iso_parse_cache_info() -> Optional[tuple]:
+    """p3_utils: Return hits, misses, maxsize and currsize of the parse cache."""
+    return _iso_parser.cache_info() if hasattr(_iso_parser, "cache_info") \
+        else None
+
+def _parse_iso(dt_str: str, strict: bool = True) -> datetime.datetime:
+    """p3_utils: Parse an ISO timestamp str, with the checks and errors of
+    validate_iso_date_string() if strict, else as datetime.fromisoformat()."""
+    if not strict:
+        return _iso_parser(dt_str)
+    if not isinstance(dt_str, str): 
+        t = type(dt_str).__name__
+        m = f"Requires str with valid ISO timestamp, not type: {t}"
+        raise TypeError(m)
+    if len(dt_str) < len("2023-10-01T12:00:00"):
+        m = f"Requires valid ISO format timestamp, not '{dt_str}'"
+        raise ValueError(m)
+    try:
+        return _iso_parser(dt_str)
+    except ValueError:
+        raise ValueError(f"Invalid ISO datetime str value: '{dt_str}'")
+
 def iso_date_string(dt: datetime.datetime) -> str:
     """p3_utils: Convert a datetime object to an ISO format string."""
     if not isinstance(dt, datetime.datetime):
@@ -60,7 +114,7 @@ def iso_date(dt_str: str) -> datetime.datetime:
     # check for None or empty string, default to current time
     if dt_str is None or len(dt_str) == 0: return now_iso_date()
     # .fromisoformat() raises ValueError if invalid
-    return datetime.datetime.fromisoformat(dt_str)
+    return _parse_iso(dt_str, strict=False)
 
 def confirm_iso_date(dt : datetime.datetime) -> bool:
     """p3_utils: Confirm that the input is a datetime object."""
@@ -72,27 +126,59 @@ def validate_iso_date_string(dt_str: str) -> bool:
     # Return True if valid
     # Otherwise raises TypeError or ValueError
     # parameter type validation, only nonzero length string is valid
-    if not isinstance(dt_str, str): 
-        t = type(dt_str).__name__
-        m = f"Requires str with valid ISO timestamp, not type: {t}"
-        raise TypeError(m)
-    if len(dt_str) < len("2023-10-01T12:00:00"):
-        m = f"Requires valid ISO format timestamp, not '{dt_str}'"
-        raise ValueError(m)
-    try:
-        # check for valid ISO date & time format string
-        datetime.datetime.fromisoformat(dt_str)
-        return True
-    except ValueError:
-        raise ValueError(f"Invalid ISO datetime str value: '{dt_str}'")
+    _parse_iso(dt_str)
+    return True
 
 def now_iso_date() -> datetime.datetime:
     """p3_utils: Return the current date and time."""
     return datetime.datetime.now()
 
+# now_iso_date_string(), and so current_timestamp(), is exact by default.
+# set_coarse_clock() makes it reuse the formatted time of each step of
+# granularity, cached per thread. Each step, in ns since the epoch, is at
+# least the latest step any thread has formatted, so steps never go
+# backwards in a process, even if the system clock is set back. The str is
+# local time, as datetime.now(), so like the exact clock it repeats an hour
+# when daylight saving time ends: only the UTC/epoch steps are monotonic.
+class _ClockLocal(threading.local):
+    cache = (0, 0, "")   # (until ns, granularity ns, ISO str)
+
+_clock_local = _ClockLocal()
+_clock_lock = threading.Lock()
+_clock_granularity_ns = 0   # 0 for the exact clock
+_clock_last_ns = 0          # the latest step formatted by any thread
+
+def set_coarse_clock(granularity: float = COARSE_CLOCK_GRANULARITY) -> None:
+    """p3_utils: Set the step in seconds of now_iso_date_string(), 0 for exact."""
+    global _clock_granularity_ns
+    if not isinstance(granularity, (int, float)) or \
+        not (granularity == 0 or granularity >= 1e-6):
+        m = f"granularity must be 0 or >= 1e-6 seconds, not '{granularity}'"
+        raise ValueError(m)
+    _clock_granularity_ns = round(granularity * 10**9)
+
+def _coarse_now(now: int, granularity: int) -> str:
+    """p3_utils: Format the step of now, not before the latest step, in
+    local time, so not monotonic across a DST fall-back."""
+    global _clock_last_ns
+    with _clock_lock:
+        step = max(now - now % granularity, _clock_last_ns)
+        _clock_last_ns = step
+    text = datetime.datetime.fromtimestamp(step // 10**9).replace(
+        microsecond=step // 1000 % 10**6).isoformat()
+    _clock_local.cache = (step + granularity, granularity, text)
+    return text
+
 def now_iso_date_string() -> str:
     """p3_utils: Return the current date and time in ISO format."""
-    return datetime.datetime.now().isoformat()
+    granularity = _clock_granularity_ns
+    if granularity == 0:
+        return datetime.datetime.now().isoformat()
+    now = time.time_ns()
+    until, step, text = _clock_local.cache
+    if now < until and step == granularity:
+        return text
+    return _coarse_now(now, granularity)
 
 def iso_date_approx(dt1:str, dt2:str, tolerance = 1) -> bool:
     """p3_utils: Compare two ISO date strings for approximate equality within a tolerance 
@@ -106,8 +192,8 @@ def iso_date_approx(dt1:str, dt2:str, tolerance = 1) -> bool:
     try:
         if dt1 is None or len(dt1) == 0: dt1 = current_timestamp() # default convert
         if dt2 is None or len(dt2) == 0: dt2 = current_timestamp() # default convert
-        d1 = iso_date(dt1)
-        d2 = iso_date(dt2)
+        d1 = _parse_iso(dt1, strict=False)
+        d2 = _parse_iso(dt2, strict=False)
         delta = abs((d2 - d1).total_seconds())
     except:
         raise ValueError(f"Error with dt1:'{dt1}' or dt2:'{dt2}'")
@@ -135,6 +221,791 @@ def to_float(value) -> float:
         raise
 #endregion ISO 8601 ISO 8601 Format helpers
 # ---------------------------------------------------------------------------- +
+#region Batch ISO 8601 helpers
+# iso_dates() and iso_strings() convert whole columns of timestamps. Bad
+# values do not raise, they are marked in the valid mask and listed in
+# errors. With NumPy, blocks of timestamps in the common form are parsed and
+# formatted as datetime64, the others are handled row-wise.
+ISO_BATCH_BLOCK = 4096  # values per block tried with NumPy by iso_dates()
+# Lines of timestamps in the common form, tried with NumPy by iso_dates()
+_ISO_BLOCK_RE = re.compile(
+    r"(?:\d{4}-\d\d-\d\d[T ]\d\d:\d\d:\d\d(?:\.\d{1,9})?\n)*", re.ASCII)
+
+class IsoBatch(NamedTuple):
+    """p3_utils: The result of iso_dates() and iso_strings()."""
+    values: Any         # list with None, or ndarray with NaT or '', if invalid
+    valid: Any          # list[bool], or a bool ndarray with as_numpy
+    errors: list[int]   # indexes of the invalid values
+
+def _iso_dates_block(block: list) -> Optional[Any]:
+    """p3_utils: Parse a block of ISO timestamp strs as datetime64[us].
+
+    Return None unless every value is a str in the fixed-width common
+    form, YYYY-MM-DD[T ]HH:MM:SS[.fraction], and not of year 0, to parse
+    the block row-wise. This keeps out what NumPy accepts and _parse_iso()
+    does not, such as a trailing '.', 5-digit years, signs and spaces.
+    Out of range fields raise in NumPy, and time zones are parsed row-wise.
+    """
+    if set(map(type, block)) != {str} or min(block) < "0001":
+        return None
+    lines = "\n".join(block) + "\n"
+    if lines.count("\n") != len(block) or not _ISO_BLOCK_RE.fullmatch(lines):
+        return None
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        try:
+            return np.array(block, dtype="datetime64[us]")
+        except (ValueError, Warning):
+            return None
+
+def _iso_date_or_none(value: Any) -> Optional[datetime.datetime]:
+    try:
+        return _parse_iso(value)
+    except (TypeError, ValueError):
+        return None
+
+def _datetime64(dt: Optional[datetime.datetime]) -> Any:
+    """p3_utils: Convert dt to datetime64[us], in UTC if it has a time zone.
+
+    The offset is subtracted in NumPy, as datetime.astimezone() overflows
+    for times within a day of year 1 or year 9999 that convert outside it.
+    """
+    if dt is None:
+        return np.datetime64("NaT", "us")
+    offset = dt.utcoffset()
+    value = np.datetime64(dt.replace(tzinfo=None), "us")
+    if offset:
+        value -= np.timedelta64(offset // datetime.timedelta(microseconds=1), "us")
+    return value
+
+def _iso_datetime64(values: list) -> tuple[Any, Any]:
+    """p3_utils: Parse values as datetime64[us], NaT where invalid.
+
+    Returns the array and a bool array marking the values with a time
+    zone, which are converted to UTC.
+    """
+    parts, aware = [], []
+    for i in range(0, len(values), ISO_BATCH_BLOCK):
+        block = values[i:i + ISO_BATCH_BLOCK]
+        parsed = _iso_dates_block(block)
+        if parsed is None:
+            dts = [_iso_date_or_none(v) for v in block]
+            parsed = np.array([_datetime64(dt) for dt in dts],
+                              dtype="datetime64[us]")
+            aware.append(np.array([dt is not None and dt.tzinfo is not None
+                                   for dt in dts], dtype=bool))
+        else:
+            aware.append(np.zeros(len(block), dtype=bool))
+        parts.append(parsed)
+    if not parts:
+        return np.array([], dtype="datetime64[us]"), np.array([], dtype=bool)
+    return np.concatenate(parts), np.concatenate(aware)
+
+def iso_dates(values: Sequence[str], as_numpy: bool = False) -> IsoBatch:
+    """p3_utils: Parse a column of ISO timestamp strs, marking invalid values.
+
+    A value is valid if validate_iso_date_string() accepts it.
+
+    Args:
+        values (Sequence[str]): The timestamps, other types are invalid.
+        as_numpy (bool): Return a datetime64[us] array, NaT where invalid,
+            with time zones converted to UTC. Else a list of datetimes,
+            None where invalid.
+
+    Returns:
+        IsoBatch: values, valid mask and error indexes.
+    """
+    if as_numpy and np is None:
+        raise ValueError("as_numpy=True requires the 'numpy' package")
+    values = values.tolist() if np is not None and \
+        isinstance(values, np.ndarray) else list(values)
+    if as_numpy:
+        result, _ = _iso_datetime64(values)
+        valid = ~np.isnat(result)
+        return IsoBatch(result, valid, np.flatnonzero(~valid).tolist())
+    parts = []
+    for i in range(0, len(values), ISO_BATCH_BLOCK):
+        block = values[i:i + ISO_BATCH_BLOCK]
+        parsed = None if np is None else _iso_dates_block(block)
+        parts.append([_iso_date_or_none(v) for v in block] if parsed is None
+                     else parsed.astype(object).tolist())
+    result = list(itertools.chain.from_iterable(parts))
+    valid = [dt is not None for dt in result]
+    return IsoBatch(result, valid, [i for i, ok in enumerate(valid) if not ok])
+
+def iso_strings(values: Sequence[datetime.datetime],
+                as_numpy: bool = False) -> IsoBatch:
+    """p3_utils: Format a column of datetimes as ISO strs, marking invalid values.
+
+    The strs are as iso_date_string() returns, with microseconds only if
+    not 0. A datetime64 array is formatted by NumPy, NaT is invalid.
+
+    Args:
+        values (Sequence[datetime]): datetimes, other types are invalid, or
+            a datetime64 array.
+        as_numpy (bool): Return an array of str, '' where invalid. Else a
+            list of str, None where invalid.
+
+    Returns:
+        IsoBatch: values, valid mask and error indexes.
+    """
+    if as_numpy and np is None:
+        raise ValueError("as_numpy=True requires the 'numpy' package")
+    if np is not None and isinstance(values, np.ndarray) and \
+        values.dtype.kind == "M":
+        us = values.astype("datetime64[us]")
+        nat = np.isnat(us)
+        whole = us.astype("int64") % 1_000_000 == 0
+        if whole.all():
+            text = np.datetime_as_string(us, unit="s")
+        elif not whole.any():
+            text = np.datetime_as_string(us, unit="us")
+        else:
+            text = np.where(whole, np.datetime_as_string(us, unit="s"),
+                            np.datetime_as_string(us, unit="us"))
+        text[nat] = ""
+        errors = np.flatnonzero(nat).tolist()
+        if as_numpy:
+            return IsoBatch(text, ~nat, errors)
+        result = text.tolist()
+        for i in errors:
+            result[i] = None
+        return IsoBatch(result, (~nat).tolist(), errors)
+    result = [v.isoformat() if isinstance(v, datetime.datetime) else None
+              for v in values]
+    valid = [v is not None for v in result]
+    errors = [i for i, ok in enumerate(valid) if not ok]
+    if as_numpy:
+        return IsoBatch(np.array([v or "" for v in result], dtype=str),
+                        np.array(valid, dtype=bool), errors)
+    return IsoBatch(result, valid, errors)
+#endregion Batch ISO 8601 helpers
+# ---------------------------------------------------------------------------- +
+#region Timestamp and TimeSpan classes
+# Value types for timestamp arithmetic without a str round-trip per step.
+# A Timestamp holds integer nanoseconds since the epoch, of the wall clock
+# if naive, else of UTC with the offset in seconds. Its ISO str is made when
+# first asked for, exactly as iso_date_string() makes it, so str(ts) can be
+# passed to the str-based helpers. Both types are immutable by convention,
+# their state is in underscore slots.
+_EPOCH = datetime.datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_NS_PER_UNIT = {"hours": 3600 * 10**9, "minutes": 60 * 10**9, "seconds": 10**9}
+
+def _new_timestamp(ns: int, offset: Optional[int]) -> "Timestamp":
+    ts = object.__new__(Timestamp)
+    ts._ns = ns
+    ts._offset = offset
+    ts._iso = None
+    return ts
+
+def _new_timespan(ns: int) -> "TimeSpan":
+    span = object.__new__(TimeSpan)
+    span._ns = ns
+    return span
+
+class TimeSpan:
+    """p3_utils: An immutable duration in integer nanoseconds.
+
+    TimeSpan(hours=1, minutes=30) is 90 minutes. Spans add, subtract,
+    negate, multiply and divide by numbers, divide by spans, and compare.
+    """
+    __slots__ = ("_ns",)
+
+    def __init__(self, hours: float = 0, minutes: float = 0, seconds: float = 0,
+                 ns: int = 0) -> None:
+        total = hours * 3600 * 10**9 + minutes * 60 * 10**9 + \
+            seconds * 10**9 + ns
+        self._ns = total if type(total) is int else round(total)
+
+    @classmethod
+    def from_timedelta(cls, td: datetime.timedelta) -> "TimeSpan":
+        """p3_utils: Return the TimeSpan of a datetime.timedelta."""
+        return _new_timespan(((td.days * 86400 + td.seconds) * 10**6 +
+                              td.microseconds) * 1000)
+
+    @property
+    def ns(self) -> int:
+        return self._ns
+
+    def total(self, unit: str = "hours") -> float:
+        """p3_utils: Return the span in hours, minutes or seconds, as
+        calculate_duration() would."""
+        if unit not in _NS_PER_UNIT:
+            m = f"unit must be one of {tuple(_NS_PER_UNIT)}, not '{unit}'"
+            raise ValueError(m)
+        seconds = self._ns / 10**9
+        if unit == "hours": return seconds / (60.0 * 60.0)
+        if unit == "minutes": return seconds / 60.0
+        return seconds
+
+    def to_timedelta(self) -> datetime.timedelta:
+        """p3_utils: Return the span as a timedelta, in whole microseconds."""
+        return datetime.timedelta(microseconds=self._ns // 1000)
+
+    def __add__(self, other):
+        if type(other) is TimeSpan:
+            return _new_timespan(self._ns + other._ns)
+        if type(other) is Timestamp:
+            return other + self
+        return NotImplemented
+
+    def __sub__(self, other):
+        if type(other) is TimeSpan:
+            return _new_timespan(self._ns - other._ns)
+        return NotImplemented
+
+    def __mul__(self, factor):
+        if isinstance(factor, (int, float)):
+            return _new_timespan(round(self._ns * factor))
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if type(other) is TimeSpan:
+            return self._ns / other._ns
+        if isinstance(other, (int, float)):
+            return _new_timespan(round(self._ns / other))
+        return NotImplemented
+
+    def __neg__(self) -> "TimeSpan":
+        return _new_timespan(-self._ns)
+
+    def __abs__(self) -> "TimeSpan":
+        return _new_timespan(abs(self._ns))
+
+    def __bool__(self) -> bool:
+        return self._ns != 0
+
+    def __eq__(self, other) -> bool:
+        if type(other) is TimeSpan:
+            return self._ns == other._ns
+        return NotImplemented
+
+    def __lt__(self, other) -> bool:
+        if type(other) is TimeSpan:
+            return self._ns < other._ns
+        return NotImplemented
+
+    def __le__(self, other) -> bool:
+        if type(other) is TimeSpan:
+            return self._ns <= other._ns
+        return NotImplemented
+
+    def __gt__(self, other) -> bool:
+        if type(other) is TimeSpan:
+            return self._ns > other._ns
+        return NotImplemented
+
+    def __ge__(self, other) -> bool:
+        if type(other) is TimeSpan:
+            return self._ns >= other._ns
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._ns)
+
+    def __repr__(self) -> str:
+        return f"TimeSpan(ns={self._ns})"
+
+class Timestamp:
+    """p3_utils: An immutable point in time in integer nanoseconds.
+
+    Timestamp(value) takes an ISO timestamp str, checked as by
+    validate_iso_date_string(), a datetime or a Timestamp, and None for
+    the current time. Adding or subtracting a TimeSpan gives a Timestamp,
+    subtracting a Timestamp gives a TimeSpan. As with datetimes, naive and
+    time zone aware Timestamps are never equal and do not order.
+    """
+    __slots__ = ("_ns", "_offset", "_iso")
+
+    def __init__(self, value: Union[str, datetime.datetime, "Timestamp",
+                                    None] = None) -> None:
+        if type(value) is Timestamp:
+            self._ns, self._offset, self._iso = \
+                value._ns, value._offset, value._iso
+            return
+        if value is None:
+            dt = datetime.datetime.now()
+        elif isinstance(value, datetime.datetime):
+            dt = value
+        else:
+            dt = _parse_iso(value)  # raises TypeError or ValueError
+        seconds = (dt.toordinal() - _EPOCH_ORDINAL) * 86400 + \
+            dt.hour * 3600 + dt.minute * 60 + dt.second
+        if dt.tzinfo is None:
+            self._offset = None
+        else:
+            offset = dt.utcoffset()
+            self._offset = offset.days * 86400 + offset.seconds
+            seconds -= self._offset
+        self._ns = (seconds * 10**6 + dt.microsecond) * 1000
+        self._iso = None
+
+    @classmethod
+    def from_ns(cls, ns: int, offset: Optional[int] = None) -> "Timestamp":
+        """p3_utils: Return the Timestamp ns nanoseconds after the epoch, of
+        UTC with offset seconds, or of the wall clock if offset is None."""
+        return _new_timestamp(int(ns), offset)
+
+    @property
+    def ns(self) -> int:
+        return self._ns
+
+    @property
+    def offset(self) -> Optional[int]:
+        """p3_utils: The UTC offset in seconds, None if naive."""
+        return self._offset
+
+    def to_datetime(self) -> datetime.datetime:
+        """p3_utils: Return the datetime, in whole microseconds."""
+        if self._offset is None:
+            return _EPOCH + datetime.timedelta(microseconds=self._ns // 1000)
+        tz = datetime.timezone(datetime.timedelta(seconds=self._offset))
+        return (_EPOCH + datetime.timedelta(
+            microseconds=self._ns // 1000 + self._offset * 10**6)).replace(tzinfo=tz)
+
+    def isoformat(self) -> str:
+        """p3_utils: Return the ISO str, as iso_date_string() would."""
+        if self._iso is None:
+            self._iso = self.to_datetime().isoformat()
+        return self._iso
+
+    __str__ = isoformat
+
+    def _same_kind(self, other: "Timestamp") -> None:
+        if (self._offset is None) != (other._offset is None):
+            raise TypeError("can't compare offset-naive and offset-aware "
+                            "timestamps")
+
+    def __add__(self, other):
+        if type(other) is TimeSpan:
+            return _new_timestamp(self._ns + other._ns, self._offset)
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if type(other) is TimeSpan:
+            return _new_timestamp(self._ns - other._ns, self._offset)
+        if type(other) is Timestamp:
+            self._same_kind(other)
+            return _new_timespan(self._ns - other._ns)
+        return NotImplemented
+
+    def __eq__(self, other) -> bool:
+        if type(other) is Timestamp:
+            return self._ns == other._ns and \
+                (self._offset is None) == (other._offset is None)
+        return NotImplemented
+
+    def __lt__(self, other) -> bool:
+        if type(other) is Timestamp:
+            self._same_kind(other)
+            return self._ns < other._ns
+        return NotImplemented
+
+    def __le__(self, other) -> bool:
+        if type(other) is Timestamp:
+            self._same_kind(other)
+            return self._ns <= other._ns
+        return NotImplemented
+
+    def __gt__(self, other) -> bool:
+        if type(other) is Timestamp:
+            self._same_kind(other)
+            return self._ns > other._ns
+        return NotImplemented
+
+    def __ge__(self, other) -> bool:
+        if type(other) is Timestamp:
+            self._same_kind(other)
+            return self._ns >= other._ns
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._ns)
+
+    def __repr__(self) -> str:
+        return f"Timestamp('{self.isoformat()}')"
+#endregion Timestamp and TimeSpan classes
+# ---------------------------------------------------------------------------- +
+#region IntervalIndex class
+INTERVAL_INDEX_BUFFER = 64  # fewest pending add()s before they are merged
+_US_MIN = -(2**63)          # below any stop, pads the tree of stops
+
+def _timestamps_us(values: Sequence) -> tuple[array, set[bool]]:
+    """p3_utils: Return the Timestamps of values in microseconds, and the
+    set of whether each has a time zone. Raises as Timestamp() for the
+    first bad value."""
+    if np is not None and isinstance(values, np.ndarray) and \
+        values.dtype.kind == "M":
+        us = values.astype("datetime64[us]")
+        if np.isnat(us).any():
+            i = int(np.flatnonzero(np.isnat(us))[0])
+            raise ValueError(f"Invalid timestamp NaT at index {i}")
+        return array("q", us.astype(np.int64).tobytes()), \
+            {False} if len(us) else set()
+    values = values.tolist() if np is not None and \
+        isinstance(values, np.ndarray) else list(values)
+    if np is None:
+        stamps = [Timestamp(v) for v in values]
+        return array("q", [t._ns // 1000 for t in stamps]), \
+            {t._offset is not None for t in stamps}
+    parsed, aware = _iso_datetime64(values)
+    bad = np.isnat(parsed)
+    us = array("q", np.where(bad, 0, parsed.astype(np.int64)).tobytes())
+    aware = aware.tolist()
+    for i in np.flatnonzero(bad).tolist():
+        t = Timestamp(values[i])   # a datetime or Timestamp, else raises
+        us[i], aware[i] = t._ns // 1000, t._offset is not None
+    return us, set(aware)
+
+class IntervalIndex:
+    """p3_utils: Index of closed [start, stop] time intervals.
+
+    Built in bulk from columns of starts and stops, as ISO timestamp strs,
+    datetimes, Timestamps or datetime64 arrays, with an id per interval,
+    by default its row. Queries return the ids of the matching intervals,
+    in order of start, in O(log n + k) for k matches, except within(),
+    which scans the m intervals starting in the window, O(log n + m):
+
+        overlapping(start, stop) - intervals sharing any time with the window
+        at(t) - intervals holding the point in time t
+        containing(start, stop) - intervals holding the whole window
+        within(start, stop) - intervals inside the window
+
+    The intervals are kept sorted by start, in arrays of microseconds, with
+    a tree of the greatest stop of each range of them, so a query bisects
+    the starts and descends only into ranges with a stop late enough.
+    add() puts an interval in a pending list, scanned by queries, merged
+    in once it holds more than sqrt(n), at least INTERVAL_INDEX_BUFFER,
+    intervals. extend() adds columns of intervals at once.
+
+    All intervals are naive, or all have a time zone, as timestamps of both
+    kinds do not compare. The first interval added sets the kind, queries
+    of the other kind raise TypeError, and any query of an empty index
+    returns [].
+    """
+    def __init__(self, starts: Sequence = (), stops: Sequence = (),
+                 ids: Optional[Sequence] = None) -> None:
+        if len(starts) != len(stops):
+            m = f"starts and stops differ in length, {len(starts)} != {len(stops)}"
+            raise ValueError(m)
+        ids = list(range(len(starts))) if ids is None else list(ids)
+        if len(ids) != len(starts):
+            m = f"ids and starts differ in length, {len(ids)} != {len(starts)}"
+            raise ValueError(m)
+        start_us, start_aware = _timestamps_us(starts)
+        stop_us, stop_aware = _timestamps_us(stops)
+        kinds = start_aware | stop_aware
+        if len(kinds) > 1:
+            raise TypeError("can't mix offset-naive and offset-aware timestamps")
+        self._aware : Optional[bool] = kinds.pop() if kinds else None
+        for i, (a, b) in enumerate(zip(start_us, stop_us)):
+            if b < a:
+                raise ValueError(f"stop is before start for interval {ids[i]}")
+        order = sorted(range(len(ids)), key=start_us.__getitem__)
+        self._starts = array("q", [start_us[i] for i in order])
+        self._stops = array("q", [stop_us[i] for i in order])
+        self._ids = [ids[i] for i in order]
+        self._pending : list[tuple[int, int, Any]] = []
+        self._build_tree()
+
+    def _build_tree(self) -> None:
+        """p3_utils: Build the levels of greatest stops, pairs of rows up."""
+        n = len(self._stops)
+        size = 1 << max(n - 1, 0).bit_length()
+        level = self._stops + array("q", [_US_MIN]) * (size - n)
+        self._tree = [level]
+        while len(level) > 1:
+            if np is not None:
+                pairs = np.frombuffer(level, dtype=np.int64).reshape(-1, 2)
+                level = array("q", pairs.max(axis=1).tobytes())
+            else:
+                level = array("q", [a if a > b else b
+                                    for a, b in zip(level[0::2], level[1::2])])
+            self._tree.append(level)
+
+    def _window(self, start: Any, stop: Any,
+                adding: bool = False) -> tuple[int, int]:
+        """p3_utils: Return start and stop in microseconds. Only adding
+        sets the kind, naive or aware, of an empty index."""
+        start_t, stop_t = Timestamp(start), Timestamp(stop)
+        aware = start_t._offset is not None
+        if (stop_t._offset is not None) != aware or \
+            (self._aware is not None and aware != self._aware):
+            raise TypeError("can't compare offset-naive and offset-aware "
+                            "timestamps")
+        a, b = start_t._ns // 1000, stop_t._ns // 1000
+        if b < a:
+            raise ValueError(f"stop '{stop}' is before start '{start}'")
+        if adding and self._aware is None:
+            self._aware = aware
+        return a, b
+
+    def add(self, start: Any, stop: Any, id: Any = None) -> None:
+        """p3_utils: Add the interval [start, stop], id default its row."""
+        a, b = self._window(start, stop, adding=True)
+        self._pending.append((a, b, len(self) if id is None else id))
+        if len(self._pending) > max(INTERVAL_INDEX_BUFFER,
+                                    math.isqrt(len(self._starts))):
+            self._merge_pending()
+
+    def extend(self, starts: Sequence, stops: Sequence,
+               ids: Optional[Sequence] = None) -> None:
+        """p3_utils: Add columns of intervals, as the constructor takes."""
+        more = IntervalIndex(starts, stops, ids if ids is not None else
+                             range(len(self), len(self) + len(starts)))
+        if more._aware is not None and self._aware is not None and \
+            more._aware != self._aware:
+            raise TypeError("can't mix offset-naive and offset-aware timestamps")
+        if self._aware is None:
+            self._aware = more._aware
+        self._pending.extend(zip(more._starts, more._stops, more._ids))
+        if len(self._pending) > max(INTERVAL_INDEX_BUFFER,
+                                    math.isqrt(len(self._starts))):
+            self._merge_pending()
+
+    def _merge_pending(self) -> None:
+        """p3_utils: Splice the sorted pending rows into the sorted rows."""
+        pending = sorted(self._pending, key=lambda row: row[0])
+        cuts = [bisect.bisect_right(self._starts, row[0]) for row in pending]
+
+        def spliced(rows, column: int):
+            out, done = rows[:0], 0
+            for cut, row in zip(cuts, pending):
+                out += rows[done:cut]
+                out.append(row[column])
+                done = cut
+            out += rows[done:]
+            return out
+
+        self._starts = spliced(self._starts, 0)
+        self._stops = spliced(self._stops, 1)
+        self._ids = spliced(self._ids, 2)
+        self._pending = []
+        self._build_tree()
+
+    def _stops_from(self, end: int, bound: int) -> list[int]:
+        """p3_utils: Return the rows before end with a stop >= bound."""
+        rows, tree = [], self._tree
+        stack = [(len(tree) - 1, 0)]    # (level, index), the top
+        while stack:
+            level, i = stack.pop()
+            if i << level >= end or tree[level][i] < bound:
+                continue
+            if level == 0:
+                rows.append(i)
+                continue
+            stack.append((level - 1, 2 * i + 1))
+            stack.append((level - 1, 2 * i))
+        return rows
+
+    def _query(self, rows: list[int], pending: Iterable) -> list:
+        found = [(self._starts[i], self._ids[i]) for i in rows]
+        more = sorted((row[0], row[2]) for row in pending) if self._pending \
+            else []
+        if more:
+            found = heapq.merge(found, more, key=lambda row: row[0])
+        return [id for _, id in found]
+
+    def overlapping(self, start: Any, stop: Any) -> list:
+        """p3_utils: Return the ids of intervals sharing time with [start, stop]."""
+        a, b = self._window(start, stop)
+        rows = self._stops_from(bisect.bisect_right(self._starts, b), a)
+        return self._query(rows, (r for r in self._pending
+                                  if r[0] <= b and r[1] >= a))
+
+    def at(self, t: Any) -> list:
+        """p3_utils: Return the ids of intervals holding the point in time t."""
+        return self.overlapping(t, t)
+
+    def containing(self, start: Any, stop: Any) -> list:
+        """p3_utils: Return the ids of intervals holding all of [start, stop]."""
+        a, b = self._window(start, stop)
+        rows = self._stops_from(bisect.bisect_right(self._starts, a), b)
+        return self._query(rows, (r for r in self._pending
+                                  if r[0] <= a and r[1] >= b))
+
+    def within(self, start: Any, stop: Any) -> list:
+        """p3_utils: Return the ids of intervals inside [start, stop].
+
+        Scans the intervals starting in the window, as the tree of stops
+        does not bound stops from above, so it is O(log n + m) for the m
+        intervals starting in [start, stop], not for the k matches.
+        """
+        a, b = self._window(start, stop)
+        rows = [i for i in range(bisect.bisect_left(self._starts, a),
+                                 bisect.bisect_right(self._starts, b))
+                if self._stops[i] <= b]
+        return self._query(rows, (r for r in self._pending
+                                  if r[0] >= a and r[1] <= b))
+
+    def merged(self) -> list[tuple[Timestamp, Timestamp]]:
+        """p3_utils: Return the unions of overlapping or touching intervals,
+        as (start, stop) Timestamps in order, in UTC if time zone aware."""
+        if self._pending:
+            self._merge_pending()
+        offset = 0 if self._aware else None
+        spans : list[tuple[Timestamp, Timestamp]] = []
+        low = high = None
+        for a, b in zip(self._starts, self._stops):
+            if high is not None and a <= high:
+                if b > high:
+                    high = b
+                continue
+            if high is not None:
+                spans.append((_new_timestamp(low * 1000, offset),
+                              _new_timestamp(high * 1000, offset)))
+            low, high = a, b
+        if high is not None:
+            spans.append((_new_timestamp(low * 1000, offset),
+                          _new_timestamp(high * 1000, offset)))
+        return spans
+
+    def __len__(self) -> int:
+        return len(self._starts) + len(self._pending)
+#endregion IntervalIndex class
+# ---------------------------------------------------------------------------- +
+#region join_within() merge-join of timestamp series
+# join_within() matches the events of two sources whose timestamps are at
+# most a tolerance apart, as iso_date_approx() would for every pair, in one
+# pass over both. The right items within the tolerance of the current left
+# item are held in a window, so memory is bounded by how many events fall
+# in twice the tolerance, not by the length of the inputs.
+def _tolerance_ns(tolerance: Union[int, float]) -> int:
+    if isinstance(tolerance, bool) or not isinstance(tolerance, (int, float)):
+        t = type(tolerance).__name__
+        raise TypeError(f"Tolerance must be type: integer|float, not type:{t}")
+    if not tolerance >= 0:
+        raise ValueError(f"Tolerance must be >= 0 seconds, not {tolerance}")
+    return round(tolerance * 10**9)
+
+def join_within(left: Iterable, right: Iterable,
+                tolerance: Union[int, float] = 1,
+                key: Optional[Callable[[Any], Any]] = None) -> Iterator[tuple]:
+    """p3_utils: Yield the (left, right) pairs of items of two sorted series
+    whose timestamps are at most tolerance seconds apart.
+
+    A generator over iterables, so either may be unbounded. Each left item
+    is paired with every matching right item, in order of left then right,
+    in O(n + m + pairs).
+
+    Args:
+        left, right (Iterable): Items in ascending order of timestamp.
+        tolerance (int|float): The greatest difference in seconds, inclusive
+            as iso_date_approx().
+        key (Callable): Returns an item's timestamp, an ISO timestamp str,
+            datetime or Timestamp. Default the item itself.
+
+    Raises:
+        ValueError: for a bad timestamp, a negative tolerance, or a series
+            out of order, when the item is reached.
+        TypeError: for naive and time zone aware timestamps together.
+    """
+    tol = _tolerance_ns(tolerance)
+    kinds : set[bool] = set()
+
+    def stamped(items: Iterable, name: str) -> Iterator[tuple[int, Any]]:
+        last = None
+        for i, item in enumerate(items):
+            t = Timestamp(item if key is None else key(item))
+            kinds.add(t._offset is not None)
+            if len(kinds) > 1:
+                raise TypeError("can't compare offset-naive and offset-aware "
+                                "timestamps")
+            if last is not None and t._ns < last:
+                raise ValueError(f"{name} is not sorted at item {i}")
+            last = t._ns
+            yield t._ns, item
+
+    rights = stamped(right, "right")
+    window : collections.deque[tuple[int, Any]] = collections.deque()
+    ahead = next(rights, None)
+    for ns, item in stamped(left, "left"):
+        low, high = ns - tol, ns + tol
+        while window and window[0][0] < low:
+            window.popleft()
+        while ahead is not None and ahead[0] <= high:
+            if ahead[0] >= low:
+                window.append(ahead)
+            ahead = next(rights, None)
+        for _, match in window:
+            yield item, match
+
+def join_within_batch(left: Sequence, right: Sequence,
+                      tolerance: Union[int, float] = 1,
+                      as_numpy: bool = False) -> tuple[Any, Any]:
+    """p3_utils: Return the indexes of the pairs of two timestamp columns
+    at most tolerance seconds apart.
+
+    The in-memory join_within(), the columns need not be sorted. Invalid
+    values, as marked by iso_dates(), match nothing. With NumPy, the columns
+    are sorted as datetime64[us] and each left value's matches are found by
+    a binary search, in O((n + m) log m + pairs).
+
+    Args:
+        left, right (Sequence): ISO timestamp strs, or datetime64 arrays.
+        tolerance (int|float): The greatest difference in seconds, inclusive.
+        as_numpy (bool): Return int64 arrays, else lists of ints. The
+            columns are joined with NumPy either way, if it is installed.
+
+    Returns:
+        tuple: (left indexes, right indexes), in order of the left then the
+            right timestamps.
+
+    Raises:
+        TypeError: for naive and time zone aware timestamps together.
+    """
+    tol = _tolerance_ns(tolerance)
+    if np is None:
+        if as_numpy:
+            raise ValueError("as_numpy=True requires the 'numpy' package")
+        columns = []
+        for column in (left, right):
+            stamps = []
+            for i, value in enumerate(column):
+                try:
+                    stamps.append((Timestamp(value), i))
+                except (TypeError, ValueError):
+                    continue
+            columns.append(sorted(stamps, key=lambda s: s[0]._ns))
+        pairs = list(join_within(columns[0], columns[1], tolerance,
+                                 key=lambda s: s[0]))
+        return [a[1] for a, _ in pairs], [b[1] for _, b in pairs]
+    columns = []
+    for column in (left, right):
+        if isinstance(column, np.ndarray) and column.dtype.kind == "M":
+            us, aware = column.astype("datetime64[us]"), \
+                np.zeros(len(column), dtype=bool)
+        else:
+            us, aware = _iso_datetime64(column.tolist()
+                if isinstance(column, np.ndarray) else list(column))
+        rows = np.flatnonzero(~np.isnat(us))
+        columns.append((us[rows].astype(np.int64), aware[rows], rows))
+    (left_us, left_tz, left_rows), (right_us, right_tz, right_rows) = columns
+    if len(set(left_tz.tolist()) | set(right_tz.tolist())) > 1:
+        raise TypeError("can't compare offset-naive and offset-aware timestamps")
+    left_order = np.argsort(left_us, kind="stable")
+    right_order = np.argsort(right_us, kind="stable")
+    left_us, right_us = left_us[left_order], right_us[right_order]
+    # sub-microsecond tolerances are compared in whole microseconds
+    tol_us = tol // 1000
+    lo = np.searchsorted(right_us, left_us - tol_us, side="left")
+    hi = np.searchsorted(right_us, left_us + tol_us, side="right")
+    counts = hi - lo
+    left_idx = np.repeat(np.arange(len(left_us)), counts)
+    first = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+    right_idx = first + np.arange(len(first))
+    left_idx = left_rows[left_order[left_idx]].astype(np.int64)
+    right_idx = right_rows[right_order[right_idx]].astype(np.int64)
+    if as_numpy:
+        return left_idx, right_idx
+    return left_idx.tolist(), right_idx.tolist()
+#endregion join_within() merge-join of timestamp series
+# ---------------------------------------------------------------------------- +
 #region Timestamp helper functions
 # ---------------------------------------------------------------------------- +
 #region validate_start()
@@ -179,9 +1050,8 @@ def increase_time(tval : str=now_iso_date_string(), hours : int = 0, \
     if not isinstance(tval, str):
         t = type(tval).__name__
         raise TypeError(f"type:str required for tval, not type: {t}")
-    validate_iso_date_string(tval) # raises ValueError if invalid
+    dt = _parse_iso(tval) # raises ValueError if invalid
     try:
-        dt = iso_date(tval)
         delta = datetime.timedelta(hours=hours, minutes=minutes, seconds=seconds)
         new_dt = dt + delta
         return iso_date_string(new_dt)
@@ -197,12 +1067,11 @@ def decrease_time(tval : str=now_iso_date_string(), hours : int = 0, \
     if not isinstance(tval, str):
         t = type(tval).__name__
         raise TypeError(f"type:str required for tval, not type: {t}")
-    validate_iso_date_string(tval) # raises ValueError if invalid
+    dt = _parse_iso(tval) # raises ValueError if invalid
     # hours = to_int(hours) # convert to int
     # minutes = to_int(minutes)
     # seconds = to_int(seconds)
     try:
-        dt = iso_date(tval)
         delta = datetime.timedelta(hours=abs(hours), minutes=abs(minutes), \
                                    seconds=abs(seconds))
         new_dt = dt - delta
@@ -234,9 +1103,8 @@ def calculate_duration(start: str, stop: str, unit : str = "hours") -> float:
         raise ValueError(m)
     # Validate the start and stop strings are valid ISO format date strings
     # Raises ValueError if invalid
-    validate_iso_date_string(start) and validate_iso_date_string(stop)
-    start_dt = iso_date(start) # iso_date() raises ValueError if invalid
-    stop_dt = iso_date(stop)
+    start_dt = _parse_iso(start)
+    stop_dt = _parse_iso(stop)
     td = stop_dt - start_dt
     seconds : float = td.total_seconds() # only method returning float 
     minutes : float = seconds / 60.0
@@ -246,6 +1114,71 @@ def calculate_duration(start: str, stop: str, unit : str = "hours") -> float:
     return seconds 
 #endregion
 # ---------------------------------------------------------------------------- +
+#region calculate_durations()
+def calculate_durations(starts: Sequence, stops: Sequence, unit: str = "hours",
+                        as_numpy: bool = False) -> IsoBatch:
+    """p3_utils: Calculate durations over columns of start and stop times.
+
+    The columnar calculate_duration(), each row gives the same float,
+    negative if stop is before start. A row is invalid, instead of raising,
+    if calculate_duration() would raise for it, e.g. for a bad timestamp
+    or a stop with a time zone and a start without one.
+
+    Args:
+        starts, stops (Sequence): ISO timestamp strs, or datetime64 arrays.
+        unit (str): "hours", "minutes" or "seconds".
+        as_numpy (bool): Return a float64 array and a bool array, else
+            lists of floats and bools. Invalid rows are NaN. The columns
+            are parsed with NumPy either way, if it is installed.
+
+    Returns:
+        IsoBatch: values, valid mask and error indexes.
+
+    Raises:
+        ValueError: for an invalid unit, or columns of different lengths.
+    """
+    valid_units = ("hours", "minutes", "seconds")
+    if unit not in valid_units:
+        m = f"unit must be one of {valid_units}, not '{unit}'"
+        raise ValueError(m)
+    if len(starts) != len(stops):
+        m = f"starts and stops differ in length, {len(starts)} != {len(stops)}"
+        raise ValueError(m)
+    if np is None:
+        if as_numpy:
+            raise ValueError("as_numpy=True requires the 'numpy' package")
+        result = []
+        for start, stop in zip(starts, stops):
+            try:
+                result.append(calculate_duration(start, stop, unit))
+            except (TypeError, ValueError):
+                result.append(float("nan"))
+        valid = [r == r for r in result]  # NaN != NaN
+        return IsoBatch(result, valid,
+                        [i for i, ok in enumerate(valid) if not ok])
+    columns = []
+    for column in (starts, stops):
+        if isinstance(column, np.ndarray) and column.dtype.kind == "M":
+            columns.append((column.astype("datetime64[us]"),
+                            np.zeros(len(column), dtype=bool)))
+        else:
+            columns.append(_iso_datetime64(column.tolist()
+                if isinstance(column, np.ndarray) else list(column)))
+    (start, start_tz), (stop, stop_tz) = columns
+    valid = ~(np.isnat(start) | np.isnat(stop) | (start_tz != stop_tz))
+    # as timedelta.total_seconds(), microseconds / 10**6
+    seconds = (stop - start).astype("int64") / 10**6
+    if unit == "hours":
+        seconds /= 60.0 * 60.0
+    elif unit == "minutes":
+        seconds /= 60.0
+    seconds[~valid] = np.nan
+    errors = np.flatnonzero(~valid).tolist()
+    if as_numpy:
+        return IsoBatch(seconds, valid, errors)
+    return IsoBatch(seconds.tolist(), valid.tolist(), errors)
+#endregion calculate_durations()
+# ---------------------------------------------------------------------------- +
 #region default_duration()
 def default_duration(unit : str = "hours") -> float:
     """p3_utils: Default duration for an activity in hours (default), minutes or seconds """
@@ -549,27 +1482,23 @@ def verify_url_file_path(url: str,test:bool=True) -> Path:
         raise
 #endregion verify_url_file_path(url: str) function
 # ---------------------------------------------------------------------------- +
+@stat_cache_scope()  # one stat() per path for all the checks
 def verify_file_path_for_load(file_path: Path) -> None:
     """Verify that the file path is valid and ready to load or raise error.
     returns None if the file path is valid, else raises an error."""
     try:
         is_obj_of_type("file_path", file_path, Path, raise_error=True)
-        if not file_path.exists():
+        if not path_exists(file_path):
             raise FileNotFoundError(f"File does not exist: {file_path}")
-        if not file_path.exists():
-            m = f"file_path does not exist: {file_path}"
-            logger.error(m)
-            raise FileNotFoundError(m)
-        if not file_path.is_file():
+        if not path_is_file(file_path):
             m = f"file_path is not a file: '{file_path}'"
             logger.error(m)
             raise ValueError(m)
-        if not file_path.suffix in [".csv", ".xlsx", ".xls", ".json", ".jsonc",
-                                    ".txt", ".toml"]:
+        if not file_path.suffix in LOAD_FILE_SUFFIXES:
             m = f"file_path filetype is not supported: {file_path.suffix}"
             logger.error(m)
             raise ValueError(m)
-        if file_path.stat().st_size == 0:
+        if cached_stat(file_path).st_size == 0:
             m = f"file is empty: {file_path}"
             logger.error(m)
             raise ValueError(m)
@@ -577,14 +1506,15 @@ def verify_file_path_for_load(file_path: Path) -> None:
         logger.error(exc_err_msg(e))
         raise
 
+@stat_cache_scope()
 def verify_file_path_for_save(file_path: Path) -> None:
     """Verify that the file path is valid and ready to save or raise error.
     returns None if the file path is valid, else raises an error.
     """
     try:
         is_obj_of_type("file_path", file_path, Path, raise_error=True)
-        if file_path.exists():
-            if not file_path.is_file():
+        if path_exists(file_path):
+            if not path_is_file(file_path):
                 m = f"csv_path exists but is not a file: '{file_path}'"
                 logger.error(m)
                 raise ValueError(m)
@@ -595,7 +1525,7 @@ def verify_file_path_for_save(file_path: Path) -> None:
         else:
             # If the file does not exist, check if the parent directory exists
             parent_dir = file_path.parent
-            if not parent_dir.exists():
+            if not path_exists(parent_dir):
                 m = f"parent directory does not exist: '{parent_dir}'"
                 logger.error(m)
                 raise FileNotFoundError(m)
@@ -604,7 +1534,7 @@ def verify_file_path_for_save(file_path: Path) -> None:
                 m = f"parent directory is not writable: '{parent_dir}'"
                 logger.error(m)
                 raise PermissionError(m)
-        if not file_path.suffix in [".csv", ".xlsx", ".xls", ".json", ".jsonc"]:
+        if not file_path.suffix in SAVE_FILE_SUFFIXES:
             m = f"file_path filetype is not supported: {file_path.suffix}"
             logger.error(m)
             raise ValueError(m)
@@ -612,6 +1542,160 @@ def verify_file_path_for_save(file_path: Path) -> None:
         logger.error(exc_err_msg(e))
         raise
 
+#region verify_file_paths_for_load() and _save() bulk functions
+class PathVerifyReport:
+    """p3_utils: Valid paths and per-path failures of a bulk verification."""
+    __slots__ = ("valid", "failures")
+
+    def __init__(self) -> None:
+        self.valid : list[Path] = []
+        # path -> the exception the single path function would have raised
+        self.failures : dict[Any, Exception] = {}
+
+    @property
+    def ok(self) -> bool:
+        return len(self.failures) == 0
+
+    def __repr__(self) -> str:
+        return (f"PathVerifyReport(valid={len(self.valid)}, "
+                f"failures={len(self.failures)})")
+
+# Without a case-sensitive listing, a name missing from it may still exist
+_CASE_SENSITIVE_LISTING = sys.platform.startswith("linux")
+
+def _list_folder(parent: Path, count: int) -> Optional[dict[str, os.DirEntry]]:
+    """p3_utils: List parent once when count paths are checked in it."""
+    if count < BULK_VERIFY_LIST_MIN:
+        return None
+    try:
+        with os.scandir(parent) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return None  # stat each path instead
+
+def _stat_in(entries: Optional[dict[str, os.DirEntry]],
+             path: Path) -> Optional[os.stat_result]:
+    """p3_utils: stat() path, from its folder listing when there is one."""
+    entry = entries.get(path.name) if entries is not None else None
+    try:
+        if entry is not None:
+            return entry.stat()
+        if entries is not None and _CASE_SENSITIVE_LISTING and \
+            path.name not in ("", ".", ".."):
+            return None
+        return os.stat(path)
+    except OSError:
+        return None
+
+def _verify_load_group(parent: Path, paths: list[Path]) -> list[Optional[Exception]]:
+    """p3_utils: The checks of verify_file_path_for_load() for one folder."""
+    entries = _list_folder(parent, len(paths))
+    results = []
+    for path in paths:
+        st = _stat_in(entries, path)
+        if st is None:
+            results.append(FileNotFoundError(f"File does not exist: {path}"))
+        elif not stat.S_ISREG(st.st_mode):
+            results.append(ValueError(f"file_path is not a file: '{path}'"))
+        elif path.suffix not in LOAD_FILE_SUFFIXES:
+            results.append(ValueError(
+                f"file_path filetype is not supported: {path.suffix}"))
+        elif st.st_size == 0:
+            results.append(ValueError(f"file is empty: {path}"))
+        else:
+            results.append(None)
+    return results
+
+def _verify_save_group(parent: Path, paths: list[Path]) -> list[Optional[Exception]]:
+    """p3_utils: The checks of verify_file_path_for_save() for one folder."""
+    entries = _list_folder(parent, len(paths))
+    parent_state = None  # checked once, when the first new file needs it
+    results = []
+    for path in paths:
+        st = _stat_in(entries, path)
+        if st is not None:
+            if not stat.S_ISREG(st.st_mode):
+                results.append(ValueError(
+                    f"csv_path exists but is not a file: '{path}'"))
+                continue
+            if not os.access(path, os.W_OK):
+                results.append(PermissionError(
+                    f"csv_path exists but is not writable: '{path}'"))
+                continue
+        else:
+            if parent_state is None:
+                parent_state = ("ok" if os.access(parent, os.W_OK) else "readonly") \
+                    if entries is not None or os.path.exists(parent) else "missing"
+            if parent_state == "missing":
+                results.append(FileNotFoundError(
+                    f"parent directory does not exist: '{parent}'"))
+                continue
+            if parent_state == "readonly":
+                results.append(PermissionError(
+                    f"parent directory is not writable: '{parent}'"))
+                continue
+        if path.suffix not in SAVE_FILE_SUFFIXES:
+            results.append(ValueError(
+                f"file_path filetype is not supported: {path.suffix}"))
+            continue
+        results.append(None)
+    return results
+
+def _verify_file_paths(file_paths, verify_group, workers: int) -> PathVerifyReport:
+    """p3_utils: Group file_paths by folder and run verify_group on each."""
+    report = PathVerifyReport()
+    paths = list(file_paths)
+    groups : dict[Path, list[Path]] = {}
+    for path in paths:
+        try:
+            is_obj_of_type("file_path", path, Path, raise_error=True)
+        except TypeError as e:
+            report.failures[path if isinstance(path, typing.Hashable)
+                            else repr(path)] = e
+            continue
+        groups.setdefault(path.parent, []).append(path)
+    if workers > 1 and len(groups) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            checked = list(pool.map(verify_group, groups.keys(), groups.values()))
+    else:
+        checked = [verify_group(parent, group) for parent, group in groups.items()]
+    failed : dict[Path, Exception] = {}
+    for group, errors in zip(groups.values(), checked):
+        for path, error in zip(group, errors):
+            if error is not None:
+                failed[path] = error
+    for path in paths:
+        if isinstance(path, Path):
+            if path in failed:
+                report.failures[path] = failed[path]
+            else:
+                report.valid.append(path)
+    logger.debug(f"verified {len(paths)} paths in {len(groups)} folders: "
+                 f"{report}")
+    return report
+
+def verify_file_paths_for_load(file_paths, workers: int = 1) -> PathVerifyReport:
+    """p3_utils: verify_file_path_for_load() for many paths, without raising.
+
+    Paths are grouped by folder, and a folder holding many of them is listed
+    once rather than stat'ing each path. Failures hold the exception the
+    single path function raises, and nothing is logged per path.
+
+    Args:
+        file_paths (Iterable[Path]): The files to verify.
+        workers (int): Threads verifying folders in parallel.
+    """
+    return _verify_file_paths(file_paths, _verify_load_group, workers)
+
+def verify_file_paths_for_save(file_paths, workers: int = 1) -> PathVerifyReport:
+    """p3_utils: verify_file_path_for_save() for many paths, without raising.
+
+    Each parent folder is checked for existence and writability once. See
+    verify_file_paths_for_load().
+    """
+    return _verify_file_paths(file_paths, _verify_save_group, workers)
+#endregion verify_file_paths_for_load() and _save() bulk functions
+
 def file_uri_to_path(file_uri: str) -> str:
     """Convert a file URI to a file path."""
     try:
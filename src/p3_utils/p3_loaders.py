@@ -0,0 +1,433 @@
+# ---------------------------------------------------------------------------- +
+#region p3_loaders.py
+""" Streaming record loaders for the file types verify_file_path_for_load() accepts.
+
+    load_records() - Yield the records of a file in batches, by suffix.
+    iter_json_values() - Yield the values of a JSON stream, one at a time.
+    strip_jsonc_comments() - Yield JSONC text chunks as JSON text.
+    JsoncStripper - Single-pass JSONC to JSON filter fed with text chunks.
+    load_jsonc() - Parse a JSONC file, binary file object or buffer (mmap).
+
+    Explanation:
+    ------------
+    load_records(path) verifies path once with verify_file_path_for_load(),
+    then returns a generator of batches, each a list of up to batch_size
+    records (dicts), or with columnar=True a dict of column name to list of
+    values. Files are read in chunks, so memory is bounded by the batch
+    size and the size of one record, not by the size of the file.
+
+        .csv          csv's C reader, the first row names the columns
+        .json/.jsonc  the elements of a top-level array, or each top-level
+                      value of a JSON-lines file. JSONC comments and
+                      trailing commas are removed while streaming.
+        .txt          one {"line": text} record per line
+        .toml         the tables of a top-level array of tables, e.g.
+                      [[records]], else the whole document as one record
+        .xlsx         the rows of a sheet by openpyxl's read-only mode, the
+                      first row names the columns
+        .xls          as .xlsx, with the optional 'xlrd' package
+
+    JSONC text is filtered in one pass over chunks of any size, so it can
+    stream from disk or from an mmap, and the filtered chunks feed an
+    incremental decoder. Nothing holds the whole text, except while decoding
+    a single top-level value, which must be in memory as text to decode.
+"""
+#endregion p3_loaders.py
+# ---------------------------------------------------------------------------- +
+#region Imports
+# python standard library modules and packages
+import codecs, csv, json, re, tomllib
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Union
+
+# third-party modules and packages
+try:
+    import xlrd
+except ImportError:  # .xls files are optional
+    xlrd = None
+
+# local modules and packages
+from .p3_helper_utils import verify_file_path_for_load
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals and Constants
+LOAD_BATCH_SIZE = 1000          # default records per batch
+LOAD_CHUNK_SIZE = 256 * 1024    # characters read per chunk of JSON text
+_JSON_WS = re.compile(r"[ \t\n\r]*")
+_NUMBER_TAIL = re.compile(r"[0-9.eE+\-]*\Z")  # a number may go on after this
+# A run of JSONC text with nothing to filter: text other than strings,
+# comments and commas, whole strings, and commas not followed by ']', '}',
+# a comment or the end of the chunk. Matched without backtracking.
+_JSONC_PLAIN = re.compile(r'(?:[^"/,]+|"[^"\\\n]*(?:\\.[^"\\\n]*)*"'
+                          r'|,(?![ \t\r\n]*(?:[\]}/]|\Z)))*')
+_CODE, _LINE_COMMENT, _BLOCK_COMMENT = 0, 1, 2
+# iter_json_values() states: before the first value, values one after the
+# other, and in a top-level array expecting a first element, an element
+# after a comma, a comma or ']', and nothing after the ']'.
+_JSON_START, _JSON_LINES, _ARRAY_FIRST, _ARRAY_VALUE, _ARRAY_COMMA, \
+    _ARRAY_CLOSED = range(6)
+_NO_VALUE = object()
+#endregion Globals and Constants
+# ---------------------------------------------------------------------------- +
+#region JsoncStripper class
+class JsoncStripper:
+    """p3_utils: Filter JSONC text to JSON, one chunk at a time.
+
+    Removes // and /* */ comments and, with trailing_commas=True, commas
+    before a ']' or '}'. feed() returns the JSON text of a chunk that is
+    known so far, holding back only a possibly split token, and close()
+    returns the rest. Runs of text with nothing to filter, which is most
+    of a file, are copied by one regex match.
+    """
+    __slots__ = ("trailing_commas", "_mode", "_carry", "_comma")
+
+    def __init__(self, trailing_commas: bool = True) -> None:
+        self.trailing_commas = trailing_commas
+        self._mode = _CODE
+        self._carry = ""       # a split token, prepended to the next chunk
+        self._comma = False    # a comma waiting for the next token
+
+    def feed(self, chunk: str) -> str:
+        """p3_utils: Return the JSON text of chunk, as far as known."""
+        text = self._carry + chunk if self._carry else chunk
+        self._carry = ""
+        out : list[str] = []
+        pos, n = 0, len(text)
+        while pos < n:
+            if self._mode == _LINE_COMMENT:
+                end = text.find("\n", pos)
+                if end < 0:
+                    break
+                self._mode, pos = _CODE, end
+                continue
+            if self._mode == _BLOCK_COMMENT:
+                end = text.find("*/", pos)
+                if end < 0:
+                    if text.endswith("*"):
+                        self._carry = "*"
+                    break
+                self._mode, pos = _CODE, end + 2
+                continue
+            if self._comma:
+                end = _JSON_WS.match(text, pos).end()
+                out.append(text[pos:end])
+                pos = end
+                if pos == n:
+                    break
+                c = text[pos]
+                if c != "/":
+                    if c not in "]}":
+                        out.append(",")
+                    self._comma = False
+                    continue
+            else:
+                end = _JSONC_PLAIN.match(text, pos).end()
+                out.append(text[pos:end])
+                pos = end
+                if pos == n:
+                    break
+                c = text[pos]
+            if c == "/":
+                if pos + 1 == n:
+                    self._carry = "/"
+                    break
+                c2 = text[pos + 1]
+                if c2 == "/" or c2 == "*":
+                    self._mode = _LINE_COMMENT if c2 == "/" else _BLOCK_COMMENT
+                    pos += 2
+                else:
+                    out.append("/")  # not JSON, left for the decoder to report
+                    pos += 1
+            elif c == ",":
+                if self.trailing_commas:
+                    self._comma = True
+                else:
+                    out.append(",")
+                pos += 1
+            else:  # '"', a string split at the end of the chunk
+                self._carry = text[pos:]
+                break
+        return "".join(out)
+
+    def close(self) -> str:
+        """p3_utils: Return the JSON text held back at the end of the input.
+
+        Raises:
+            ValueError: for an unterminated /* comment.
+        """
+        if self._mode == _BLOCK_COMMENT:
+            raise ValueError("JSONC text ends inside a /* comment")
+        rest = ("," if self._comma else "") + self._carry
+        self._mode, self._carry, self._comma = _CODE, "", False
+        return rest
+#endregion JsoncStripper class
+# ---------------------------------------------------------------------------- +
+#region strip_jsonc_comments()
+def strip_jsonc_comments(chunks: Iterable[str],
+                         trailing_commas: bool = True) -> Iterator[str]:
+    """p3_utils: Yield the JSON text of JSONC text chunks, or lines.
+
+    See JsoncStripper. Empty chunks are not yielded.
+    """
+    stripper = JsoncStripper(trailing_commas)
+    for chunk in chunks:
+        text = stripper.feed(chunk)
+        if text:
+            yield text
+    text = stripper.close()
+    if text:
+        yield text
+#endregion strip_jsonc_comments()
+# ---------------------------------------------------------------------------- +
+#region iter_json_values()
+def iter_json_values(chunks: Iterable[str],
+                     split_array: bool = True) -> Iterator[Any]:
+    """p3_utils: Yield each value of a stream of JSON text chunks.
+
+    With split_array, a top-level array yields its elements, and nothing
+    may follow its ']'. Otherwise each top-level value is yielded, as in a
+    JSON-lines file. Only the text of the value being decoded is held in
+    memory.
+
+    Raises:
+        json.JSONDecodeError: for text that is not valid JSON.
+    """
+    decoder = json.JSONDecoder()
+    buf, pos = "", 0
+    parts, parts_len = [], 0  # chunks read but not yet joined to buf
+    retry_len = 0  # text needed from pos before decoding a split value again
+    state = _JSON_START if split_array else _JSON_LINES
+    chunks = iter(chunks)
+    eof = False
+    while True:
+        chunk = next(chunks, None)
+        if chunk is None:
+            eof = True
+        else:
+            parts.append(chunk)
+            parts_len += len(chunk)
+            if len(buf) - pos + parts_len < retry_len:
+                continue  # join a split value's chunks once, not per chunk
+        if parts:
+            parts.insert(0, buf[pos:])
+            buf, pos = "".join(parts), 0
+            parts, parts_len = [], 0
+        while True:
+            pos = _JSON_WS.match(buf, pos).end()
+            if pos == len(buf):
+                break
+            c = buf[pos]
+            if state == _JSON_START:
+                if c == "[":
+                    state, pos = _ARRAY_FIRST, pos + 1
+                    continue
+                state = _JSON_LINES
+            elif state == _ARRAY_CLOSED:
+                raise json.JSONDecodeError("Extra data", buf, pos)
+            elif state == _ARRAY_COMMA:
+                if c == ",":
+                    state, pos = _ARRAY_VALUE, pos + 1
+                elif c == "]":
+                    state, pos = _ARRAY_CLOSED, pos + 1
+                else:
+                    raise json.JSONDecodeError("Expecting ',' delimiter",
+                                               buf, pos)
+                continue
+            elif c == "]" and state == _ARRAY_FIRST:
+                state, pos = _ARRAY_CLOSED, pos + 1
+                continue
+            elif c in ",]":
+                raise json.JSONDecodeError("Expecting value", buf, pos)
+            try:
+                value, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                # The value continues in the next chunks. Retry when the
+                # text has doubled, so a large value decodes in linear time.
+                retry_len = 2 * (len(buf) - pos)
+                break
+            if not eof and (end == len(buf) or
+                            (isinstance(value, (int, float)) and
+                             _NUMBER_TAIL.match(buf, end))):
+                break  # a number may continue in the next chunk
+            yield value
+            pos, retry_len = end, 0
+            if state != _JSON_LINES:
+                state = _ARRAY_COMMA
+        if eof:
+            if state in (_ARRAY_FIRST, _ARRAY_VALUE, _ARRAY_COMMA):
+                raise json.JSONDecodeError("Unterminated array", buf, pos)
+            return
+#endregion iter_json_values()
+# ---------------------------------------------------------------------------- +
+#region record readers
+def _read_chunks(f, size: int = LOAD_CHUNK_SIZE) -> Iterator[str]:
+    while chunk := f.read(size):
+        yield chunk
+
+def _decode_chunks(source, encoding: str = "utf-8",
+                   size: int = LOAD_CHUNK_SIZE) -> Iterator[str]:
+    """p3_utils: Yield text chunks of a binary file object or a buffer."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    if hasattr(source, "read") and not isinstance(source, memoryview):
+        pieces = iter(lambda: source.read(size), b"")
+    else:
+        view = memoryview(source)
+        pieces = (view[i:i + size] for i in range(0, len(view), size))
+    for piece in pieces:
+        if text := decoder.decode(piece):
+            yield text
+    if text := decoder.decode(b"", final=True):
+        yield text
+
+def _csv_records(path: Path, encoding: str) -> Iterator[dict]:
+    with open(path, newline="", encoding=encoding) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        for row in reader:
+            yield dict(zip(header, row))
+
+def _json_records(path: Path, encoding: str) -> Iterator[Any]:
+    with open(path, encoding=encoding) as f:
+        if path.suffix == ".jsonc":
+            yield from iter_json_values(strip_jsonc_comments(_read_chunks(f)))
+        else:
+            yield from iter_json_values(_read_chunks(f))
+
+def _txt_records(path: Path, encoding: str) -> Iterator[dict]:
+    with open(path, encoding=encoding) as f:
+        for line in f:
+            yield {"line": line.rstrip("\r\n")}
+
+def _toml_records(path: Path, encoding: str) -> Iterator[dict]:
+    with open(path, "rb") as f:
+        doc = tomllib.load(f)
+    tables = [v for v in doc.values()
+              if isinstance(v, list) and v and all(isinstance(t, dict) for t in v)]
+    if len(doc) == 1 and len(tables) == 1:
+        yield from tables[0]
+    else:
+        yield doc
+
+def _rows_to_records(rows: Iterator[tuple]) -> Iterator[dict]:
+    header = next(rows, None)
+    if header is None:
+        return
+    header = [str(h) if h is not None else f"column_{i + 1}"
+              for i, h in enumerate(header)]
+    for row in rows:
+        yield dict(zip(header, row))
+
+def _xlsx_records(path: Path, encoding: str, sheet: str = None) -> Iterator[dict]:
+    from openpyxl import load_workbook
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet] if sheet is not None else wb.active
+        yield from _rows_to_records(ws.iter_rows(values_only=True))
+    finally:
+        wb.close()
+
+def _xls_records(path: Path, encoding: str, sheet: str = None) -> Iterator[dict]:
+    if xlrd is None:
+        raise ValueError("loading .xls files requires the 'xlrd' package")
+    wb = xlrd.open_workbook(path, on_demand=True)
+    try:
+        ws = wb.sheet_by_name(sheet) if sheet is not None else wb.sheet_by_index(0)
+        yield from _rows_to_records(
+            tuple(ws.row_values(r)) for r in range(ws.nrows))
+    finally:
+        wb.release_resources()
+
+_RECORD_READERS = {
+    ".csv": _csv_records, ".json": _json_records, ".jsonc": _json_records,
+    ".txt": _txt_records, ".toml": _toml_records, ".xlsx": _xlsx_records,
+    ".xls": _xls_records,
+}
+#endregion record readers
+# ---------------------------------------------------------------------------- +
+#region load_jsonc()
+def load_jsonc(source, encoding: str = "utf-8",
+               trailing_commas: bool = True) -> Any:
+    """p3_utils: Parse one JSONC document.
+
+    Args:
+        source (Path|str|bytes|mmap|BinaryIO): A file path, or the bytes of
+            the document as a buffer (e.g. an mmap.mmap) or binary file.
+        encoding (str): Text encoding of the document.
+        trailing_commas (bool): Allow a comma before ']' and '}'.
+
+    Raises:
+        json.JSONDecodeError: if the text is not one JSON value.
+        ValueError: for an unterminated /* comment.
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, "rb") as f:
+            return load_jsonc(f, encoding, trailing_commas)
+    values = iter_json_values(strip_jsonc_comments(
+        _decode_chunks(source, encoding), trailing_commas), split_array=False)
+    value = next(values, _NO_VALUE)
+    if value is _NO_VALUE:
+        raise json.JSONDecodeError("Expecting value", "", 0)
+    if next(values, _NO_VALUE) is not _NO_VALUE:
+        raise json.JSONDecodeError("Extra data after the first value", "", 0)
+    return value
+#endregion load_jsonc()
+# ---------------------------------------------------------------------------- +
+#region load_records()
+def _columnar(batch: list) -> dict[str, list]:
+    """p3_utils: Turn a list of dicts into a dict of lists, None if missing."""
+    columns : dict[str, list] = {}
+    for i, record in enumerate(batch):
+        if not isinstance(record, dict):
+            record = {"value": record}
+        for key, value in record.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = [None] * i
+            column.append(value)
+        for column in columns.values():
+            if len(column) <= i:
+                column.append(None)
+    return columns
+
+def _batches(records: Iterator[Any], batch_size: int,
+             columnar: bool) -> Iterator[Union[list, dict[str, list]]]:
+    while batch := list(islice(records, batch_size)):
+        yield _columnar(batch) if columnar else batch
+
+def load_records(file_path: Union[Path, str], batch_size: int = LOAD_BATCH_SIZE,
+                 columnar: bool = False, encoding: str = "utf-8",
+                 sheet: str = None) -> Iterator[Union[list, dict[str, list]]]:
+    """p3_utils: Yield the records of file_path in batches, read by suffix.
+
+    file_path is verified once, here, so errors are raised by this call
+    rather than on the first batch. See the module docstring for the
+    record of each file type.
+
+    Args:
+        file_path (Path|str): A file verify_file_path_for_load() accepts.
+        batch_size (int): Most records in one batch.
+        columnar (bool): Yield dicts of column lists instead of record lists.
+        encoding (str): Text encoding of text files.
+        sheet (str): Worksheet name of .xlsx and .xls files, default the
+            active or first sheet.
+
+    Raises:
+        As verify_file_path_for_load(), and ValueError for a batch_size < 1.
+    """
+    file_path = Path(file_path)
+    verify_file_path_for_load(file_path)
+    if not isinstance(batch_size, int) or batch_size < 1:
+        raise ValueError(f"batch_size must be a positive int, not '{batch_size}'")
+    reader = _RECORD_READERS[file_path.suffix]
+    if file_path.suffix in (".xlsx", ".xls"):
+        records = reader(file_path, encoding, sheet)
+    else:
+        records = reader(file_path, encoding)
+    return _batches(records, batch_size, columnar)
+#endregion load_records()
+# ---------------------------------------------------------------------------- +
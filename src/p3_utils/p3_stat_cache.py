@@ -0,0 +1,179 @@
+# ---------------------------------------------------------------------------- +
+#region p3_stat_cache.py
+""" Short-lived stat() cache shared by the file helper functions.
+
+    stat_cache_scope() - Context manager caching stat() results in its scope.
+    cached_stat() - os.stat(), answered from the cache inside a scope.
+    path_exists(), path_is_file(), path_is_dir() - Path tests on cached_stat().
+    invalidate_stat() - Drop one path, or all paths, from the cache.
+    stat_cache_stats() - Counters of lookups, syscalls made and saved.
+
+    Explanation:
+    ------------
+    Checking one file with exists(), is_file() and stat() costs a syscall
+    each. The helpers in p3_file_helpers and p3_helper_utils run their checks
+    inside stat_cache_scope(), so each path is stat'ed once per operation.
+    Callers can open a wider scope around a batch of operations. Entries
+    live at most ttl seconds, and the cache is emptied when the outermost
+    scope exits, so nothing is cached outside a scope. Negative results
+    (FileNotFoundError and other OSErrors) are cached too.
+
+    A scope is held in a context variable, so it covers only the thread, or
+    asyncio task, that opened it. Other threads, including worker threads
+    started inside the scope, stat() uncached.
+
+    Functions that change a path, e.g. writing a backup, call
+    invalidate_stat() for it.
+"""
+#endregion p3_stat_cache.py
+# ---------------------------------------------------------------------------- +
+#region Imports
+# python standard library modules and packages
+import os, stat, threading, time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Union
+
+# local modules and packages
+#endregion Imports
+# ---------------------------------------------------------------------------- +
+#region Globals and Constants
+STAT_CACHE_TTL = 1.0  # default seconds a cached stat() result is trusted
+STAT_CACHE_MAX_ENTRIES = 100_000
+#endregion Globals and Constants
+# ---------------------------------------------------------------------------- +
+#region _StatCache class
+class _StatScope:
+    """p3_utils: The cache of stat() results of one outermost scope."""
+    __slots__ = ("ttl", "entries")
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        # (path, follow_symlinks) -> (expiry, stat_result or OSError)
+        self.entries : dict[tuple[str, bool], tuple[float, object]] = {}
+
+class _StatCache:
+    """p3_utils: Internal counters and the open scopes of all threads."""
+    __slots__ = ("scopes", "lock", "lookups", "syscalls")
+
+    def __init__(self) -> None:
+        self.scopes : list[_StatScope] = []  # invalidate_stat() reaches all
+        self.lock = threading.Lock()
+        self.lookups = 0
+        self.syscalls = 0
+
+_cache = _StatCache()
+_scope : ContextVar[Optional[_StatScope]] = ContextVar("p3_stat_cache_scope",
+                                                       default=None)
+#endregion _StatCache class
+# ---------------------------------------------------------------------------- +
+#region stat_cache_scope()
+@contextmanager
+def stat_cache_scope(ttl: Optional[float] = None):
+    """p3_utils: Cache stat() results for the scope of a with block.
+
+    Scopes nest, and cover only the calling thread or asyncio task. The ttl
+    of the outermost scope applies, default STAT_CACHE_TTL seconds.
+    """
+    if _scope.get() is not None:
+        yield  # nested, the outermost scope's cache is used
+        return
+    scope = _StatScope(STAT_CACHE_TTL if ttl is None else ttl)
+    token = _scope.set(scope)
+    with _cache.lock:
+        _cache.scopes.append(scope)
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+        with _cache.lock:
+            _cache.scopes.remove(scope)
+#endregion stat_cache_scope()
+# ---------------------------------------------------------------------------- +
+#region cached_stat()
+def cached_stat(path: Union[str, os.PathLike],
+                follow_symlinks: bool = True) -> os.stat_result:
+    """p3_utils: Return os.stat(path), from the cache inside a scope.
+
+    Raises:
+        OSError: as os.stat() does, e.g. FileNotFoundError.
+    """
+    scope = _scope.get()
+    if scope is None:
+        _cache.lookups += 1
+        _cache.syscalls += 1
+        return os.stat(path, follow_symlinks=follow_symlinks)
+    key = (os.fspath(path), follow_symlinks)
+    now = time.monotonic()
+    with _cache.lock:
+        _cache.lookups += 1
+        hit = scope.entries.get(key)
+    if hit is None or hit[0] < now:
+        try:
+            result = os.stat(path, follow_symlinks=follow_symlinks)
+        except OSError as e:
+            result = e
+        with _cache.lock:
+            _cache.syscalls += 1
+            if len(scope.entries) >= STAT_CACHE_MAX_ENTRIES:
+                scope.entries.clear()
+            scope.entries[key] = (now + scope.ttl, result)
+    else:
+        result = hit[1]
+    if isinstance(result, OSError):
+        raise result
+    return result
+
+def path_exists(path: Union[str, os.PathLike]) -> bool:
+    """p3_utils: Path.exists() on cached_stat()."""
+    try:
+        cached_stat(path)
+    except (OSError, ValueError):
+        return False
+    return True
+
+def path_is_file(path: Union[str, os.PathLike]) -> bool:
+    """p3_utils: Path.is_file() on cached_stat()."""
+    try:
+        return stat.S_ISREG(cached_stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
+def path_is_dir(path: Union[str, os.PathLike]) -> bool:
+    """p3_utils: Path.is_dir() on cached_stat()."""
+    try:
+        return stat.S_ISDIR(cached_stat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+#endregion cached_stat()
+# ---------------------------------------------------------------------------- +
+#region invalidate_stat()
+def invalidate_stat(path: Union[str, os.PathLike, None] = None) -> None:
+    """p3_utils: Drop path from the stat cache of every open scope, or every
+    path if None."""
+    with _cache.lock:
+        for scope in _cache.scopes:
+            if path is None:
+                scope.entries.clear()
+                continue
+            p = os.fspath(path)
+            scope.entries.pop((p, True), None)
+            scope.entries.pop((p, False), None)
+#endregion invalidate_stat()
+# ---------------------------------------------------------------------------- +
+#region stat_cache_stats()
+def stat_cache_stats(reset: bool = False) -> dict[str, int]:
+    """p3_utils: Return counters of stat lookups, syscalls made and saved.
+
+    Args:
+        reset (bool): Zero the counters after reading them.
+    """
+    with _cache.lock:
+        stats = {"lookups": _cache.lookups, "syscalls": _cache.syscalls,
+                 "saved": _cache.lookups - _cache.syscalls,
+                 "entries": sum(len(s.entries) for s in _cache.scopes)}
+        if reset:
+            _cache.lookups = _cache.syscalls = 0
+    return stats
+#endregion stat_cache_stats()
+# ---------------------------------------------------------------------------- +
@@ -131,6 +131,35 @@ def test_now_iso_date_string():
         "now_iso_date() did compare greater than a previous call"
 #endregion
 
+#region test_coarse_clock()
+def test_coarse_clock(monkeypatch):
+    import time
+    from p3_utils import p3_helper_utils
+    clock = [1_700_000_000_123_456_789]
+    monkeypatch.setattr(p3_helper_utils.time, "time_ns", lambda: clock[0])
+    try:
+        p3u.set_coarse_clock(0.001)
+        first = p3u.current_timestamp()
+        assert first.endswith(".123000")
+        clock[0] += 500_000     # within the same 1 ms step
+        assert p3u.now_iso_date_string() is first
+        clock[0] += 1_000_000
+        assert p3u.current_timestamp().endswith(".124000")
+        # Test the clock set back does not make timestamps go backwards
+        clock[0] -= 10**9
+        assert p3u.current_timestamp().endswith(".124000")
+        p3u.set_coarse_clock(1)
+        assert p3u.current_timestamp().endswith(".124000")
+        clock[0] += 2 * 10**9
+        assert p3u.current_timestamp().endswith(":21")
+        with pytest.raises(ValueError):
+            p3u.set_coarse_clock(-1)
+    finally:
+        p3u.set_coarse_clock(0)
+    assert abs(p3u.calculate_duration(p3u.current_timestamp(),
+               p3u.iso_date_string(p3u.now_iso_date()), "seconds")) < 1
+#endregion test_coarse_clock()
+
 #region test_iso_date_approx()
 def test_iso_date_approx():
     """Test the iso_date_approx function."""
@@ -179,6 +208,221 @@ def test_iso_date_approx():
         p3u.iso_date_approx(dt1, "invalid-date-string")
 #endregion test_iso_date_approx()
 
+#region test_iso_parse_cache()
+def test_iso_parse_cache():
+    ts = "2025-01-20T13:00:00"
+    try:
+        p3u.set_iso_parse_cache(8)
+        assert p3u.calculate_duration(ts, "2025-01-20T14:30:00") == 1.5
+        assert p3u.increase_time(ts, hours=1) == "2025-01-20T14:00:00"
+        assert p3u.iso_date(ts) is p3u.iso_date(ts)
+        info = p3u.iso_parse_cache_info()
+        assert info.hits == 3 and info.misses == 2 and info.maxsize == 8
+        # Test errors are unchanged, and are not cached
+        for _ in range(2):
+            with pytest.raises(ValueError,
+                               match="Invalid ISO datetime str value: 'x"):
+                p3u.validate_iso_date_string("x" * 20)
+        with pytest.raises(ValueError, match="Requires valid ISO format"):
+            p3u.calculate_duration(ts, "2025-01-20")
+        assert p3u.iso_date("2025-01-20").day == 20
+        p3u.set_iso_parse_cache(0)
+        assert p3u.iso_parse_cache_info() is None
+        assert p3u.decrease_time(ts, minutes=30) == "2025-01-20T12:30:00"
+        with pytest.raises(ValueError):
+            p3u.set_iso_parse_cache(-1)
+    finally:
+        p3u.set_iso_parse_cache(0)
+#endregion test_iso_parse_cache()
+
+#region test_iso_dates()
+def test_iso_dates():
+    import datetime
+    ts = ["2025-01-20T13:00:00", "bad", None, "2025-01-20",
+          "2025-01-20T13:00:00+05:00", "2025-01-20 13:00:00.5"]
+    batch = p3u.iso_dates(ts)
+    assert batch.errors == [1, 2, 3]
+    assert batch.valid == [True, False, False, False, True, True]
+    assert batch.values[0] == p3u.iso_date(ts[0]) and batch.values[1] is None
+    assert batch.values[4].utcoffset() == datetime.timedelta(hours=5)
+    strs = p3u.iso_strings(batch.values + ["not a datetime"])
+    assert strs.values == ["2025-01-20T13:00:00", None, None, None,
+        "2025-01-20T13:00:00+05:00", "2025-01-20T13:00:00.500000", None]
+    assert strs.errors == [1, 2, 3, 6]
+    # Test whole regular blocks parse the same as row-wise
+    column = [p3u.increase_time(ts[0], seconds=i) for i in range(5000)]
+    assert p3u.iso_dates(column).values == [p3u.iso_date(t) for t in column]
+    assert p3u.iso_dates([]) == ([], [], [])
+#endregion test_iso_dates()
+
+#region test_iso_dates_numpy()
+def test_iso_dates_numpy():
+    np = pytest.importorskip("numpy")
+    ts = ["2025-01-20T13:00:00", "bad", "2025-01-20T13:00:00+05:00",
+          "2025-01-20T13:00:00.250000"]
+    batch = p3u.iso_dates(ts, as_numpy=True)
+    assert batch.values.dtype == np.dtype("datetime64[us]")
+    assert batch.valid.tolist() == [True, False, True, True]
+    assert batch.errors == [1]
+    strs = p3u.iso_strings(batch.values)
+    assert strs.values == ["2025-01-20T13:00:00", None, "2025-01-20T08:00:00",
+                           "2025-01-20T13:00:00.250000"]
+    strs = p3u.iso_strings(batch.values, as_numpy=True)
+    assert strs.values.tolist()[:2] == ["2025-01-20T13:00:00", ""]
+    assert strs.errors == [1]
+    # Test the NumPy path rejects what the row-wise parse rejects
+    for odd in ("2025-01-20T13:00:00.", "10000-01-01T00:00:00",
+                "2025-01-20T13:00", "2025-01-20T13:00:00\n2025-01-20T13:00:00"):
+        ts = ["2025-01-20T13:00:00"] * 3 + [odd]
+        assert p3u.iso_dates(ts, as_numpy=True).errors == \
+            p3u.iso_dates(ts).errors == [3]
+    # Test time zones converting outside years 1-9999 are valid, not raising
+    edges = ["0001-01-01T00:00:00+05:30", "9999-12-31T23:59:59-01:00"]
+    batch = p3u.iso_dates(edges, as_numpy=True)
+    assert batch.errors == p3u.iso_dates(edges).errors == []
+    assert (batch.values == np.array(["0000-12-31T18:30:00",
+        "10000-01-01T00:59:59"], dtype="datetime64[us]")).all()
+#endregion test_iso_dates_numpy()
+
+#region test_timestamp_timespan()
+def test_timestamp_timespan():
+    import datetime
+    s = "2025-01-20T13:00:00"
+    ts = p3u.Timestamp(s)
+    assert str(ts) == s and ts.to_datetime() == p3u.iso_date(s)
+    span = p3u.TimeSpan(hours=1, minutes=30)
+    assert str(ts + span) == p3u.increase_time(s, hours=1, minutes=30)
+    assert str(ts - span) == p3u.decrease_time(s, hours=1, minutes=30)
+    later = p3u.Timestamp("2025-01-20T14:30:00.250000")
+    for unit in ("hours", "minutes", "seconds"):
+        assert (later - ts).total(unit) == \
+            p3u.calculate_duration(s, str(later), unit)
+    assert (ts - later).total() < 0 and ts < later and ts + span <= later
+    assert span * 2 == p3u.TimeSpan(hours=3) and span / span == 1.0
+    assert -span == p3u.TimeSpan(minutes=-90) and abs(-span) == span
+    assert p3u.TimeSpan.from_timedelta(datetime.timedelta(minutes=90)) == span
+    assert len({ts, p3u.Timestamp(s), p3u.Timestamp(p3u.iso_date(s))}) == 1
+    assert p3u.Timestamp.from_ns(ts.ns) == ts
+    # Test time zone aware timestamps
+    aware = p3u.Timestamp("2025-01-20T14:00:00+01:00")
+    assert aware.offset == 3600 and str(aware) == "2025-01-20T14:00:00+01:00"
+    assert aware == p3u.Timestamp("2025-01-20T13:00:00+00:00")
+    assert aware != ts
+    with pytest.raises(TypeError):
+        aware < ts
+    with pytest.raises(TypeError):
+        aware - ts
+    # Test errors are as validate_iso_date_string()
+    with pytest.raises(TypeError):
+        p3u.Timestamp(12345)
+    with pytest.raises(ValueError, match="Invalid ISO datetime str value"):
+        p3u.Timestamp("x" * 20)
+    with pytest.raises(ValueError):
+        span.total("days")
+    assert isinstance(p3u.Timestamp(), p3u.Timestamp)
+#endregion test_timestamp_timespan()
+
+#region test_interval_index()
+def test_interval_index():
+    def t(minute):
+        return f"2025-01-20T13:{minute:02d}:00"
+    idx = p3u.IntervalIndex([t(0), t(30), t(10), t(40)],
+                            [t(20), t(35), t(15), t(40)], ids="abcd")
+    assert len(idx) == 4
+    assert idx.overlapping(t(12), t(31)) == ["a", "c", "b"]
+    assert idx.at(t(40)) == ["d"] and idx.at(t(25)) == []
+    assert idx.containing(t(11), t(14)) == ["a", "c"]
+    assert idx.within(t(5), t(40)) == ["c", "b", "d"]
+    idx.add(t(14), t(50), "e")
+    assert idx.at(t(40)) == ["e", "d"] and len(idx) == 5
+    assert [(str(a), str(b)) for a, b in idx.merged()] == [(t(0), t(50))]
+    for i in range(p3u.INTERVAL_INDEX_BUFFER + 1):
+        idx.add(t(55), t(56))
+    assert idx.at(t(55)) == list(range(5, 6 + p3u.INTERVAL_INDEX_BUFFER))
+    # Test time zone aware intervals
+    aware = p3u.IntervalIndex(["2025-01-20T13:00:00+01:00"],
+                              ["2025-01-20T14:00:00+01:00"])
+    assert aware.at("2025-01-20T12:30:00+00:00") == [0]
+    with pytest.raises(TypeError):
+        aware.at(t(0))
+    # Test time zones converting outside years 1-9999, in bulk and added
+    edges = ["0001-01-01T00:00:00+05:30", "9999-12-31T23:59:59-01:00"]
+    wide = p3u.IntervalIndex(edges[:1], edges[1:])
+    wide.add(*edges)
+    assert wide.at(edges[0]) == wide.at(edges[1]) == [0, 1]
+    assert wide.within(*edges) == [0, 1]
+    # Test queries of an empty index do not set its kind, adding does
+    empty = p3u.IntervalIndex()
+    assert empty.at(t(0)) == [] and empty.within(t(0), t(5)) == []
+    empty.add("2025-01-20T13:00:00+01:00", "2025-01-20T14:00:00+01:00")
+    assert empty.at("2025-01-20T12:30:00+00:00") == [0]
+    with pytest.raises(TypeError):
+        empty.at(t(0))
+    with pytest.raises(TypeError):
+        p3u.IntervalIndex().overlapping(t(0), "2025-01-20T14:00:00+01:00")
+    # Test errors
+    with pytest.raises(ValueError):
+        p3u.IntervalIndex([t(10)], [t(5)])
+    with pytest.raises(ValueError):
+        p3u.IntervalIndex([t(10)], [])
+    with pytest.raises(ValueError):
+        idx.overlapping(t(10), t(5))
+    with pytest.raises(ValueError):
+        p3u.IntervalIndex(["x" * 20], [t(5)])
+#endregion test_interval_index()
+
+#region test_join_within()
+def test_join_within():
+    def t(second):
+        return f"2025-01-20T13:00:{second:02d}"
+    left, right = [t(0), t(10), t(11), t(30)], [t(1), t(3), t(11), t(12)]
+    expected = [(l, r) for l in left for r in right
+                if p3u.iso_date_approx(l, r, 1)]
+    assert list(p3u.join_within(iter(left), iter(right), 1)) == expected
+    assert list(p3u.join_within(left, right, 0)) == [(t(11), t(11))]
+    pairs = p3u.join_within([{"at": s} for s in left],
+                            [{"at": s} for s in right], 2, key=lambda e: e["at"])
+    assert [(l["at"], r["at"]) for l, r in pairs] == \
+        [(t(0), t(1)), (t(10), t(11)), (t(10), t(12)), (t(11), t(11)),
+         (t(11), t(12))]
+    # Test an unbounded right series
+    import itertools
+    counter = itertools.count()
+    stream = (t(min(next(counter), 59)) for _ in itertools.count())
+    assert next(p3u.join_within([t(5)], stream, 0)) == (t(5), t(5))
+    # Test the batch join, unsorted and with an invalid value
+    l_idx, r_idx = p3u.join_within_batch(["bad"] + left[::-1], right, 1)
+    assert [(left[::-1][i - 1], right[j]) for i, j in zip(l_idx, r_idx)] == \
+        expected
+    # Test errors
+    with pytest.raises(ValueError, match="right is not sorted"):
+        list(p3u.join_within(left, right[::-1]))
+    with pytest.raises(ValueError):
+        list(p3u.join_within(left, right, -1))
+    with pytest.raises(TypeError):
+        list(p3u.join_within(left, right, "1"))
+    with pytest.raises(TypeError):
+        list(p3u.join_within(left, ["2025-01-20T13:00:00+00:00"]))
+#endregion test_join_within()
+
+#region test_join_within_numpy()
+def test_join_within_numpy():
+    np = pytest.importorskip("numpy")
+    left = np.array(["2025-01-20T13:00:05", "2025-01-20T13:00:00"],
+                    dtype="datetime64[us]")
+    right = ["2025-01-20T13:00:01", "2025-01-20T13:00:04.5"]
+    assert p3u.join_within_batch(left, right, 1) == ([1, 0], [0, 1])
+    l_idx, r_idx = p3u.join_within_batch(left, right, 1, as_numpy=True)
+    assert isinstance(l_idx, np.ndarray)
+    assert l_idx.tolist() == [1, 0] and r_idx.tolist() == [0, 1]
+    # Test time zones converting outside years 1-9999 still join, bad values
+    # match nothing, as in join_within()
+    edges = ["0001-01-01T00:00:00+05:30", "9999-12-31T23:59:59-01:00"]
+    assert list(p3u.join_within(edges, edges, 1)) == list(zip(edges, edges))
+    assert p3u.join_within_batch(["bad"] + edges, edges[::-1] + ["bad"], 1) == \
+        ([1, 2], [1, 0])
+#endregion test_join_within_numpy()
+
 #region test_to_int()
 def test_to_int():
     assert p3u.to_int(1.0) == 1, "to_int(1.0) does not return 1"
@@ -477,6 +721,41 @@ def test_calculate_duration():
         p3u.calculate_duration(start, "invalid-date")
 #endregion test_calculate_duration()
 
+#region test_calculate_durations()
+def test_calculate_durations():
+    np = pytest.importorskip("numpy")
+    starts = ["2025-01-20T13:00:00", "2025-01-20T13:00:00", "bad",
+              "2025-01-20T13:00:00", "2025-01-20T13:00:00+01:00"]
+    stops = ["2025-01-20T14:30:00", "2025-01-20T12:00:00", "2025-01-20T12:00:00",
+             "2025-01-20T14:00:00+00:00", "2025-01-20T13:00:00+00:00"]
+    assert p3u.calculate_durations(starts, stops).valid == \
+        [True, True, False, False, True]
+    batch = p3u.calculate_durations(starts, stops, as_numpy=True)
+    assert batch.values[:2].tolist() == [1.5, -1.0] and batch.values[4] == 1.0
+    assert batch.errors == [2, 3] and np.isnan(batch.values[2])
+    assert batch.valid.tolist() == [True, True, False, False, True]
+    # Test each row matches calculate_duration(), in each unit
+    for unit in ("hours", "minutes", "seconds"):
+        got = p3u.calculate_durations(starts[:2], stops[:2], unit)
+        assert got.values == [p3u.calculate_duration(a, b, unit)
+                              for a, b in zip(starts[:2], stops[:2])]
+    a = np.array(starts[:2], dtype="datetime64[s]")
+    b = np.array(stops[:2], dtype="datetime64[us]")
+    assert p3u.calculate_durations(a, b, "minutes").values == [90.0, -60.0]
+    # Test time zone aware pairs at the edges of the range, and one mixed
+    edges = ["0001-01-01T00:00:00+05:30", "9999-12-31T23:59:59-01:00"]
+    for as_numpy in (False, True):
+        got = p3u.calculate_durations(edges + [edges[0]],
+                                      edges[::-1] + [starts[0]], as_numpy=as_numpy)
+        assert list(got.values[:2]) == [p3u.calculate_duration(*edges),
+                                        p3u.calculate_duration(*edges[::-1])]
+        assert got.errors == [2]
+    with pytest.raises(ValueError):
+        p3u.calculate_durations(starts, stops, "days")
+    with pytest.raises(ValueError):
+        p3u.calculate_durations(starts, stops[:1])
+#endregion test_calculate_durations()
+
 #region test_default_duration()
 def test_default_duration():
     """Test the default_duration function."""
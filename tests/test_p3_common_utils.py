@@ -3,7 +3,7 @@
 # ---------------------------------------------------------------------------- +
 #region imports
 # python standard libraries
-import pytest
+import pytest, os
 from pathlib import Path
 # third-party libraries
 
@@ -102,6 +102,43 @@ def test_append_cause():
         em = "ValueError: Func-3: >>> "
         assert em in result, f"Expected '{em}' in {result}"
 #endregion test_append_cause() function
+# ---------------------------------------------------------------------------- +
+#region test_walk_exception_chain() function
+def test_walk_exception_chain():
+    # Test a cycle in the chain is visited once
+    a, b = ValueError("a"), TypeError("b")
+    a.__cause__, b.__cause__ = b, a
+    frames = p3u.walk_exception_chain(a)
+    assert [f.type for f in frames] == ["ValueError", "TypeError"]
+    assert [f.relation for f in frames] == ["root", "cause"]
+    result = p3u.append_cause("cycle", a)
+    assert result == "Exception(0): a >>> Exception(0): b", result
+
+    # Test depth bounds the walk of a long chain
+    exc = KeyError(0)
+    for i in range(1, 1000):
+        nxt = KeyError(i)
+        nxt.__context__ = exc
+        exc = nxt
+    assert len(p3u.walk_exception_chain(exc, max_depth=10)) == 10
+    assert len(p3u.walk_exception_chain(exc)) == p3u.EXC_CHAIN_MAX_DEPTH
+    result = p3u.append_cause("long", exc, 2)
+    assert result == "Exception(2): 999 >>> Exception(1): 998 >>> Exception(0): 997"
+    assert len(p3u.append_cause("long", exc, 999, max_chars=100)) < 120
+
+    # Test ExceptionGroup fan-out and structured frame locations
+    try:
+        raise ExceptionGroup("group", [OSError("x"), RuntimeError("y")])
+    except ExceptionGroup as eg:
+        frames = p3u.walk_exception_chain(eg)
+    assert [(f.level, f.relation, f.type) for f in frames] == [
+        (0, "root", "ExceptionGroup"), (1, "group", "OSError"),
+        (1, "group", "RuntimeError")]
+    assert frames[0].filename == "test_p3_common_utils.py"
+    assert frames[0].function == "test_walk_exception_chain"
+    assert frames[0].lineno > 0
+    assert p3u.walk_exception_chain(None) == []
+#endregion test_walk_exception_chain() function
 #endregion Tests for append_cause() function
 # ---------------------------------------------------------------------------- +
 #region Tests for is_file_locked() function
@@ -158,6 +195,96 @@ def test_is_file_locked_with_invalid_path_type():
         f"Expected '{exptd}' but got {str(excinfo.value)}"
 #endregion test_is_file_locked_with_invalid_path_type() function
 # ---------------------------------------------------------------------------- +
+#region test_is_file_locked_probes() function
+@pytest.mark.skipif(os.name == "nt", reason="flock() and /proc/locks are POSIX")
+def test_is_file_locked_probes(tmp_path: Path):
+    import fcntl
+    test_file = tmp_path / "book.xlsx"
+    test_file.write_bytes(b"x" * 1024)
+    assert p3u.is_file_locked(test_file) is False
+    assert p3u.is_file_locked(str(test_file)) is False
+    # Test the probe leaves no sidecar files behind
+    assert [p.name for p in tmp_path.iterdir()] == ["book.xlsx"]
+
+    # Test a flock() held on another open file
+    with open(test_file, "rb") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        assert p3u.is_file_locked(test_file) is True
+    assert p3u.is_file_locked(test_file) is False
+
+    # Test an Office owner file
+    owner = tmp_path / "~$book.xlsx"
+    owner.write_bytes(b"owner")
+    assert p3u.is_file_locked(test_file) is True
+    assert p3u.is_file_locked(test_file, office=False) is False
+    owner.unlink()
+
+    # Test a POSIX lockf() held by another process, seen by both probes
+    import subprocess, sys
+    holder = subprocess.Popen(
+        [sys.executable, "-c", "import fcntl, sys; f = open(sys.argv[1], 'r+b'); "
+         "fcntl.lockf(f.fileno(), fcntl.LOCK_EX); print('locked', flush=True); "
+         "sys.stdin.read()", str(test_file)],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+    try:
+        assert holder.stdout.readline().strip() == "locked"
+        assert p3u.is_file_locked(test_file) is True
+        assert p3u.is_file_locked(test_file, proc_locks=False) is True
+    finally:
+        holder.communicate("")
+    assert p3u.is_file_locked(test_file) is False
+
+    # Test the caller's own lockf() is not reported, nor dropped by the probe
+    if Path("/proc/locks").exists():
+        with open(test_file, "r+b") as f:
+            fcntl.lockf(f.fileno(), fcntl.LOCK_EX)
+            assert p3u.is_file_locked(test_file) is False
+            probe = subprocess.run(
+                [sys.executable, "-c", "import fcntl, sys; f = open(sys.argv[1], "
+                 "'r+b'); fcntl.lockf(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)",
+                 str(test_file)], capture_output=True)
+            assert probe.returncode != 0, "the probe released the caller's lock"
+#endregion test_is_file_locked_probes() function
+# ---------------------------------------------------------------------------- +
+#region test_are_files_locked() function
+@pytest.mark.skipif(os.name == "nt", reason="flock() is POSIX")
+def test_are_files_locked(tmp_path: Path):
+    import fcntl, threading, asyncio
+    files = [tmp_path / f"f{i}.csv" for i in range(4)]
+    for f in files:
+        f.write_text("x")
+    (tmp_path / "~$f1.csv").write_text("owner")
+    missing = tmp_path / "missing.csv"
+    with open(files[2], "rb") as held:
+        fcntl.flock(held.fileno(), fcntl.LOCK_EX)
+        result = p3u.are_files_locked(files + [missing, None], workers=4)
+        assert result == {files[0]: False, files[1]: True, files[2]: True,
+                          files[3]: False, missing: False}
+        # Test timeout returns the files still locked
+        pending = p3u.wait_until_unlocked(files, timeout=0.1, initial_delay=0.01)
+        assert pending == [files[1], files[2]]
+    with pytest.raises(TypeError):
+        p3u.are_files_locked([files[0], 123], errors='strict')
+
+    # Test the wait ends soon after the lock is released
+    held = open(files[2], "rb")
+    fcntl.flock(held.fileno(), fcntl.LOCK_EX)
+    threading.Timer(0.1, held.close).start()
+    start = p3u.start_timer()
+    assert p3u.wait_until_unlocked(str(files[2]), timeout=5, initial_delay=0.01,
+                                   max_delay=0.05) == []
+    assert p3u.elapsed_timer(start) < 2
+
+    # Test the asyncio variant
+    held = open(files[3], "rb")
+    fcntl.flock(held.fileno(), fcntl.LOCK_EX)
+    threading.Timer(0.1, held.close).start()
+    assert asyncio.run(p3u.async_wait_until_unlocked(
+        files[3], timeout=5, initial_delay=0.01, max_delay=0.05)) == []
+    assert asyncio.run(p3u.async_wait_until_unlocked(
+        files[1], timeout=0.05, initial_delay=0.01)) == [files[1]]
+#endregion test_are_files_locked() function
+# ---------------------------------------------------------------------------- +
 #endregion Tests for is_file_locked() function
 # ---------------------------------------------------------------------------- +
 #region Tests for out_msg() function
@@ -218,4 +345,102 @@ def test_exc_msg():
         result = p3u.exc_msg(None, e)
     assert result == exptd, f"Expected '{exptd}' bug got '{result}'"
 #endregion test_exc_msg() function
-# ---------------------------------------------------------------------------- +
\ No newline at end of file
+# ---------------------------------------------------------------------------- +
+#region Tests for fault points, force_exception() and check_testcase()
+# ---------------------------------------------------------------------------- +
+#region test_fault_point() function
+def test_fault_point():
+    # Test nothing armed, fault_point() does nothing
+    p3u.disarm_fault()
+    assert p3u.fault_point("test.point") is None
+
+    # Test armed with a count, fires count times then disarms itself
+    spec = p3u.arm_fault("test.point", exc="ValueError", count=2)
+    for _ in range(2):
+        with pytest.raises(ValueError) as excinfo:
+            p3u.fault_point("test.point")
+        assert "test.point" in str(excinfo.value)
+    assert spec.fired == 2
+    assert "test.point" not in p3u.armed_faults()
+    p3u.fault_point("test.point")
+
+    # Test probability 0.0 never fires, other names are not affected
+    with p3u.fault_injection("test.point", exc=KeyError, probability=0.0):
+        p3u.fault_point("test.point")
+        p3u.fault_point("test.other")
+    assert len(p3u.armed_faults()) == 0
+
+    # Test latency only, no exception
+    with p3u.fault_injection("test.slow", exc=None, latency=0.01) as spec:
+        start = p3u.start_timer()
+        p3u.fault_point("test.slow")
+        assert p3u.elapsed_timer(start) >= 0.01
+        assert spec.fired == 1
+
+    # Test invalid arguments
+    with pytest.raises(TypeError): p3u.arm_fault("")
+    with pytest.raises(TypeError): p3u.arm_fault("test.point", exc="NotAnError")
+    with pytest.raises(ValueError): p3u.arm_fault("test.point", probability=2)
+    with pytest.raises(ValueError): p3u.arm_fault("test.point", count=0)
+    assert len(p3u.armed_faults()) == 0
+#endregion test_fault_point() function
+# ---------------------------------------------------------------------------- +
+#region test_load_faults_from_env() function
+def test_load_faults_from_env():
+    specs = p3u.load_faults_from_env("a.b=PermissionError:p=1:n=1; c.d=:latency=0")
+    assert [s.name for s in specs] == ["a.b", "c.d"]
+    assert specs[1].exc is None
+    with pytest.raises(PermissionError):
+        p3u.fault_point("a.b")
+    p3u.fault_point("a.b")
+    p3u.disarm_fault("c.d")
+    assert len(p3u.armed_faults()) == 0
+    with pytest.raises(ValueError):
+        p3u.load_faults_from_env("a.b=KeyError:bogus=1")
+#endregion test_load_faults_from_env() function
+# ---------------------------------------------------------------------------- +
+#region test_check_testcase() function
+def test_check_testcase():
+    def test_func():
+        pass
+    # Test not a test case, returns a reason str
+    result = p3u.check_testcase(test_func, "not_forced")
+    assert "not equal to p3l.FORCE_EXCEPTION" in result
+    result = p3u.check_testcase(test_func, None)
+    assert "not a non-empty string" in result
+    result = p3u.check_testcase(test_func, p3u.FORCE_EXCEPTION, "NoSuchError")
+    assert "not a valid exception class name" in result
+
+    # Test the forced exception, by name and by class
+    with pytest.raises(ZeroDivisionError) as excinfo:
+        p3u.check_testcase(test_func, p3u.FORCE_EXCEPTION)
+    assert "func:test_func()" in str(excinfo.value)
+    with pytest.raises(KeyError):
+        p3u.check_testcase(test_func, p3u.FORCE_EXCEPTION, KeyError)
+    with pytest.raises(ValueError):
+        p3u.force_exception(test_func, ValueError("forced"))
+    with pytest.raises(ZeroDivisionError):
+        p3u.force_exception(None)
+    assert len(p3u.armed_faults()) == 0
+
+    # Test a fault armed at the point fires instead, and concurrent calls
+    # all raise
+    with p3u.fault_injection("force_exception.test_func", exc=KeyError):
+        with pytest.raises(KeyError):
+            p3u.force_exception(test_func)
+    import threading
+    raised = []
+    def force_many():
+        for _ in range(1000):
+            try:
+                p3u.force_exception(test_func)
+            except ZeroDivisionError:
+                raised.append(1)
+    threads = [threading.Thread(target=force_many) for _ in range(4)]
+    for t in threads: t.start()
+    for t in threads: t.join()
+    assert len(raised) == 4000
+#endregion test_check_testcase() function
+# ---------------------------------------------------------------------------- +
+#endregion Tests for fault points, force_exception() and check_testcase()
+# ---------------------------------------------------------------------------- +
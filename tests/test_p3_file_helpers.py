@@ -0,0 +1,513 @@
+# ---------------------------------------------------------------------------- +
+# test_p3_file_helpers.py
+# ---------------------------------------------------------------------------- +
+#region imports
+# python standard libraries
+import pytest, os
+from pathlib import Path
+# third-party libraries
+
+# local libraries
+import p3_utils as p3u
+#endregion imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+THIS_APP_NAME = "Test_p3_file_helpers"
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+#region Tests for find_folder() function
+# ---------------------------------------------------------------------------- +
+#region test_find_folder() function
+def test_find_folder(tmp_path: Path):
+    (tmp_path / "a" / "b" / "c" / "target").mkdir(parents=True)
+    (tmp_path / "node_modules" / "target").mkdir(parents=True)
+    (tmp_path / "z" / "target").mkdir(parents=True)
+    (tmp_path / "file_target").write_text("not a folder")
+    # Test same first match as rglob(), and each walk option
+    legacy = next(p for p in tmp_path.rglob("target") if p.is_dir())
+    assert p3u.find_folder("target", tmp_path) == legacy
+    assert p3u.find_folder("target", tmp_path, order="bfs").parent.name in \
+        ("node_modules", "z")
+    assert p3u.find_folder("target", tmp_path, exclude=p3u.FIND_FOLDER_EXCLUDES,
+                           order="bfs") == tmp_path / "z" / "target"
+    assert p3u.find_folder("target", tmp_path, max_depth=3,
+                           exclude=["node_modules", "z"]) is None
+    assert p3u.find_folder("target", tmp_path, max_depth=4,
+                           exclude=["node_modules", "z"]) == \
+        tmp_path / "a" / "b" / "c" / "target"
+    assert p3u.find_folder("target", tmp_path, workers=4).name == "target"
+    assert p3u.find_folder("c", tmp_path, workers=4) == tmp_path / "a" / "b" / "c"
+    # Test patterns, files are not matched, and no match
+    assert p3u.find_folder("*target", tmp_path).name == "target"
+    assert p3u.find_folder("b/c", tmp_path) == tmp_path / "a" / "b" / "c"
+    assert p3u.find_folder("missing", tmp_path) is None
+    assert p3u.find_folder("missing", tmp_path, workers=4) is None
+    with pytest.raises(ValueError):
+        p3u.find_folder("target", tmp_path, order="sideways")
+#endregion test_find_folder() function
+# ---------------------------------------------------------------------------- +
+#region test_folder_index() function
+def test_folder_index(tmp_path: Path):
+    root = tmp_path / "root"
+    (root / "a" / "b" / "target").mkdir(parents=True)
+    (root / "node_modules" / "target").mkdir(parents=True)
+    (root / "data_1").mkdir()
+    db = tmp_path / "index.sqlite"
+    with p3u.FolderIndex(root, db, exclude=["node_modules"]) as index:
+        # Test first lookup builds the index, shallowest match first
+        assert index.find("target") == root / "a" / "b" / "target"
+        assert index.find_all("data_*") == [root / "data_1"]
+        assert index.find("missing") is None
+        assert len(index) == 4
+        assert p3u.find_folder("target", index=index) == root / "a" / "b" / "target"
+        assert p3u.find_folder("target", index=index, max_depth=2) is None
+        # Test incremental refresh picks up added and removed folders
+        (root / "target").mkdir()
+        (root / "a" / "b" / "target").rmdir()
+        (root / "data_1" / "new" / "deep").mkdir(parents=True)
+        assert index.refresh() == 0  # still fresh, max_age not reached
+        assert index.refresh(force=True) > 0
+        assert index.find_all("target") == [root / "target"]
+        assert index.find("deep") == root / "data_1" / "new" / "deep"
+    # Test another process' index loads the persisted folders
+    with p3u.FolderIndex(root, db, exclude=["node_modules"]) as index:
+        assert index.find("deep") == root / "data_1" / "new" / "deep"
+    # Test different options rebuild the index
+    with p3u.FolderIndex(root, db) as index:
+        assert index.find_all("target") == [root / "target",
+                                            root / "node_modules" / "target"]
+#endregion test_folder_index() function
+# ---------------------------------------------------------------------------- +
+#endregion Tests for find_folder() function
+# ---------------------------------------------------------------------------- +
+#region Tests for copy_backup() function
+# ---------------------------------------------------------------------------- +
+#region test_copy_backup() function
+def test_copy_backup(tmp_path: Path):
+    src = tmp_path / "data.csv"
+    src.write_text("a,b\n1,2\n")
+    # Test first backup is _v1, in a folder named relative to src
+    result = p3u.copy_backup(src, "backup")
+    dst_folder = tmp_path / "backup"
+    assert result == [dst_folder / "data_v1.csv"], f"Got {result}"
+    assert result[0].read_text() == src.read_text()
+
+    # Test versions continue after the highest existing version
+    (dst_folder / "data_v7.csv").write_text("old")
+    (dst_folder / "data_vX.csv").write_text("not a version")
+    (dst_folder / "other_v20.csv").write_text("other stem")
+    result = p3u.copy_backup(src, dst_folder)
+    assert result == [dst_folder / "data_v8.csv"], f"Got {result}"
+
+    # Test a glob backs up each matched file
+    (tmp_path / "more.csv").write_text("c\n3\n")
+    result = p3u.copy_backup(tmp_path / "*.csv", dst_folder)
+    assert sorted(p.name for p in result) == ["data_v9.csv", "more_v1.csv"]
+
+    # Test a non-existent source copies nothing
+    assert p3u.copy_backup(tmp_path / "missing.csv", dst_folder) == []
+#endregion test_copy_backup() function
+# ---------------------------------------------------------------------------- +
+#region test_copy_backup_reserve_collision() function
+def test_copy_backup_reserve_collision(tmp_path: Path):
+    from p3_utils.p3_file_helpers import _reserve_backup_path
+    # Test a stale index skips versions created by another process
+    (tmp_path / "data_v1.csv").write_text("taken")
+    (tmp_path / "data_v2.csv").write_text("taken")
+    index = {}
+    dst = _reserve_backup_path(tmp_path, "data", ".csv", index)
+    assert dst.name == "data_v3.csv" and dst.exists()
+    assert index[("data", ".csv")] == 3
+
+    # Test a failed copy releases the reserved name
+    src = tmp_path / "x.txt"
+    src.write_text("x")
+    with p3u.fault_injection("file.copy_backup", exc=OSError):
+        assert p3u.copy_backup(src, tmp_path / "bak") == []
+    assert list((tmp_path / "bak").iterdir()) == []
+#endregion test_copy_backup_reserve_collision() function
+# ---------------------------------------------------------------------------- +
+#region test_backup_files() function
+def test_backup_files(tmp_path: Path, monkeypatch):
+    sizes = {f"f{i}.csv": 1000 * (i + 1) for i in range(8)}
+    for name, size in sizes.items():
+        (tmp_path / name).write_bytes(os.urandom(size))
+    (tmp_path / "empty.csv").write_bytes(b"")
+    # Test parallel copies match the sources, in glob order
+    result = p3u.backup_files(tmp_path / "*.csv", "bak", workers=4)
+    assert result.ok, result.errors
+    assert len(result.copied) == 9
+    assert result.bytes_copied == sum(sizes.values())
+    assert result.elapsed > 0 and result.throughput > 0
+    for dst in result.copied:
+        src = tmp_path / dst.name.replace("_v1", "")
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mtime == src.stat().st_mtime
+
+    # Test one failing copy is reported, the rest still copied
+    with p3u.fault_injection("file.copy_backup", exc=PermissionError, count=1):
+        result = p3u.backup_files(tmp_path / "*.csv", "bak", workers=4)
+    assert len(result.errors) == 1 and len(result.copied) == 8
+    assert "PermissionError" in next(iter(result.errors.values()))
+    assert len(list((tmp_path / "bak").glob("*_v2.csv"))) == 8
+
+    # Test copy_file_range() copying nothing falls back, stopping short raises
+    if hasattr(os, "copy_file_range"):
+        monkeypatch.setattr(os, "copy_file_range", lambda src, dst, n: 0)
+        result = p3u.backup_files(tmp_path / "f1.csv", "bak")
+        assert result.ok, result.errors
+        assert result.copied[0].read_bytes() == (tmp_path / "f1.csv").read_bytes()
+        monkeypatch.setattr(os, "copy_file_range",
+                            lambda src, dst, n, calls=iter([100]):
+                            next(calls, 0))
+        result = p3u.backup_files(tmp_path / "f1.csv", "bak")
+        assert len(result.errors) == 1 and "stopped at byte 100" in \
+            next(iter(result.errors.values()))
+        monkeypatch.undo()
+
+    # Test an invalid src_path type
+    with pytest.raises(TypeError):
+        p3u.backup_files(str(tmp_path), "bak")
+    assert p3u.copy_backup(str(tmp_path), "bak") == []
+#endregion test_backup_files() function
+# ---------------------------------------------------------------------------- +
+#region test_backup_files_incremental() function
+def test_backup_files_incremental(tmp_path: Path):
+    (tmp_path / "a.csv").write_text("same content\n")
+    (tmp_path / "b.csv").write_text("same content\n")
+    (tmp_path / "c.csv").write_text("other content\n")
+    dst_folder = tmp_path / "bak"
+    # Test first run copies c.csv and one of a/b, links the duplicate
+    result = p3u.backup_files(tmp_path / "*.csv", dst_folder, incremental=True)
+    assert result.ok, result.errors
+    assert len(result.copied) == 3 and len(result.linked) == 1
+    assert result.linked[0].stat().st_nlink == 2
+    assert (dst_folder / ".p3_backup_manifest.json").exists()
+
+    # Test second run skips everything by metadata
+    result = p3u.backup_files(tmp_path / "*.csv", dst_folder, incremental=True,
+                              workers=2)
+    assert result.copied == [] and len(result.skipped) == 3
+
+    # Test touched but unchanged content is skipped by hash
+    os.utime(tmp_path / "c.csv", ns=(1, 1))
+    result = p3u.backup_files(tmp_path / "*.csv", dst_folder, incremental=True)
+    assert result.copied == [] and len(result.skipped) == 3
+
+    # Test changed content gets a new version, reverted content a link
+    (tmp_path / "c.csv").write_text("changed content\n")
+    result = p3u.backup_files(tmp_path / "c.csv", dst_folder, incremental=True)
+    assert result.copied == [dst_folder / "c_v2.csv"] and result.linked == []
+    (tmp_path / "c.csv").write_text("other content\n")
+    result = p3u.copy_backup(tmp_path / "c.csv", dst_folder, incremental=True)
+    assert result == [dst_folder / "c_v3.csv"]
+    assert (dst_folder / "c_v3.csv").samefile(dst_folder / "c_v1.csv")
+
+    # Test a pruned backup whose name is reused is not linked to
+    (tmp_path / "d.csv").write_text("XXXX")
+    p3u.backup_files(tmp_path / "d.csv", dst_folder, incremental=True)
+    (dst_folder / "d_v1.csv").unlink()
+    (tmp_path / "d.csv").write_text("YYYYYY")
+    p3u.backup_files(tmp_path / "d.csv", dst_folder, incremental=True)
+    (tmp_path / "e.csv").write_text("XXXX")
+    result = p3u.backup_files(tmp_path / "e.csv", dst_folder, incremental=True)
+    assert result.linked == [] and (dst_folder / "e_v1.csv").read_text() == "XXXX"
+    # Test reusing a backup name drops only the content entry it held
+    import hashlib, json
+    def content_keys():
+        manifest = json.loads((dst_folder / ".p3_backup_manifest.json").read_text())
+        return {v["backup"]: k for k, v in manifest["content"].items()}
+    before = content_keys()
+    (dst_folder / "e_v1.csv").unlink()
+    (tmp_path / "e.csv").write_text("ZZZ")
+    p3u.backup_files(tmp_path / "e.csv", dst_folder, incremental=True)
+    after = content_keys()
+    assert after.pop("e_v1.csv") == hashlib.sha256(b"ZZZ").hexdigest()
+    assert after == {k: v for k, v in before.items() if k != "e_v1.csv"}
+
+    # Test concurrent runs into one folder keep every manifest entry
+    import threading
+    names = [f"t{i}.csv" for i in range(8)]
+    for i, name in enumerate(names):
+        (tmp_path / name).write_text(f"thread {i}\n")
+    threads = [threading.Thread(target=p3u.backup_files,
+                                args=(tmp_path / name, dst_folder),
+                                kwargs={"incremental": True}) for name in names]
+    for t in threads: t.start()
+    for t in threads: t.join()
+    manifest = json.loads((dst_folder / ".p3_backup_manifest.json").read_text())
+    assert all(str(tmp_path / name) in manifest["files"] for name in names)
+
+    # Test a corrupt manifest starts over
+    (dst_folder / ".p3_backup_manifest.json").write_text("{not json")
+    result = p3u.backup_files(tmp_path / "a.csv", dst_folder, incremental=True)
+    assert result.ok and len(result.copied) == 1
+#endregion test_backup_files_incremental() function
+# ---------------------------------------------------------------------------- +
+#region test_backup_files_compressed() function
+def test_backup_files_compressed(tmp_path: Path):
+    content = b"id,value\n" + b"".join(b"%d,%d\n" % (i, i * i) for i in range(5000))
+    for name in ("a.csv", "b.csv"):
+        (tmp_path / name).write_bytes(content)
+    dst_folder = tmp_path / "bak"
+    # Test versions are shared by plain and compressed backups
+    p3u.copy_backup(tmp_path / "a.csv", dst_folder)
+    for method, ext in (("gzip", ".gz"), ("bz2", ".bz2"), ("lzma", ".xz")):
+        result = p3u.backup_files(tmp_path / "a.csv", dst_folder, compress=method)
+        assert result.ok, result.errors
+        assert result.copied[0].name.endswith(f".csv{ext}")
+        assert result.bytes_written < result.bytes_copied == len(content)
+        restored = p3u.restore_backup(result.copied[0], tmp_path / f"r{ext}")
+        assert restored.read_bytes() == content
+    assert sorted(p.name for p in dst_folder.iterdir()) == [
+        "a_v1.csv", "a_v2.csv.gz", "a_v3.csv.bz2", "a_v4.csv.xz"]
+
+    # Test a glob compressed in parallel processes, restored into a folder
+    result = p3u.backup_files(tmp_path / "*.csv", dst_folder, workers=2,
+                              compress="gzip")
+    assert result.ok, result.errors
+    assert sorted(p.name for p in result.copied) == ["a_v5.csv.gz", "b_v1.csv.gz"]
+    restore_folder = tmp_path / "restored"
+    restore_folder.mkdir()
+    restored = p3u.restore_backup(dst_folder / "b_v1.csv.gz", restore_folder)
+    assert restored == restore_folder / "b.csv"
+    assert restored.read_bytes() == content
+    assert p3u.restore_backup(dst_folder / "a_v1.csv", restore_folder).name == "a.csv"
+
+    # Test an unknown compression method
+    with pytest.raises(ValueError):
+        p3u.backup_files(tmp_path / "a.csv", dst_folder, compress="zip")
+#endregion test_backup_files_compressed() function
+# ---------------------------------------------------------------------------- +
+#endregion Tests for copy_backup() function
+# ---------------------------------------------------------------------------- +
+# ---------------------------------------------------------------------------- +
+#region Tests for FolderWatcher class
+# ---------------------------------------------------------------------------- +
+#region test_folder_watcher() function
+@pytest.mark.parametrize("use_inotify", [False, True])
+def test_folder_watcher(tmp_path: Path, use_inotify: bool):
+    (tmp_path / "old.csv").write_text("a")
+    (tmp_path / "gone.csv").write_text("b")
+    with p3u.FolderWatcher(tmp_path, "*.csv", use_inotify=use_inotify) as watcher:
+        # Test existing files are the snapshot, not events
+        assert watcher.poll() == []
+        (tmp_path / "new.csv").write_text("c")
+        (tmp_path / "old.csv").write_text("longer")
+        (tmp_path / "gone.csv").unlink()
+        (tmp_path / "skip.txt").write_text("d")
+        events = {(e.kind, e.path.name) for e in watcher.poll()}
+        assert events == {("created", "new.csv"), ("modified", "old.csv"),
+                          ("deleted", "gone.csv")}
+        assert watcher.poll() == []
+#endregion test_folder_watcher() function
+# ---------------------------------------------------------------------------- +
+#region test_folder_watcher_stable_for() function
+def test_folder_watcher_stable_for(tmp_path: Path):
+    with p3u.FolderWatcher(tmp_path, stable_for=0.2) as watcher:
+        (tmp_path / "growing.csv").write_text("a")
+        (tmp_path / "brief.csv").write_text("b")
+        assert watcher.poll() == []  # not stable yet
+        (tmp_path / "growing.csv").write_text("ab")
+        (tmp_path / "brief.csv").unlink()
+        assert watcher.poll() == []
+        events = list(watcher.watch(interval=0.05, timeout=1.0))
+        assert [(e.kind, e.path.name, e.size) for e in events] == \
+            [("created", "growing.csv", 2)]
+#endregion test_folder_watcher_stable_for() function
+# ---------------------------------------------------------------------------- +
+#endregion Tests for FolderWatcher class
+# ---------------------------------------------------------------------------- +
+#region Tests for stat cache functions
+# ---------------------------------------------------------------------------- +
+#region test_stat_cache_scope() function
+def test_stat_cache_scope(tmp_path: Path):
+    f = tmp_path / "data.csv"
+    f.write_text("a,b")
+    p3u.stat_cache_stats(reset=True)
+    # Test verify_file_path_for_load() stats the file once
+    p3u.verify_file_path_for_load(f)
+    stats = p3u.stat_cache_stats(reset=True)
+    assert stats["syscalls"] == 1 and stats["saved"] == 2
+    assert stats["entries"] == 0  # nothing cached outside a scope
+    # Test a wider scope shares results between helpers
+    with p3u.stat_cache_scope(ttl=60):
+        p3u.verify_file_path_for_load(f)
+        assert p3u.is_valid_path("f", f)
+        assert not p3u.is_file_locked(f)
+        f.unlink()
+        assert p3u.path_exists(f)  # stale until invalidated
+        p3u.invalidate_stat(f)
+        assert not p3u.path_exists(f)
+        with pytest.raises(FileNotFoundError):
+            p3u.verify_file_path_for_load(f)
+    stats = p3u.stat_cache_stats(reset=True)
+    assert stats["syscalls"] == 2 and stats["saved"] == 6
+    # Test the cache is off outside of scopes
+    f.write_text("back")
+    assert p3u.path_is_file(f) and not p3u.path_is_dir(f)
+
+    # Test another thread's scope does not cache this thread's stats
+    import threading
+    entered, done = threading.Event(), threading.Event()
+    def hold_scope():
+        with p3u.stat_cache_scope(ttl=60):
+            entered.set()
+            done.wait(5)
+    holder = threading.Thread(target=hold_scope)
+    holder.start()
+    entered.wait(5)
+    g = tmp_path / "new.csv"
+    assert not p3u.path_exists(g)
+    g.write_text("new")
+    assert p3u.path_exists(g)
+    done.set()
+    holder.join()
+#endregion test_stat_cache_scope() function
+# ---------------------------------------------------------------------------- +
+#endregion Tests for stat cache functions
+# ---------------------------------------------------------------------------- +
+#region Tests for bulk path verification functions
+# ---------------------------------------------------------------------------- +
+#region test_verify_file_paths_for_load() function
+@pytest.mark.parametrize("workers", [1, 4])
+def test_verify_file_paths_for_load(tmp_path: Path, workers: int):
+    paths = []
+    for i in range(12):  # enough to list the folder
+        (tmp_path / f"f{i}.csv").write_text("a")
+        paths.append(tmp_path / f"f{i}.csv")
+    (tmp_path / "empty.json").touch()
+    (tmp_path / "bad.exe").write_text("a")
+    (tmp_path / "sub.csv").mkdir()
+    other = tmp_path / "other"
+    other.mkdir()
+    (other / "g.toml").write_text("a=1")
+    bad = [tmp_path / "missing.csv", tmp_path / "empty.json",
+           tmp_path / "bad.exe", tmp_path / "sub.csv", other / "nope.txt",
+           tmp_path / "gone" / "x.csv", "not a path"]
+    report = p3u.verify_file_paths_for_load(paths + [other / "g.toml"] + bad,
+                                            workers=workers)
+    assert report.valid == paths + [other / "g.toml"]
+    assert not report.ok and set(report.failures) == set(bad)
+    # Test the failures match the single path function's exceptions
+    for path, error in report.failures.items():
+        with pytest.raises(type(error)) as excinfo:
+            p3u.verify_file_path_for_load(path)
+        assert str(excinfo.value) == str(error)
+#endregion test_verify_file_paths_for_load() function
+# ---------------------------------------------------------------------------- +
+#region test_verify_file_paths_for_save() function
+def test_verify_file_paths_for_save(tmp_path: Path):
+    (tmp_path / "exists.csv").write_text("a")
+    (tmp_path / "sub.json").mkdir()
+    good = [tmp_path / "exists.csv", tmp_path / "new.xlsx"] + \
+        [tmp_path / f"n{i}.json" for i in range(10)]
+    bad = [tmp_path / "sub.json", tmp_path / "new.toml",
+           tmp_path / "gone" / "x.csv"]
+    report = p3u.verify_file_paths_for_save(good + bad)
+    assert report.valid == good and set(report.failures) == set(bad)
+    for path, error in report.failures.items():
+        with pytest.raises(type(error)) as excinfo:
+            p3u.verify_file_path_for_save(path)
+        assert str(excinfo.value) == str(error)
+#endregion test_verify_file_paths_for_save() function
+# ---------------------------------------------------------------------------- +
+#endregion Tests for bulk path verification functions
+# ---------------------------------------------------------------------------- +
+#region Tests for atomic_write() function
+# ---------------------------------------------------------------------------- +
+#region test_atomic_write() function
+@pytest.mark.parametrize("durability", p3u.ATOMIC_WRITE_DURABILITY)
+def test_atomic_write(tmp_path: Path, durability: str):
+    f = tmp_path / "data.csv"
+    with p3u.atomic_write(f, durability=durability) as out:
+        out.write("a,b\n")
+    assert f.read_text() == "a,b\n"
+    # Test an error in the with block leaves the old file, and no temp file
+    with pytest.raises(RuntimeError):
+        with p3u.atomic_write(f) as out:
+            out.write("torn")
+            raise RuntimeError("crash")
+    assert f.read_text() == "a,b\n"
+    # Test a failing rename leaves the old file
+    with p3u.fault_injection("file.atomic_write", exc=OSError):
+        with pytest.raises(OSError):
+            with p3u.atomic_write(f, "wb") as out:
+                out.write(b"new")
+    assert f.read_text() == "a,b\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["data.csv"]
+    # Test unsupported suffixes are refused by verify_file_path_for_save()
+    with pytest.raises(ValueError):
+        with p3u.atomic_write(tmp_path / "data.exe") as out:
+            pass
+#endregion test_atomic_write() function
+# ---------------------------------------------------------------------------- +
+#region test_atomic_write_group() function
+@pytest.mark.parametrize("use_syncfs", [False, True])
+def test_atomic_write_group(tmp_path: Path, use_syncfs: bool):
+    paths = [tmp_path / f"f{i}.json" for i in range(20)]
+    with p3u.AtomicWriteGroup(use_syncfs=use_syncfs) as group:
+        for i, p in enumerate(paths):
+            with p3u.atomic_write(p, group=group) as out:
+                out.write(str(i))
+        assert not any(p.exists() for p in paths)  # published on commit
+    assert [p.read_text() for p in paths] == [str(i) for i in range(20)]
+    # Test nothing is published when the group's with block raises
+    with pytest.raises(RuntimeError):
+        with p3u.AtomicWriteGroup() as group:
+            with p3u.atomic_write(paths[0], group=group) as out:
+                out.write("new")
+            raise RuntimeError("crash")
+    assert paths[0].read_text() == "0"
+    assert len(list(tmp_path.iterdir())) == 20
+#endregion test_atomic_write_group() function
+# ---------------------------------------------------------------------------- +
+#endregion Tests for atomic_write() function
+# ---------------------------------------------------------------------------- +
+#region Tests for read_csv_columns() function
+# ---------------------------------------------------------------------------- +
+#region test_read_csv_columns() function
+@pytest.mark.parametrize("workers", [1, 2])
+def test_read_csv_columns(tmp_path: Path, workers: int):
+    import csv
+    f = tmp_path / "data.csv"
+    rows = [[str(i), f"name, {i}" if i % 3 else f'say "{i}"\nok', str(i * 0.5)]
+            for i in range(200)]
+    with open(f, "w", newline="", encoding="utf-8-sig") as out:
+        writer = csv.writer(out)
+        writer.writerow(["id", "name", "amount"])
+        writer.writerows(rows)
+    # Test small chunks, split at record starts between quoted newlines
+    got = p3u.read_csv_columns(f, ["amount", "name", 0], dtypes={"amount": float},
+                               workers=workers, chunk_size=256)
+    assert got["amount"] == [i * 0.5 for i in range(200)]
+    assert got["name"] == [r[1] for r in rows]
+    assert got[0] == [r[0] for r in rows]
+    # Test CRLF lines, quoted fields on one line, short rows, blank lines
+    text = 'id,name,amount\r\n1,"a, b",2\r\n2\r\n\r\n3,"say ""hi""",4.5\r\n'
+    for body in (text, text.replace("\r\n\r\n", "\r\n"), text.replace('"', "")):
+        f.write_bytes(body.encode())
+        expected = list(zip(*(r + [""] * (3 - len(r)) for r in
+                              csv.reader(body.splitlines()[1:]) if r)))
+        got = p3u.read_csv_columns(f, ["amount", "name", "id"], workers=workers)
+        assert [got["id"], got["name"], got["amount"]] == \
+            [list(c) for c in expected]
+    with pytest.raises(ValueError):
+        p3u.read_csv_columns(f, ["missing"])
+#endregion test_read_csv_columns() function
+# ---------------------------------------------------------------------------- +
+#region test_read_csv_columns_numpy() function
+def test_read_csv_columns_numpy(tmp_path: Path):
+    np = pytest.importorskip("numpy")
+    f = tmp_path / "data.csv"
+    f.write_text("a,b,c\n1,x,2.5\n2,y,3.5\n")
+    got = p3u.read_csv_columns(f, ["a", "c"], dtypes={"a": np.int64, "c": float},
+                               as_numpy=True)
+    assert got["a"].dtype == np.int64 and got["a"].tolist() == [1, 2]
+    assert got["c"].tolist() == [2.5, 3.5]
+    f.write_text("")
+    assert p3u.read_csv_columns(f, ["a"], as_numpy=True)["a"].size == 0
+#endregion test_read_csv_columns_numpy() function
+# ---------------------------------------------------------------------------- +
+#endregion Tests for read_csv_columns() function
+# ---------------------------------------------------------------------------- +
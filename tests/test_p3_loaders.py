@@ -0,0 +1,204 @@
+# ---------------------------------------------------------------------------- +
+# test_p3_loaders.py
+# ---------------------------------------------------------------------------- +
+#region imports
+# python standard libraries
+import pytest, functools, json
+from pathlib import Path
+# third-party libraries
+from openpyxl import Workbook
+# local libraries
+import p3_utils as p3u
+#endregion imports
+# ---------------------------------------------------------------------------- +
+#region Globals
+THIS_APP_NAME = "Test_p3_loaders"
+#endregion Globals
+# ---------------------------------------------------------------------------- +
+#region Tests for load_records() function
+# ---------------------------------------------------------------------------- +
+#region test_load_records_csv() function
+def test_load_records_csv(tmp_path: Path):
+    f = tmp_path / "data.csv"
+    f.write_text('a,b\n1,"x, y"\n2,"multi\nline"\n3,z\n')
+    batches = list(p3u.load_records(f, batch_size=2))
+    assert batches == [[{"a": "1", "b": "x, y"}, {"a": "2", "b": "multi\nline"}],
+                       [{"a": "3", "b": "z"}]]
+    assert list(p3u.load_records(f, columnar=True)) == \
+        [{"a": ["1", "2", "3"], "b": ["x, y", "multi\nline", "z"]}]
+    # Test verification happens when called, not on the first batch
+    with pytest.raises(FileNotFoundError):
+        p3u.load_records(tmp_path / "missing.csv")
+    with pytest.raises(ValueError):
+        p3u.load_records(f, batch_size=0)
+#endregion test_load_records_csv() function
+# ---------------------------------------------------------------------------- +
+#region test_load_records_json() function
+def test_load_records_json(tmp_path: Path):
+    records = [{"id": i, "name": f"n{i}", "tags": ["a"] * (i % 3)}
+               for i in range(500)]
+    f = tmp_path / "data.json"
+    f.write_text(json.dumps(records, indent=1))
+    assert [r for b in p3u.load_records(f, batch_size=64) for r in b] == records
+    # Test JSON-lines, and values split across chunks
+    f.write_text("\n".join(json.dumps(r) for r in records))
+    assert [r for b in p3u.load_records(f) for r in b] == records
+    text = json.dumps([12345, "a]b", {"k": [1, 2]}, 6.5e3])
+    assert list(p3u.iter_json_values(text[i:i + 3]
+                                     for i in range(0, len(text), 3))) == \
+        [12345, "a]b", {"k": [1, 2]}, 6.5e3]
+    with pytest.raises(json.JSONDecodeError):
+        list(p3u.iter_json_values(['[{"a": 1}, {"b": ]']))
+    # Test commas, the closing ']' and what follows it are checked
+    for bad in ("[1,,2]", "[1 2]", "[,1]", "[1,]", "[1,2", "[1,2] [3,4]"):
+        with pytest.raises(json.JSONDecodeError):
+            list(p3u.iter_json_values(bad[i:i + 2] for i in range(0, len(bad), 2)))
+    assert list(p3u.iter_json_values(["[ ", "]  "])) == []
+    # Test columnar batches fill missing keys with None
+    f.write_text('[{"a": 1}, {"b": 2}]')
+    assert list(p3u.load_records(f, columnar=True)) == \
+        [{"a": [1, None], "b": [None, 2]}]
+#endregion test_load_records_json() function
+# ---------------------------------------------------------------------------- +
+#region test_load_records_jsonc() function
+def test_load_records_jsonc(tmp_path: Path):
+    f = tmp_path / "data.jsonc"
+    f.write_text('// header comment\n[\n  {"url": "http://x//y", /* inline */ "n": 1},\n'
+                 '  /* multi\n     line */ {"s": "/* not a comment */"} // end\n]\n')
+    assert list(p3u.load_records(f)) == \
+        [[{"url": "http://x//y", "n": 1}, {"s": "/* not a comment */"}]]
+#endregion test_load_records_jsonc() function
+# ---------------------------------------------------------------------------- +
+#region test_load_jsonc() function
+def test_load_jsonc(tmp_path: Path):
+    import mmap
+    text = ('{\n  // settings\n  "paths": ["a/*b*/", "c//d",],  /* done, */\n'
+            '  "n": -1.5e3,\n  "s": "q\\"//",\n}\n')
+    expected = {"paths": ["a/*b*/", "c//d"], "n": -1.5e3, "s": 'q"//'}
+    # Test any chunking gives the same JSON text
+    for size in (1, 2, 3, 7, len(text)):
+        chunks = [text[i:i + size] for i in range(0, len(text), size)]
+        assert json.loads("".join(p3u.strip_jsonc_comments(chunks))) == expected
+    f = tmp_path / "settings.jsonc"
+    f.write_text(text)
+    assert p3u.load_jsonc(f) == expected
+    with open(f, "rb") as fb, mmap.mmap(fb.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        assert p3u.load_jsonc(mm) == expected
+    # Test errors
+    with pytest.raises(json.JSONDecodeError):
+        p3u.load_jsonc(b'{"a": 1,}', trailing_commas=False)
+    with pytest.raises(json.JSONDecodeError):
+        p3u.load_jsonc(b'{"a": 1} {"b": 2}')
+    with pytest.raises(json.JSONDecodeError):
+        p3u.load_jsonc(b"// nothing")
+    with pytest.raises(ValueError):
+        p3u.load_jsonc(b'{"a": 1} /* open')
+#endregion test_load_jsonc() function
+# ---------------------------------------------------------------------------- +
+#region test_load_records_txt_toml_xlsx() function
+def test_load_records_txt_toml_xlsx(tmp_path: Path):
+    f = tmp_path / "data.txt"
+    f.write_text("one\ntwo\r\n")
+    assert list(p3u.load_records(f)) == [[{"line": "one"}, {"line": "two"}]]
+    f = tmp_path / "data.toml"
+    f.write_text('[[rows]]\na = 1\n[[rows]]\na = 2\n')
+    assert list(p3u.load_records(f)) == [[{"a": 1}, {"a": 2}]]
+    f.write_text('title = "x"\n[owner]\nname = "p"\n')
+    assert list(p3u.load_records(f)) == [[{"title": "x", "owner": {"name": "p"}}]]
+    f = tmp_path / "data.xlsx"
+    wb = Workbook()
+    wb.active.append(["a", "b"])
+    for i in range(5):
+        wb.active.append([i, f"v{i}"])
+    wb.save(f)
+    assert list(p3u.load_records(f, batch_size=3, columnar=True)) == \
+        [{"a": [0, 1, 2], "b": ["v0", "v1", "v2"]}, {"a": [3, 4], "b": ["v3", "v4"]}]
+#endregion test_load_records_txt_toml_xlsx() function
+# ---------------------------------------------------------------------------- +
+#endregion Tests for load_records() function
+# ---------------------------------------------------------------------------- +
+#region Tests for ContentCache class
+# ---------------------------------------------------------------------------- +
+#region test_content_cache() function
+def test_content_cache(tmp_path: Path):
+    f = tmp_path / "data.json"
+    f.write_text(json.dumps({"a": [1, 2, 3]}))
+    cache = p3u.ContentCache()
+    first = cache.load(f)
+    assert first == {"a": [1, 2, 3]}
+    assert cache.load(str(f)) is first
+    assert cache.stats() | {"bytes": 0} == {"hits": 1, "disk_hits": 0,
+        "misses": 1, "evictions": 0, "entries": 1, "bytes": 0,
+        "max_bytes": p3u.CONTENT_CACHE_MAX_BYTES}
+    # Test a changed file is parsed again
+    f.write_text(json.dumps({"a": [1, 2, 3, 4]}))
+    assert cache.load(f) == {"a": [1, 2, 3, 4]}
+    assert cache.stats(reset=True)["misses"] == 2
+    # Test contents are cached per loader
+    assert cache.load(f, loader=lambda p: p.read_text()).startswith("{")
+    assert len(cache) == 2
+    # Test lambdas sharing a qualname and partials are told apart
+    upper, lower = (lambda p: p.read_text().upper()), (lambda p: p.read_text())
+    assert cache.load(f, upper) == cache.load(f, upper) == '{"A": [1, 2, 3, 4]}'
+    assert cache.load(f, lower) == '{"a": [1, 2, 3, 4]}'
+    assert cache.load(f, functools.partial(p3u.load_jsonc)) == {"a": [1, 2, 3, 4]}
+    assert cache.load(f, lower, loader_key="text") == '{"a": [1, 2, 3, 4]}'
+    assert cache.load(f, upper, loader_key="text") == '{"a": [1, 2, 3, 4]}'
+    with pytest.raises(TypeError):
+        cache.load(f, lower, loader_key=1)
+    cache.invalidate(f)
+    assert len(cache) == 0 and cache.stats()["bytes"] == 0
+    with pytest.raises(FileNotFoundError):
+        cache.load(tmp_path / "missing.json")
+    with pytest.raises(ValueError):
+        p3u.ContentCache(max_bytes=-1)
+#endregion test_content_cache() function
+# ---------------------------------------------------------------------------- +
+#region test_content_cache_eviction() function
+def test_content_cache_eviction(tmp_path: Path):
+    cache = p3u.ContentCache(max_bytes=250, sizeof=lambda value: 100)
+    files = []
+    for i in range(3):
+        files.append(tmp_path / f"f{i}.txt")
+        files[-1].write_text(f"text {i}")
+    cache.load(files[0])
+    cache.load(files[1])
+    cache.load(files[0])            # f0 is now the most recently used
+    cache.load(files[2])            # evicts f1
+    assert cache.stats()["evictions"] == 1
+    cache.load(files[0])
+    cache.load(files[1])
+    assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 4
+    assert p3u.ContentCache(max_bytes=0).load(files[0]) == "text 0"
+#endregion test_content_cache_eviction() function
+# ---------------------------------------------------------------------------- +
+#region test_content_cache_disk() function
+def test_content_cache_disk(tmp_path: Path):
+    f = tmp_path / "data.toml"
+    f.write_text('[[rows]]\na = 1\n')
+    disk = tmp_path / "cache"
+    assert p3u.ContentCache(disk_dir=disk).load(f) == {"rows": [{"a": 1}]}
+    assert len(list(disk.glob("*.pickle"))) == 1
+    # Test a second cache, as in another process, loads the pickle
+    other = p3u.ContentCache(disk_dir=disk)
+    assert other.load(f) == {"rows": [{"a": 1}]}
+    assert other.stats()["disk_hits"] == 1 and other.stats()["misses"] == 0
+    # Test a stale or corrupt pickle is a miss
+    f.write_text('[[rows]]\na = 2\n')
+    assert p3u.ContentCache(disk_dir=disk).load(f) == {"rows": [{"a": 2}]}
+    next(disk.glob("*.pickle")).write_bytes(b"not a pickle")
+    third = p3u.ContentCache(disk_dir=disk)
+    assert third.load(f) == {"rows": [{"a": 2}]}
+    assert third.stats()["misses"] == 1
+    # Test pickles are per loader_key, and loaders without one stay in memory
+    third.load(f, lambda p: p.read_text())
+    assert len(list(disk.glob("*.pickle"))) == 1
+    assert third.load(f, lambda p: p.read_text(), loader_key="text") == \
+        p3u.ContentCache(disk_dir=disk).load(f, str, loader_key="text")
+    assert len(list(disk.glob("*.pickle"))) == 2
+    assert p3u.load_cached(f) == {"rows": [{"a": 2}]}
+    assert p3u.content_cache_stats()["entries"] >= 1
+#endregion test_content_cache_disk() function
+# ---------------------------------------------------------------------------- +
+#endregion Tests for ContentCache class
+# ---------------------------------------------------------------------------- +